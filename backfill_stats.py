@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+일별 통계 집계 재생성 스크립트
+
+user_session / recommendation 테이블 전체를 다시 집계하여
+food_reco.stats_daily_rollup 테이블을 새로 채웁니다.
+집계 테이블을 처음 추가했을 때나 집계 값이 어긋났을 때 실행합니다.
+"""
+
+import time
+
+from src.database import db_manager, backfill_rollups, read_statistics
+
+def backfill_stats():
+    """일별 통계 집계를 다시 만듭니다."""
+    try:
+        print("데이터베이스 연결 테스트 중...")
+        if not db_manager.test_connection():
+            print("❌ 데이터베이스 연결에 실패했습니다.")
+            return False
+        
+        print("✅ 데이터베이스 연결 성공!")
+        print("통계 집계 재생성 중...")
+        
+        start = time.perf_counter()
+        row_count = backfill_rollups()
+        print(f"✅ 집계 행 {row_count}개 생성 완료 ({time.perf_counter() - start:.1f}초)")
+        
+        stats = read_statistics()
+        print(f"\n전체 세션 수: {stats['total_sessions']}")
+        print(f"전체 추천 수: {stats['total_recommendations']}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ 통계 집계 재생성 중 오류 발생: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🍽️  음식 추천 에이전트 - 통계 집계 재생성")
+    print("=" * 60)
+    
+    success = backfill_stats()
+    
+    if not success:
+        print("\n❌ 통계 집계 재생성에 실패했습니다.")
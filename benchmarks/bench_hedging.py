@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+요청 헤징 벤치마크
+
+네이버 API처럼 대부분은 빠르지만 일부 요청이 크게 느린 지연 시간 분포(로그정규 + 느린 꼬리)를
+asyncio.sleep으로 흉내 내어, 헤징 없이/헤징 적용 시 호출 지연 시간 분포(p50/p90/p99)와
+실제 헤지 요청 비율을 비교합니다. 네트워크 호출은 하지 않습니다.
+
+사용 예시:
+    python benchmarks/bench_hedging.py
+    python benchmarks/bench_hedging.py --requests 5000 --slow-ratio 0.05 --max-percent 5 10
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.utils.hedging import HedgePolicy  # noqa: E402
+
+
+def make_latency(rng, median, slow_ratio, slow_factor):
+    """요청 하나의 지연 시간(초)을 뽑는 함수를 만듭니다."""
+    def latency():
+        value = rng.lognormvariate(0, 0.3) * median
+        if rng.random() < slow_ratio:
+            value *= slow_factor
+        return value
+    return latency
+
+
+async def run(policy, requests, concurrency, latency):
+    """동시에 concurrency개씩 요청을 보내며 policy로 헤징합니다."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def attempt():
+        await asyncio.sleep(latency())
+        return True
+
+    async def one():
+        async with semaphore:
+            await policy.run(attempt)
+
+    await asyncio.gather(*(one() for _ in range(requests)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="요청 헤징 벤치마크")
+    parser.add_argument("--requests", type=int, default=3000, help="요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--median-ms", type=float, default=60, help="일반 요청의 지연 시간 중앙값 (ms)")
+    parser.add_argument("--slow-ratio", type=float, default=0.03, help="느린 요청 비율")
+    parser.add_argument("--slow-factor", type=float, default=15, help="느린 요청의 지연 배수")
+    parser.add_argument("--max-percent", type=float, nargs="+", default=[0, 5, 10], help="헤지 비율 상한 목록 (%%)")
+    args = parser.parse_args()
+
+    print(f"{'max hedge %':>11} {'hedges %':>9} {'wins':>6} {'delay (ms)':>11} "
+          f"{'p50 (ms)':>9} {'p90 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}")
+    for percent in args.max_percent:
+        rng = random.Random(42)
+        latency = make_latency(rng, args.median_ms / 1000, args.slow_ratio, args.slow_factor)
+        policy = HedgePolicy("bench", max_hedge_ratio=percent / 100)
+        asyncio.run(run(policy, args.requests, args.concurrency, latency))
+        stats = policy.stats()
+        call = stats["call_latency"]
+        print(f"{percent:>11g} {stats['hedge_ratio'] * 100:>9.1f} {stats['hedge_wins']:>6} "
+              f"{stats['delay_ms']:>11.0f} {call['p50_ms']:>9.0f} {call['p90_ms']:>9.0f} "
+              f"{call['p99_ms']:>9.0f} {call['max_ms']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+로컬 검색 색인 벤치마크
+
+검색 결과와 비슷한 합성 문서(기본 1만/10만 건, Zipf 분포 어휘)로 색인을 만들어
+생성 시간, 파일 크기, 로딩 시간, 질의당 검색 지연 시간(중앙값/p95, μs)을 측정합니다.
+질의는 어휘에서 가장 흔한 단어(WORDS)로만 만들므로 포스팅이 가장 긴 최악의 경우에 가깝습니다.
+
+사용 예시:
+    python benchmarks/bench_local_index.py
+    python benchmarks/bench_local_index.py --documents 10000 100000 500000 --path /tmp/local_index.bin
+"""
+
+import argparse
+import itertools
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.services.local_index import LocalIndex  # noqa: E402
+
+WORDS = [
+    "한식", "중식", "일식", "양식", "분식", "조용한", "아늑한", "시끌벅적한", "인스타감성", "전통적인",
+    "데이트", "가족식사", "친구모임", "회식", "혼밥", "주차", "가능", "반려동물", "채식", "메뉴",
+    "강남역", "홍대", "성수", "을지로", "해운대", "서면", "맛집", "추천", "분위기", "가성비",
+    "삼겹살", "파스타", "초밥", "짬뽕", "떡볶이", "냉면", "곰탕", "라멘", "브런치", "후기",
+]
+QUERIES = [
+    "강남역 한식 조용한 데이트",
+    "홍대 파스타 친구모임",
+    "해운대 초밥 가족식사 주차",
+    "성수 브런치 인스타감성",
+    "을지로 냉면 혼밥",
+]
+
+
+def make_vocabulary(rng, size=5000):
+    """
+    자주 쓰는 단어(WORDS) 뒤에 임의의 2~3음절 단어를 붙인 어휘와 Zipf 분포 누적 가중치를 만듭니다.
+    (실제 검색 결과처럼 일부 단어는 대부분의 문서에, 나머지는 소수의 문서에만 나타나도록)
+    """
+    vocabulary = list(WORDS)
+    while len(vocabulary) < size:
+        vocabulary.append("".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(2, 3))))
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+    return vocabulary, cum_weights
+
+
+def make_documents(count, rng):
+    """네이버 검색 결과와 비슷한 길이의 문서를 생성합니다."""
+    vocabulary, cum_weights = make_vocabulary(rng)
+    for i in range(count):
+        yield {
+            "title": " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=4)) + f" {i}",
+            "description": " ".join(rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(15, 40))),
+            "link": f"https://blog.example.com/{i}",
+            "source": "naver",
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 검색 색인 벤치마크")
+    parser.add_argument("--documents", type=int, nargs="+", default=[10_000, 100_000], help="문서 수 목록")
+    parser.add_argument("--path", default="/tmp/food_reco_local_index.bin", help="색인 파일 경로")
+    parser.add_argument("--repeat", type=int, default=200, help="질의별 반복 횟수")
+    parser.add_argument("--top-k", type=int, default=20, help="반환할 결과 수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'documents':>10} {'build (s)':>10} {'size (MB)':>10} {'load (ms)':>10} "
+          f"{'median (us)':>12} {'p95 (us)':>10}")
+    for count in args.documents:
+        start = time.perf_counter()
+        size = LocalIndex.write(args.path, make_documents(count, rng))
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = LocalIndex.load(args.path)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        for query in QUERIES:  # 워밍업 (페이지 캐시 적재)
+            index.search(query, args.top_k)
+        samples = []
+        for _ in range(args.repeat):
+            for query in QUERIES:
+                start = time.perf_counter()
+                index.search(query, args.top_k)
+                samples.append((time.perf_counter() - start) * 1e6)
+        samples.sort()
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        print(f"{count:>10,} {build_seconds:>10.2f} {size / 1024 / 1024:>10.1f} {load_ms:>10.2f} "
+              f"{statistics.median(samples):>12.0f} {p95:>10.0f}")
+
+    os.remove(args.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+검색 결과 재정렬(BM25) 마이크로 벤치마크
+
+후보 수(기본 50~500개)별로 BM25Reranker의 점수 계산 시간과
+상위 k개만 남겼을 때의 프롬프트 길이 감소를 측정합니다.
+
+사용 예시:
+    python benchmarks/bench_reranker.py
+    python benchmarks/bench_reranker.py --candidates 50 100 200 500 1000 --top-k 10
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.services.reranker import BM25Reranker  # noqa: E402
+
+WORDS = [
+    "한식", "중식", "일식", "양식", "분식", "조용한", "아늑한", "시끌벅적한", "인스타감성", "전통적인",
+    "데이트", "가족식사", "친구모임", "회식", "혼밥", "주차", "가능", "반려동물", "채식", "메뉴",
+    "강남역", "맛집", "추천", "분위기", "가성비", "코스요리", "웨이팅", "예약", "룸", "테라스",
+    "삼겹살", "파스타", "초밥", "짬뽕", "떡볶이", "와인", "디저트", "브런치", "후기", "방문",
+]
+QUERY = "한식 조용한 데이트 주차 가능"
+
+
+def make_documents(count, rng):
+    """네이버 검색 결과와 비슷한 길이(제목 + 설명 최대 300자)의 문서를 생성합니다."""
+    documents = []
+    for i in range(count):
+        title = " ".join(rng.choices(WORDS, k=5))
+        description = " ".join(rng.choices(WORDS, k=rng.randint(30, 70)))[:300]
+        documents.append(f"{title} {i} {description}")
+    return documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BM25 재정렬 벤치마크")
+    parser.add_argument("--candidates", type=int, nargs="+", default=[50, 100, 200, 500], help="후보 수 목록")
+    parser.add_argument("--top-k", type=int, default=10, help="프롬프트에 남길 결과 수")
+    parser.add_argument("--repeat", type=int, default=50, help="후보 수별 반복 횟수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    reranker = BM25Reranker()
+    reranker.rerank(QUERY, make_documents(10, rng), args.top_k)  # 워밍업
+
+    print(f"질의: {QUERY!r}, top-k={args.top_k}, 반복 {args.repeat}회")
+    print("-" * 72)
+    print(f"{'candidates':>10} {'median (ms)':>12} {'p95 (ms)':>10} {'prompt chars':>14} {'after top-k':>12}")
+    for count in args.candidates:
+        documents = make_documents(count, rng)
+        samples = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            ranked = reranker.rerank(QUERY, documents, args.top_k)
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        print(f"{count:>10} {statistics.median(samples):>12.2f} {p95:>10.2f} "
+              f"{sum(map(len, documents)):>14,} {sum(map(len, ranked)):>12,}")
+
+
+if __name__ == "__main__":
+    main()
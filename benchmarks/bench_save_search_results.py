@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+검색 결과 저장 마이크로 벤치마크
+
+행마다 flush하던 기존 구현과 다중 행 INSERT ... RETURNING 구현의
+초당 저장 행 수(rows/sec)를 비교합니다.
+
+사용 예시:
+    # 로컬 SQLite 메모리 DB (기본값)
+    python benchmarks/bench_save_search_results.py
+
+    # PostgreSQL (별도 스키마에 임시 테이블을 만들어 측정 후 삭제)
+    python benchmarks/bench_save_search_results.py --url postgresql+psycopg2://user:pw@host:5432/db
+"""
+
+import argparse
+import datetime
+import os
+import sys
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.database.models import Base, SearchResult, UserSession  # noqa: E402
+from src.database.storage_service import StorageService  # noqa: E402
+
+BENCH_SCHEMA = "food_reco_bench"
+
+
+def legacy_save_search_results(session, session_id, search_results, source="naver", cuisine_preference=""):
+    """기존 구현: 한 행씩 add 후 flush (행마다 INSERT 왕복 1회)"""
+    result_ids = []
+    for result in search_results:
+        search_result = SearchResult(
+            session_id=session_id,
+            title=result.get('title', ''),
+            description=result.get('description', ''),
+            link=result.get('link', ''),
+            source=source,
+            cuisine_preference=cuisine_preference,
+            created_at=datetime.datetime.now()
+        )
+        session.add(search_result)
+        session.flush()
+        result_ids.append(search_result.id)
+    return result_ids
+
+
+def bulk_save_search_results(session, session_id, search_results, source="naver", cuisine_preference=""):
+    """현재 구현: StorageService.save_search_results (다중 행 INSERT ... RETURNING)"""
+    return StorageService(session).save_search_results(session_id, search_results, source, cuisine_preference)
+
+
+def make_results(display):
+    """네이버 응답과 비슷한 크기의 검색 결과를 생성합니다."""
+    return [
+        {
+            "title": f"강남 한식 맛집 {i}",
+            "description": "조용한 분위기의 한정식 전문점, 데이트와 가족식사에 적합 " * 5,
+            "link": f"https://blog.example.com/post/{i}",
+        }
+        for i in range(display)
+    ]
+
+
+def seed_sessions(engine, rounds):
+    """search_result.session_id 외래 키를 만족하도록 세션 1..rounds를 미리 저장합니다."""
+    SessionLocal = sessionmaker(bind=engine)
+    with SessionLocal() as session:
+        session.add_all([UserSession(id=session_id) for session_id in range(1, rounds + 1)])
+        session.commit()
+
+
+def run(engine, func, rounds, display):
+    """func로 rounds번 저장하고 초당 행 수를 반환합니다."""
+    SessionLocal = sessionmaker(bind=engine)
+    results = make_results(display)
+
+    start = time.perf_counter()
+    for session_id in range(1, rounds + 1):
+        with SessionLocal() as session:
+            ids = func(session, session_id, results, "naver", "한식")
+            assert len(ids) == display
+            session.commit()
+    elapsed = time.perf_counter() - start
+    return rounds * display / elapsed, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 결과 저장 벤치마크")
+    parser.add_argument("--url", default=os.getenv("BENCH_DATABASE_URL", "sqlite://"), help="SQLAlchemy DB URL")
+    parser.add_argument("--rounds", type=int, default=200, help="저장 반복 횟수 (요청 수)")
+    parser.add_argument("--display", type=int, default=50, help="요청당 검색 결과 수")
+    args = parser.parse_args()
+
+    is_sqlite = args.url.startswith("sqlite")
+    # 운영 스키마(food_reco)를 건드리지 않도록 벤치마크 전용 스키마로 매핑
+    engine = create_engine(args.url).execution_options(
+        schema_translate_map={"food_reco": None if is_sqlite else BENCH_SCHEMA}
+    )
+
+    if not is_sqlite:
+        with engine.begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {BENCH_SCHEMA}"))
+
+    tables = [UserSession.__table__, SearchResult.__table__]
+    try:
+        print(f"DB: {engine.url.render_as_string(hide_password=True)}, 요청 {args.rounds}회 x 결과 {args.display}건")
+        print("-" * 60)
+        for name, func in [("legacy (row-by-row flush)", legacy_save_search_results),
+                           ("bulk (INSERT ... RETURNING)", bulk_save_search_results)]:
+            Base.metadata.drop_all(bind=engine, tables=tables)
+            Base.metadata.create_all(bind=engine, tables=tables)
+            seed_sessions(engine, args.rounds)
+            rows_per_sec, elapsed = run(engine, func, args.rounds, args.display)
+            print(f"{name:<30} {rows_per_sec:>12,.0f} rows/sec  ({elapsed:.2f}s)")
+    finally:
+        Base.metadata.drop_all(bind=engine, tables=tables)
+        if not is_sqlite:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+통계/최근 활동 쿼리 인덱스 벤치마크
+
+세션 100만 건(기본값)을 시드한 벤치마크 전용 스키마에서
+get_user_statistics / get_recent_activity 와 session_id 조회 쿼리를
+인덱스 없이 한 번, 인덱스를 만든 뒤 한 번 실행해 중앙값 지연 시간(ms)을 비교합니다.
+
+사용 예시:
+    # PostgreSQL (food_reco_bench 스키마를 만들어 측정 후 삭제)
+    python benchmarks/bench_statistics_queries.py --url postgresql+psycopg2://user:pw@host:5432/db
+
+    # 로컬 SQLite 파일 DB (PostgreSQL이 없을 때 대략적인 비교용)
+    python benchmarks/bench_statistics_queries.py --url sqlite:////tmp/food_reco_bench.db --sessions 200000
+"""
+
+import argparse
+import datetime
+import os
+import random
+import statistics
+import sys
+import time
+
+from sqlalchemy import create_engine, func, insert, select, text
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.database.models import Base, Recommendation, SearchResult, UserSession  # noqa: E402
+
+BENCH_SCHEMA = "food_reco_bench"
+
+CUISINES = ["한식", "중식", "일식", "양식", "분식", "아시안", "카페", "기타"]
+LOCATIONS = [
+    "강남구", "서초구", "송파구", "마포구", "용산구", "종로구", "중구", "성동구", "광진구", "영등포구",
+    "강서구", "관악구", "동작구", "노원구", "은평구", "서대문구", "성북구", "강동구", "양천구", "구로구",
+]
+TABLES = [UserSession.__table__, SearchResult.__table__, Recommendation.__table__]
+
+
+def seed_postgres(conn, sessions, results):
+    """generate_series로 서버에서 직접 시드합니다 (인기 항목이 몰리도록 random()^2 분포 사용)."""
+    conn.execute(text(f"""
+        INSERT INTO {BENCH_SCHEMA}.user_session
+            (age, cuisine_preference, weather, location, companion_type, ambiance, created_at)
+        SELECT 18 + (g % 50),
+               (:cuisines)[1 + floor(power(random(), 2) * :cuisine_count)::int],
+               '맑음',
+               (:locations)[1 + floor(power(random(), 2) * :location_count)::int],
+               '친구',
+               '조용한',
+               now() - make_interval(secs => g)
+        FROM generate_series(1, :sessions) AS g
+    """), {"cuisines": CUISINES, "cuisine_count": len(CUISINES),
+           "locations": LOCATIONS, "location_count": len(LOCATIONS), "sessions": sessions})
+    conn.execute(text(f"""
+        INSERT INTO {BENCH_SCHEMA}.search_result
+            (session_id, title, description, link, source, cuisine_preference, created_at)
+        SELECT 1 + (g % :sessions), '맛집 ' || g, '설명', 'https://blog.example.com/' || g, 'naver', '한식',
+               now() - make_interval(secs => g)
+        FROM generate_series(1, :results) AS g
+    """), {"sessions": sessions, "results": results})
+
+
+def seed_generic(conn, sessions, results, chunk=50_000):
+    """generate_series가 없는 DB(SQLite)용: 파이썬에서 만든 행을 청크 단위로 저장합니다."""
+    rng = random.Random(42)
+    now = datetime.datetime.now()
+    for start in range(1, sessions + 1, chunk):
+        conn.execute(insert(UserSession.__table__), [
+            {
+                "id": g,
+                "age": 18 + g % 50,
+                "cuisine_preference": CUISINES[int(rng.random() ** 2 * len(CUISINES))],
+                "weather": "맑음",
+                "location": LOCATIONS[int(rng.random() ** 2 * len(LOCATIONS))],
+                "companion_type": "친구",
+                "ambiance": "조용한",
+                "created_at": now - datetime.timedelta(seconds=g),
+            }
+            for g in range(start, min(start + chunk, sessions + 1))
+        ])
+    for start in range(1, results + 1, chunk):
+        conn.execute(insert(SearchResult.__table__), [
+            {
+                "session_id": 1 + g % sessions,
+                "title": f"맛집 {g}",
+                "description": "설명",
+                "link": f"https://blog.example.com/{g}",
+                "source": "naver",
+                "cuisine_preference": "한식",
+                "created_at": now - datetime.timedelta(seconds=g),
+            }
+            for g in range(start, min(start + chunk, results + 1))
+        ])
+
+
+def build_queries(sessions):
+    """측정할 쿼리 목록 (queries.get_user_statistics / get_recent_activity와 같은 형태)"""
+    count = func.count(UserSession.id)
+    return [
+        ("total_sessions", select(count)),
+        ("avg_age", select(func.avg(UserSession.age))),
+        ("popular_cuisine", select(UserSession.cuisine_preference, count)
+            .group_by(UserSession.cuisine_preference).order_by(count.desc()).limit(1)),
+        ("popular_location", select(UserSession.location, count)
+            .group_by(UserSession.location).order_by(count.desc()).limit(1)),
+        ("cuisine_by_location", select(UserSession.cuisine_preference, count)
+            .where(UserSession.location == LOCATIONS[3])
+            .group_by(UserSession.cuisine_preference)),
+        ("recent_sessions", select(UserSession).order_by(UserSession.created_at.desc()).limit(10)),
+        ("recent_searches", select(SearchResult).order_by(SearchResult.created_at.desc()).limit(10)),
+        ("results_by_session", select(SearchResult).where(SearchResult.session_id == sessions // 2)),
+    ]
+
+
+def measure(engine, queries, repeat):
+    """쿼리별로 repeat번 실행한 지연 시간의 중앙값(ms)을 반환합니다."""
+    timings = {}
+    with engine.connect() as conn:
+        for name, query in queries:
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                conn.execute(query).all()
+                samples.append((time.perf_counter() - start) * 1000)
+            timings[name] = statistics.median(samples)
+    return timings
+
+
+def analyze(engine, is_sqlite):
+    """플래너 통계를 갱신합니다."""
+    with engine.begin() as conn:
+        if is_sqlite:
+            conn.execute(text("ANALYZE"))
+        else:
+            for table in TABLES:
+                conn.execute(text(f"ANALYZE {BENCH_SCHEMA}.{table.name}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통계 쿼리 인덱스 벤치마크")
+    parser.add_argument("--url", default=os.getenv("BENCH_DATABASE_URL", "sqlite:////tmp/food_reco_bench.db"),
+                        help="SQLAlchemy DB URL")
+    parser.add_argument("--sessions", type=int, default=1_000_000, help="시드할 세션 수")
+    parser.add_argument("--results", type=int, default=200_000, help="시드할 검색 결과 수")
+    parser.add_argument("--repeat", type=int, default=5, help="쿼리별 반복 횟수")
+    args = parser.parse_args()
+
+    is_sqlite = args.url.startswith("sqlite")
+    # 운영 스키마(food_reco)를 건드리지 않도록 벤치마크 전용 스키마로 매핑
+    engine = create_engine(args.url).execution_options(
+        schema_translate_map={"food_reco": None if is_sqlite else BENCH_SCHEMA}
+    )
+    indexes = [index for table in TABLES for index in table.indexes]
+
+    if not is_sqlite:
+        with engine.begin() as conn:
+            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {BENCH_SCHEMA}"))
+
+    try:
+        print(f"DB: {engine.url.render_as_string(hide_password=True)}, "
+              f"세션 {args.sessions:,}건 / 검색 결과 {args.results:,}건")
+        Base.metadata.drop_all(bind=engine, tables=TABLES)
+        Base.metadata.create_all(bind=engine, tables=TABLES)
+
+        # 인덱스 없이 시드 (시드 속도도 빨라짐)
+        for index in indexes:
+            index.drop(bind=engine)
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            if is_sqlite:
+                seed_generic(conn, args.sessions, args.results)
+            else:
+                seed_postgres(conn, args.sessions, args.results)
+        print(f"시드 완료 ({time.perf_counter() - start:.1f}s)")
+        analyze(engine, is_sqlite)
+
+        queries = build_queries(args.sessions)
+        before = measure(engine, queries, args.repeat)
+
+        start = time.perf_counter()
+        for index in indexes:
+            index.create(bind=engine)
+        analyze(engine, is_sqlite)
+        print(f"인덱스 {len(indexes)}개 생성 ({time.perf_counter() - start:.1f}s)")
+        after = measure(engine, queries, args.repeat)
+
+        print("-" * 64)
+        print(f"{'query':<22} {'no index (ms)':>14} {'indexed (ms)':>14} {'speedup':>9}")
+        for name, _ in queries:
+            speedup = before[name] / after[name] if after[name] else float("inf")
+            print(f"{name:<22} {before[name]:>14.2f} {after[name]:>14.2f} {speedup:>8.1f}x")
+    finally:
+        Base.metadata.drop_all(bind=engine, tables=TABLES)
+        if not is_sqlite:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCH_SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+로컬 검색 색인 생성 스크립트
+
+restaurant_data(백업 데이터)와 DB에 저장된 검색 결과로
+LOCAL_INDEX_PATH(기본값: data/local_index.bin)에 로컬 검색 색인 파일을 만듭니다.
+DB에 연결할 수 없으면 백업 데이터만으로 색인을 만듭니다.
+색인을 새로 만든 뒤에는 서버를 재시작해야 새 색인이 사용됩니다.
+"""
+
+import time
+
+from src.database import db_manager
+from src.services.local_index import LOCAL_INDEX_PATH, build_local_index
+
+def build_index():
+    """로컬 검색 색인을 생성합니다."""
+    try:
+        print("데이터베이스 연결 테스트 중...")
+        include_search_results = db_manager.test_connection()
+        if include_search_results:
+            print("✅ 데이터베이스 연결 성공! 저장된 검색 결과를 함께 색인합니다.")
+        else:
+            print("⚠️ 데이터베이스 연결에 실패했습니다. 백업 데이터만 색인합니다.")
+
+        print(f"색인 생성 중... ({LOCAL_INDEX_PATH})")
+
+        start = time.perf_counter()
+        index = build_local_index(LOCAL_INDEX_PATH, include_search_results=include_search_results)
+        stats = index.stats()
+        print(f"✅ 색인 생성 완료 ({time.perf_counter() - start:.1f}초)")
+        print(f"\n문서 수: {stats['documents']}")
+        print(f"용어 수: {stats['terms']}")
+        print(f"파일 크기: {stats['size_bytes'] / 1024:.1f} KB")
+
+        return True
+
+    except Exception as e:
+        print(f"❌ 색인 생성 중 오류 발생: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("🍽️  음식 추천 에이전트 - 로컬 검색 색인 생성")
+    print("=" * 60)
+
+    success = build_index()
+
+    if not success:
+        print("\n❌ 로컬 검색 색인 생성에 실패했습니다.")
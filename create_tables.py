@@ -5,7 +5,7 @@
 이 스크립트는 새로운 데이터베이스 모델에 대한 테이블을 생성합니다.
 """
 
-from src.database import Base, db_manager
+from src.database import Base, db_manager, run_migrations, get_current_version
 
 def create_tables():
     """데이터베이스 테이블을 생성합니다."""
@@ -22,10 +22,18 @@ def create_tables():
         Base.metadata.create_all(bind=db_manager.engine)
         
         print("✅ 모든 테이블이 성공적으로 생성되었습니다!")
+        
+        # 기존 테이블에 인덱스/외래 키/기본값 반영
+        print("마이그레이션 적용 중...")
+        applied = run_migrations()
+        if applied:
+            print(f"✅ 마이그레이션 적용 완료: {applied}")
+        print(f"현재 스키마 버전: {get_current_version()}")
         print("\n생성된 테이블:")
         print("- food_reco.user_session (사용자 세션 정보)")
         print("- food_reco.search_result (검색 결과)")
         print("- food_reco.recommendation (추천 결과)")
+        print("- food_reco.stats_daily_rollup (일별 통계 집계, 기존 데이터는 'python backfill_stats.py'로 채움)")
         
         return True
         
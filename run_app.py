@@ -5,7 +5,7 @@ Food Recommendation Agent 실행 스크립트
 이 스크립트는 음식 추천 에이전트를 실행하는 메인 엔트리 포인트입니다.
 """
 
-from src.core import workflow_app
+from src.core import run_workflow
 
 def main():
     """메인 실행 함수"""
@@ -30,7 +30,7 @@ def main():
     
     try:
         # LangGraph 실행
-        final_results = workflow_app.invoke(initial_state)
+        final_results = run_workflow(initial_state)
         
         print("\n" + "="*60)
         print("🍽️  맛집 추천 결과")
@@ -5,21 +5,84 @@ FastAPI 메인 애플리케이션
 """
 
 # FastAPI 관련
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Header, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 
 # 데이터 검증 및 모델링
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional
 
 # 서버 실행
+import asyncio
+import os
 import uvicorn
+from contextlib import asynccontextmanager
 from datetime import datetime
 
+# 응답 직렬화/ETag
+import orjson
+import xxhash
+
 # 로컬 모듈
-from ..core import workflow_app  # LangGraph 워크플로우
+from ..core import arun_workflow, astream_workflow  # LangGraph 워크플로우
+from ..core import track_run, cancellation_stats
 from ..database import save_user_session, save_search_results, save_recommendation
+from ..database import WriteBehindWriter, install_write_behind, write_behind_enabled, get_pool_stats, db_limiter
+from ..database import get_session_detail, read_statistics, stats_rollup
+from ..database import get_sessions_page, iter_sessions, decode_cursor
+from ..services.llm_client import llm_registry, llm_flight, llm_limiter, chunk_text
+from ..services.naver_search import search_cache, search_flight, naver_client, naver_limiter, naver_breaker
+from ..services.naver_search import naver_rate_limiter, naver_hedge
+from ..services.local_index import get_local_index
+from ..utils.executor import run_blocking, shutdown_executor
+from ..utils.cache import TTLCache
+from ..utils.metrics import metrics_registry
+
+# 완료된 세션 상세 응답 캐시 (session_id -> (직렬화된 본문, ETag))
+# 추천까지 저장된 세션은 더 이상 바뀌지 않으므로 오래 보관해도 안전
+session_detail_cache = TTLCache(
+    max_entries=int(os.getenv("SESSION_DETAIL_CACHE_MAX_ENTRIES", "2048")),
+    max_bytes=int(os.getenv("SESSION_DETAIL_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    ttl=float(os.getenv("SESSION_DETAIL_CACHE_TTL_SECONDS", "3600")),
+)
+
+# /stats 응답 캐시 (집계 테이블 조회도 짧은 시간 동안 재사용)
+stats_cache = TTLCache(max_entries=64, ttl=float(os.getenv("STATS_CACHE_TTL_SECONDS", "5")))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작/종료 시 공유 리소스를 준비하고 정리합니다."""
+    # 첫 요청이 클라이언트 생성 비용을 지불하지 않도록 LLM 클라이언트를 미리 생성
+    llm_registry.warmup()
+
+    # 분석용 저장을 응답 경로에서 분리 (DB_WRITE_BEHIND=true)
+    write_behind = None
+    if write_behind_enabled():
+        write_behind = WriteBehindWriter.from_env()
+        write_behind.start()
+        install_write_behind(write_behind)
+        app.state.write_behind = write_behind
+
+    # 일별 통계 증분을 주기적으로 집계 테이블에 반영
+    stats_rollup.start()
+
+    # 네이버 검색 실패 시 사용할 로컬 검색 색인을 미리 열어 둠 (memmap이므로 즉시 완료)
+    get_local_index()
+
+    yield
+
+    # 큐에 남은 저장 요청을 모두 저장한 뒤 종료
+    if write_behind is not None:
+        install_write_behind(None)
+        write_behind.shutdown()
+    # 남은 통계 증분 반영
+    stats_rollup.shutdown()
+    # 네이버 HTTP 커넥션 풀 정리
+    await naver_client.aclose()
+    naver_client.close()
+    # 블로킹 작업용 스레드 풀 정리
+    shutdown_executor(wait=True)
 
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
@@ -27,7 +90,8 @@ app = FastAPI(
     description="사용자 선호도 기반 개인화된 맛집 추천 서비스",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -57,6 +121,45 @@ class RecommendationResponse(BaseModel):
     search_results: List[Dict[str, str]]
     user_profile: Dict[str, Any]
     created_at: datetime
+    degraded: List[str] = []  # 마감 시각 때문에 축소한 작업 (예: "fast_model", "llm_timeout")
+
+class StoredSearchResult(BaseModel):
+    """저장된 검색 결과 모델"""
+    title: str
+    description: str
+    link: str
+    source: str
+
+class StoredRecommendation(BaseModel):
+    """저장된 추천 결과 모델"""
+    recommendation_text: str
+    ai_model: str
+    created_at: Optional[datetime]
+
+class SessionDetailResponse(BaseModel):
+    """세션별 추천 결과 조회 응답 모델"""
+    session_id: int
+    user_profile: Dict[str, Any]
+    search_results: List[StoredSearchResult]
+    recommendations: List[StoredRecommendation]
+    created_at: Optional[datetime]
+
+class SessionSummary(BaseModel):
+    """세션 목록 항목 모델"""
+    session_id: int
+    age: Optional[int]
+    cuisine_preference: Optional[str]
+    weather: Optional[str]
+    location: Optional[str]
+    companion_type: Optional[str]
+    ambiance: Optional[str]
+    special_requirements: Optional[str]
+    created_at: datetime
+
+class SessionPageResponse(BaseModel):
+    """세션 목록 페이지 응답 모델"""
+    items: List[SessionSummary]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회 시 after에 넘길 값 (마지막 페이지면 null)")
 
 class HealthResponse(BaseModel):
     """헬스 체크 응답 모델"""
@@ -106,85 +209,444 @@ async def health_check():
         version="1.0.0"
     )
 
+def _initial_state(user_input: UserInput) -> Dict[str, Any]:
+    """사용자 입력으로 워크플로우 초기 상태를 만듭니다."""
+    return {
+        "age": user_input.age,
+        "cuisine_preference": user_input.cuisine_preference,
+        "weather": user_input.weather,
+        "location": user_input.location,
+        "companion_type": user_input.companion_type,
+        "ambiance": user_input.ambiance,
+        "special_requirements": user_input.special_requirements or "",
+        "search_results": [],
+        "recommendations": [],
+        "error": "",
+        "user_profile": {},
+        "session_id": 0
+    }
+
+def _recommendation_texts(final_results: Dict[str, Any]) -> List[str]:
+    """최종 상태의 추천 결과(Gemini 응답 객체 또는 문자열)를 문자열 목록으로 변환합니다."""
+    recommendations = []
+    for recommendation in final_results.get('recommendations') or []:
+        if hasattr(recommendation, 'content'):
+            recommendations.append(chunk_text(recommendation))
+        else:
+            recommendations.append(str(recommendation))
+    return recommendations
+
+def _recommendation_response(final_results: Dict[str, Any]) -> RecommendationResponse:
+    """워크플로우 최종 상태로 추천 응답을 만듭니다."""
+    return RecommendationResponse(
+        session_id=final_results.get('session_id', 0),
+        recommendations=_recommendation_texts(final_results),
+        search_results=final_results.get('search_results', []),
+        user_profile=final_results.get('user_profile', {}),
+        created_at=datetime.now(),
+        degraded=final_results.get('degraded') or []
+    )
+
+class ClientDisconnected(Exception):
+    """클라이언트 연결이 끊겨 실행을 취소했을 때 발생하는 오류"""
+    pass
+
+# 연결 끊김으로 취소된 요청의 응답 상태 코드 (받을 클라이언트가 없으므로 nginx 관례를 따름)
+CLIENT_CLOSED_REQUEST = 499
+
+async def _wait_for_disconnect(request: Request) -> None:
+    """클라이언트 연결이 끊길 때까지 기다립니다 (요청 본문을 모두 읽은 뒤에 호출)."""
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+async def _run_until_disconnect(request: Request, run: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    run()을 별도 태스크로 실행하고, 끝나기 전에 클라이언트 연결이 끊기면 취소합니다.
+    취소하면 진행 중인 네이버/Gemini 호출이 중단되고 이후 노드의 저장은 실행되지 않습니다.
+
+    Args:
+        request (Request): 요청 객체
+        run (Callable[[], Awaitable[Any]]): 실행할 코루틴 함수
+
+    Returns:
+        Any: run()의 결과
+
+    Raises:
+        ClientDisconnected: 클라이언트 연결이 끊겨 취소한 경우
+    """
+    with track_run() as tracker:
+        work = asyncio.ensure_future(run())
+    disconnect = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        await asyncio.wait({work, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+        if not work.done():
+            raise ClientDisconnected()
+        return work.result()
+    finally:
+        disconnect.cancel()
+        if not work.done():
+            work.cancel()
+            cancellation_stats.record(tracker)
+            # 취소 처리(트랜잭션 롤백 등)가 끝날 때까지 대기
+            await asyncio.wait({work})
+
+async def _stream_until_disconnect(request: Request,
+                                   stream: Callable[[], AsyncIterator[Any]]) -> AsyncIterator[Any]:
+    """
+    stream()의 항목을 별도 태스크에서 받아 전달하고, 끝나기 전에 클라이언트 연결이 끊기면 태스크를 취소합니다.
+    (스트림 안의 ContextVar(UnitOfWork 등)가 올바르게 동작하도록 스트림 전체를 한 태스크에서 실행)
+
+    Args:
+        request (Request): 요청 객체
+        stream (Callable[[], AsyncIterator[Any]]): 스트림을 만드는 함수
+
+    Yields:
+        Any: 스트림 항목 (연결이 끊기면 더 전달하지 않고 종료)
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    end = object()
+
+    async def produce() -> None:
+        async for item in stream():
+            queue.put_nowait(item)
+        queue.put_nowait(end)
+
+    with track_run() as tracker:
+        producer = asyncio.ensure_future(produce())
+    disconnect = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, producer, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                if disconnect.done():
+                    return
+                # 스트림이 항목 없이 예외로 끝난 경우
+                producer.result()
+                continue
+            item = getter.result()
+            if item is end:
+                return
+            yield item
+    finally:
+        disconnect.cancel()
+        if not producer.done():
+            producer.cancel()
+            cancellation_stats.record(tracker)
+            await asyncio.wait({producer})
+
+def _sse(event: str, data: Any) -> bytes:
+    """Server-Sent Events 메시지 하나를 만듭니다."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
 @app.post("/recommend", response_model=RecommendationResponse)
-async def get_recommendations(user_input: UserInput):
+async def get_recommendations(user_input: UserInput, request: Request):
     """
     사용자 입력을 바탕으로 맛집을 추천합니다.
     
+    클라이언트 연결이 끊기면 진행 중인 워크플로우를 취소합니다 (네이버/Gemini 호출 중단, 이후 저장 생략).
+    
     Args:
         user_input: 사용자 입력 데이터
+        request: 요청 객체 (연결 끊김 감지용)
         
     Returns:
         RecommendationResponse: 추천 결과
     """
     try:
-        # 초기 상태 설정
-        initial_state = {
-            "age": user_input.age,
-            "cuisine_preference": user_input.cuisine_preference,
-            "weather": user_input.weather,
-            "location": user_input.location,
-            "companion_type": user_input.companion_type,
-            "ambiance": user_input.ambiance,
-            "special_requirements": user_input.special_requirements or "",
-            "search_results": [],
-            "recommendations": [],
-            "error": "",
-            "user_profile": {},
-            "session_id": 0
-        }
+        # LangGraph 워크플로우 실행 (비동기 노드 사용, 이벤트 루프를 막지 않음)
+        final_results = await _run_until_disconnect(request, lambda: arun_workflow(_initial_state(user_input)))
+        return _recommendation_response(final_results)
+
+    except ClientDisconnected:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"추천 생성 중 오류가 발생했습니다: {str(e)}")
+
+@app.post("/recommend/batch")
+async def batch_recommendations(user_inputs: List[UserInput], request: Request):
+    """
+    여러 사용자 입력에 대한 추천을 동시에 생성하고, 끝나는 순서대로 NDJSON으로 스트리밍합니다.
+    
+    한 번에 실행되는 워크플로우 수는 RECOMMEND_BATCH_CONCURRENCY로 제한되며,
+    네이버/Gemini/DB 호출은 각각의 동시 실행 수 상한을 따릅니다.
+    한 항목이 실패해도 다른 항목에는 영향을 주지 않고, 클라이언트 연결이 끊기면 남은 항목을 모두 취소합니다.
+    
+    각 줄 형식:
+    - 성공: {"index": 입력 순번, "status": "ok", "result": RecommendationResponse}
+    - 실패: {"index": 입력 순번, "status": "error", "error": 오류 메시지}
+    
+    Args:
+        user_inputs: 사용자 입력 데이터 목록
+        request: 요청 객체 (연결 끊김 감지용)
         
-        # LangGraph 워크플로우 실행
-        final_results = workflow_app.invoke(initial_state)
+    Returns:
+        StreamingResponse: application/x-ndjson 스트림
+    """
+    max_items = int(os.getenv("RECOMMEND_BATCH_MAX_ITEMS", "500"))
+    if not user_inputs:
+        raise HTTPException(status_code=400, detail="사용자 입력 목록이 비어 있습니다.")
+    if len(user_inputs) > max_items:
+        raise HTTPException(status_code=413, detail=f"한 번에 최대 {max_items}개까지 요청할 수 있습니다.")
+
+    semaphore = asyncio.Semaphore(int(os.getenv("RECOMMEND_BATCH_CONCURRENCY", "16")))
+
+    async def run_item(index: int, user_input: UserInput) -> Dict[str, Any]:
+        with track_run() as tracker:
+            try:
+                async with semaphore:
+                    final_results = await arun_workflow(_initial_state(user_input))
+            except asyncio.CancelledError:
+                # 클라이언트 연결이 끊겨 남은 항목이 취소된 경우
+                cancellation_stats.record(tracker)
+                raise
+            except Exception as e:
+                return {"index": index, "status": "error", "error": f"추천 생성 중 오류가 발생했습니다: {str(e)}"}
+        if final_results.get('error'):
+            return {"index": index, "status": "error", "error": final_results['error']}
+        return {"index": index, "status": "ok", "result": _recommendation_response(final_results).model_dump(mode="json")}
+
+    async def lines():
+        tasks = [asyncio.create_task(run_item(index, user_input)) for index, user_input in enumerate(user_inputs)]
+        # 다음 항목이 끝나기를 기다리는 동안에도 연결 끊김을 감지 (응답을 쓸 때만 감지하면 늦음)
+        disconnect = asyncio.ensure_future(_wait_for_disconnect(request))
+        pending = set(tasks)
+        try:
+            while pending:
+                done, _ = await asyncio.wait({*pending, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+                if disconnect.done():
+                    return
+                for task in done:
+                    pending.discard(task)
+                    yield orjson.dumps(task.result()) + b"\n"
+        finally:
+            # 클라이언트 연결이 끊기면 남은 항목은 취소
+            disconnect.cancel()
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@app.post("/recommend/stream")
+async def stream_recommendations(user_input: UserInput, request: Request):
+    """
+    맛집 추천을 Server-Sent Events로 스트리밍합니다.
+    
+    이벤트 순서:
+    - search_results: 맛집 검색이 끝나는 즉시 검색 결과 목록
+    - token: Gemini 응답 텍스트 조각 ({"text": ...}), 생성되는 대로
+    - done: 저장까지 끝난 뒤 {"session_id", "recommendations", "error", "degraded"}
+    - error: 처리 중 예외 발생 시 {"detail": ...}
+    
+    클라이언트 연결이 끊기면 진행 중인 워크플로우를 취소합니다.
+    
+    Args:
+        user_input: 사용자 입력 데이터
+        request: 요청 객체 (연결 끊김 감지용)
         
-        # 추천 결과 처리
-        recommendations = []
-        if final_results.get('recommendations'):
-            for recommendation in final_results['recommendations']:
-                if hasattr(recommendation, 'content'):
-                    recommendations.append(recommendation.content)
-                else:
-                    recommendations.append(str(recommendation))
+    Returns:
+        StreamingResponse: text/event-stream 응답
+    """
+    initial_state = _initial_state(user_input)
+
+    async def events():
+        try:
+            async for event, data in _stream_until_disconnect(request, lambda: astream_workflow(initial_state)):
+                if event == "token":
+                    yield _sse("token", {"text": data})
+                elif event == "search_results":
+                    yield _sse("search_results", data)
+                elif event == "final_state":
+                    yield _sse("done", {
+                        "session_id": data.get('session_id', 0),
+                        "recommendations": _recommendation_texts(data),
+                        "error": data.get('error', ""),
+                        "degraded": data.get('degraded') or []
+                    })
+        except Exception as e:
+            yield _sse("error", {"detail": f"추천 생성 중 오류가 발생했습니다: {str(e)}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # 프록시(nginx 등)가 응답을 모아서 보내지 않도록 버퍼링 비활성화
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더 값(목록, 약한 ETag, * 포함)이 ETag와 일치하는지 확인합니다."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+@app.get(
+    "/recommendations/{session_id}",
+    # 직렬화된 바이트를 Response로 직접 반환하므로 response_model 대신 문서용 스키마만 지정
+    responses={
+        200: {"model": SessionDetailResponse, "description": "세션 상세 정보"},
+        304: {"description": "변경 없음 (If-None-Match 일치)"},
+        404: {"description": "세션 없음"}
+    }
+)
+async def get_recommendation_by_session(session_id: int, if_none_match: Optional[str] = Header(None)):
+    """
+    세션 ID로 사용자 입력, 검색 결과, 추천 결과를 조회합니다.
+    
+    추천까지 완료된 세션은 직렬화된 응답을 캐시해 두고 DB를 다시 조회하지 않으며,
+    If-None-Match가 ETag와 일치하면 본문 없이 304를 반환합니다.
+    
+    Args:
+        session_id: 세션 ID
+        if_none_match: 클라이언트가 가진 ETag
         
-        return RecommendationResponse(
-            session_id=final_results.get('session_id', 0),
-            recommendations=recommendations,
-            search_results=final_results.get('search_results', []),
-            user_profile=final_results.get('user_profile', {}),
-            created_at=datetime.now()
-        )
+    Returns:
+        SessionDetailResponse: 세션 상세 정보
+    """
+    cached = session_detail_cache.get(session_id)
+    if cached is None:
+        try:
+            detail = await run_blocking(get_session_detail, session_id)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"세션 조회 중 오류가 발생했습니다: {str(e)}")
+        if detail is None:
+            raise HTTPException(status_code=404, detail=f"세션 {session_id}을(를) 찾을 수 없습니다.")
+
+        # 캐시하기 전에 한 번만 응답 모델로 검증하여 문서화된 스키마와 실제 응답을 일치시킴
+        body = orjson.dumps(SessionDetailResponse.model_validate(detail).model_dump())
+        cached = (body, f'"{xxhash.xxh3_64_hexdigest(body)}"')
+        # 추천이 아직 저장되지 않은(진행 중인) 세션은 내용이 바뀔 수 있으므로 캐시하지 않음
+        if detail["recommendations"]:
+            session_detail_cache.set(session_id, cached)
+
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _validate_cursor(after: Optional[str]) -> None:
+    """after 커서 형식을 확인하고, 잘못되었으면 400을 반환합니다."""
+    if after:
+        try:
+            decode_cursor(after)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"잘못된 커서입니다: {after} (형식: <created_at>,<id>)")
+
+@app.get("/sessions", response_model=SessionPageResponse)
+async def list_sessions(
+    after: Optional[str] = Query(None, description="이전 페이지의 next_cursor (<created_at>,<id>)"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기")
+):
+    """
+    최근 세션 목록을 최신순으로 페이지 단위로 반환합니다.
+    
+    OFFSET 대신 (created_at, id) 키셋 커서를 사용하므로 페이지가 깊어져도 조회 비용이 일정합니다.
+    
+    Args:
+        after: 이전 페이지의 next_cursor
+        limit: 페이지 크기
         
+    Returns:
+        SessionPageResponse: 세션 목록과 다음 페이지 커서
+    """
+    _validate_cursor(after)
+    try:
+        items, next_cursor = await run_blocking(get_sessions_page, after, limit)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"추천 생성 중 오류가 발생했습니다: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"세션 목록 조회 중 오류가 발생했습니다: {str(e)}")
+    return SessionPageResponse(items=items, next_cursor=next_cursor)
 
-@app.get("/recommendations/{session_id}")
-async def get_recommendation_by_session(session_id: int):
+@app.get("/sessions/export")
+async def export_sessions(after: Optional[str] = Query(None, description="이 커서 다음부터 내보내기")):
     """
-    세션 ID로 추천 결과를 조회합니다.
+    세션 전체를 최신순 NDJSON(한 줄에 세션 하나)으로 스트리밍합니다.
+    
+    서버 측 커서로 나눠 읽으므로 테이블 크기와 관계없이 서버 메모리 사용량이 일정합니다.
     
     Args:
-        session_id: 세션 ID
+        after: 이 커서 다음부터 내보내기
         
     Returns:
-        추천 결과 정보
+        StreamingResponse: application/x-ndjson 스트림
     """
-    # TODO: 데이터베이스에서 세션별 추천 결과 조회 구현
-    return {"message": f"세션 {session_id}의 추천 결과 조회 기능은 추후 구현 예정입니다."}
+    _validate_cursor(after)
+    batch_size = int(os.getenv("SESSION_EXPORT_BATCH_SIZE", "1000"))
+    # 동기 제너레이터는 Starlette가 스레드 풀에서 순회하므로 이벤트 루프를 막지 않음
+    lines = (orjson.dumps(item) + b"\n" for item in iter_sessions(after, batch_size))
+    return StreamingResponse(lines, media_type="application/x-ndjson")
 
 @app.get("/stats")
-async def get_statistics():
+async def get_statistics(days: Optional[int] = Query(None, ge=1, description="최근 며칠만 집계 (없으면 전체 기간)")):
     """
     서비스 통계 정보를 반환합니다.
     
+    저장 시점에 갱신되는 일별 집계 테이블만 읽으며, 결과는 짧은 시간 동안 캐시합니다.
+    
+    Args:
+        days: 최근 며칠만 집계 (없으면 전체 기간)
+        
     Returns:
         통계 정보
     """
-    # TODO: 실제 통계 데이터 구현
+    stats = stats_cache.get(days)
+    if stats is None:
+        try:
+            stats = await run_blocking(read_statistics, days)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"통계 조회 중 오류가 발생했습니다: {str(e)}")
+        stats_cache.set(days, stats)
+    return stats
+
+@app.get("/metrics", response_class=Response)
+async def get_metrics():
+    """
+    노드/외부 호출(네이버, Gemini)/저장 메서드별 소요 시간 히스토그램, 오류 수, 진행 중인 호출 수를
+    Prometheus 텍스트 형식으로 반환합니다.
+
+    Returns:
+        Prometheus 텍스트 형식 지표
+    """
+    return Response(metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/stats/runtime")
+async def get_runtime_statistics():
+    """
+    프로세스 내부 런타임 통계(공유 클라이언트 재사용 현황 등)를 반환합니다.
+
+    Returns:
+        런타임 통계 정보
+    """
+    write_behind = getattr(app.state, "write_behind", None)
+    local_index = get_local_index()
     return {
-        "total_sessions": 0,
-        "total_recommendations": 0,
-        "popular_cuisines": [],
-        "popular_locations": []
+        "db_pool": get_pool_stats(),
+        "write_behind": write_behind.stats() if write_behind else None,
+        "llm_clients": llm_registry.stats(),
+        "naver_search_cache": search_cache.stats(),
+        "session_detail_cache": session_detail_cache.stats(),
+        "stats_rollup": stats_rollup.stats(),
+        "local_index": local_index.stats() if local_index else None,
+        "single_flight": {
+            "naver_search": search_flight.stats(),
+            "llm": llm_flight.stats()
+        },
+        "rate_limits": {
+            "naver": naver_rate_limiter.stats()
+        },
+        "circuit_breakers": {
+            "naver": naver_breaker.stats()
+        },
+        "hedging": {
+            "naver": naver_hedge.stats()
+        },
+        "cancellations": cancellation_stats.stats(),
+        "concurrency": {
+            "naver": naver_limiter.stats(),
+            "llm": llm_limiter.stats(),
+            "db": db_limiter.stats()
+        }
     }
 
 if __name__ == "__main__":
@@ -6,20 +6,44 @@ Core module for food recommendation agent
 
 from .graph_types import GraphState
 from .graph import app as workflow_app
+from .runner import run_workflow, arun_workflow, astream_workflow
+from .run_tracking import RunTracker, track_run, set_stage, current_stage, cancellation_stats
 from .nodes import (
     get_user_input,
     analyze_user_preferences,
     search_restaurants,
+    rank_restaurants,
     recommend_restaurants,
-    handle_error_node
+    handle_error_node,
+    aget_user_input,
+    aanalyze_user_preferences,
+    asearch_restaurants,
+    arank_restaurants,
+    arecommend_restaurants,
+    ahandle_error_node
 )
 
 __all__ = [
     "GraphState",
     "workflow_app",
+    "run_workflow",
+    "arun_workflow",
+    "astream_workflow",
+    "RunTracker",
+    "track_run",
+    "set_stage",
+    "current_stage",
+    "cancellation_stats",
     "get_user_input",
     "analyze_user_preferences", 
     "search_restaurants",
+    "rank_restaurants",
     "recommend_restaurants",
-    "handle_error_node"
+    "handle_error_node",
+    "aget_user_input",
+    "aanalyze_user_preferences",
+    "asearch_restaurants",
+    "arank_restaurants",
+    "arecommend_restaurants",
+    "ahandle_error_node"
 ]
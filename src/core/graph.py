@@ -1,46 +1,90 @@
 # 서드파티 라이브러리
 from dotenv import load_dotenv
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, StateGraph
 
 # 로컬 애플리케이션
 from .graph_types import GraphState
+from .run_tracking import set_stage
+from ..utils.metrics import CallMetrics, metrics_registry
 from .nodes import (
     get_user_input,
     analyze_user_preferences,
     search_restaurants,
+    rank_restaurants,
     recommend_restaurants,
-    handle_error_node
+    handle_error_node,
+    aget_user_input,
+    aanalyze_user_preferences,
+    asearch_restaurants,
+    arank_restaurants,
+    arecommend_restaurants,
+    ahandle_error_node
 )
 
 load_dotenv()
 
+# 노드별 소요 시간/오류/진행 중 수 (node 레이블)
+node_metrics = CallMetrics(metrics_registry, "food_reco_node", "node", "워크플로우 노드 실행")
+
+def _node(func, afunc) -> RunnableLambda:
+    """
+    동기(invoke)/비동기(ainvoke) 실행을 모두 지원하는 노드를 생성합니다.
+    노드가 시작할 때 실행 추적기에 현재 단계(노드 이름)를 기록하고, 소요 시간과 오류를 지표로 기록합니다.
+    (노드는 대부분의 예외를 state['error']로 처리하므로 새로 설정된 error도 오류로 집계)
+    """
+    name = func.__name__
+    metrics = node_metrics.bind(name)
+
+    def run(state: GraphState) -> GraphState:
+        set_stage(name)
+        error_before = state.get('error')
+        with metrics.track():
+            result = func(state)
+        if result.get('error') and result.get('error') != error_before:
+            metrics.errors.inc()
+        return result
+
+    async def arun(state: GraphState) -> GraphState:
+        set_stage(name)
+        error_before = state.get('error')
+        with metrics.track():
+            result = await afunc(state)
+        if result.get('error') and result.get('error') != error_before:
+            metrics.errors.inc()
+        return result
+
+    return RunnableLambda(run, afunc=arun, name=name)
+
 # 조건부 엣지 함수
 def should_continue(state: GraphState) -> str:
     """에러 발생 여부에 따라 다음 노드 결정"""
     if state.get('error'):
         return "handle_error"
-    return "recommend_restaurants"
+    return "rank_restaurants"
 
 # 그래프 빌드
 workflow = StateGraph(GraphState)
 
-workflow.add_node("get_user_input", get_user_input) # 사용자 입력 받기
-workflow.add_node("analyze_user_preferences", analyze_user_preferences) # 사용자 선호도 분석
-workflow.add_node("search_restaurants", search_restaurants) # 맛집 검색
-workflow.add_node("recommend_restaurants", recommend_restaurants) # 맛집 추천
-workflow.add_node("handle_error", handle_error_node) # 에러 처리
+workflow.add_node("get_user_input", _node(get_user_input, aget_user_input)) # 사용자 입력 받기
+workflow.add_node("analyze_user_preferences", _node(analyze_user_preferences, aanalyze_user_preferences)) # 사용자 선호도 분석
+workflow.add_node("search_restaurants", _node(search_restaurants, asearch_restaurants)) # 맛집 검색
+workflow.add_node("rank_restaurants", _node(rank_restaurants, arank_restaurants)) # 검색 결과 재정렬
+workflow.add_node("recommend_restaurants", _node(recommend_restaurants, arecommend_restaurants)) # 맛집 추천
+workflow.add_node("handle_error", _node(handle_error_node, ahandle_error_node)) # 에러 처리
 
 workflow.set_entry_point("get_user_input") # 시작 노드
 workflow.add_edge("get_user_input", "analyze_user_preferences") # 사용자 입력 받기 -> 사용자 선호도 분석
 workflow.add_edge("analyze_user_preferences", "search_restaurants") # 사용자 선호도 분석 -> 맛집 검색
 workflow.add_conditional_edges(
     "search_restaurants",
-    should_continue, # 맛집 검색 -> 맛집 추천 or 에러 처리
+    should_continue, # 맛집 검색 -> 검색 결과 재정렬 or 에러 처리
     {
-        "recommend_restaurants": "recommend_restaurants", # 맛집 추천
+        "rank_restaurants": "rank_restaurants", # 검색 결과 재정렬
         "handle_error": "handle_error" # 에러 처리
     }
 )
+workflow.add_edge("rank_restaurants", "recommend_restaurants") # 검색 결과 재정렬 -> 맛집 추천
 workflow.add_edge("recommend_restaurants", END) # 맛집 추천 -> 종료
 workflow.add_edge("handle_error", END) # 에러 처리 -> 종료
 
@@ -10,7 +10,11 @@ class GraphState(TypedDict):
     ambiance: str # 분위기: 시끌벅적한, 조용한, 아늑한, 인스타감성, 전통적인
     special_requirements: str # 특별 요구사항: 주차 가능, 반려동물 동반 가능, 채식 메뉴 있음, 키즈존 있음
     search_results: List[Dict[str, str]] # 검색 결과
+    ranked_results: List[Dict[str, str]] # 재정렬된 상위 검색 결과 (LLM 프롬프트에 사용)
     recommendations: List[str] # 추천 결과
     error: str # 에러 메시지
     user_profile: Dict[str, Any] # 사용자 프로필 정보 추가
     session_id: int # 데이터베이스 세션 ID
+    stream_tokens: bool # True이면 LLM 응답을 토큰 단위로 스트리밍 (astream_workflow에서 사용)
+    deadline_at: float # 실행 마감 시각 (time.monotonic() 기준, 없으면 제한 없음)
+    degraded: List[str] # 마감 시각 때문에 축소한 작업 목록 (예: "single_query", "fast_model")
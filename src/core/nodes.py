@@ -1,26 +1,112 @@
 # 표준 라이브러리
+import asyncio
 import datetime
-from typing import List, Dict, Any
+import os
+from typing import List, Dict, Any, Optional, Tuple
 
 # 서드파티 라이브러리
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langgraph.config import get_stream_writer
 
 # 로컬 애플리케이션
-from ..services.naver_search import search_restaurants_naver
+from ..services.naver_search import search_restaurants_naver, asearch_restaurants_naver, naver_breaker
 from ..services.restaurant_data import search_restaurants_backup
-from ..database import save_user_session, save_search_results, save_recommendation
+from ..services.local_index import search_restaurants_local, LOCAL_SOURCE
+from ..services.reranker import rerank_search_results
+from ..services.llm_client import invoke_llm, ainvoke_llm, astream_llm, chunk_text, DEFAULT_LLM_MODEL, FAST_LLM_MODEL
+from ..database import save_user_session, save_search_results, save_recommendation, db_limiter
+from ..utils.circuit_breaker import OPEN
+from ..utils.deadline import deadline_after, time_left
+from ..utils.executor import run_blocking
 
 # 타입 정의
 from .graph_types import GraphState
 
+# 마감 시각까지 남은 시간에 따른 단계별 축소 기준 (초)
+# - 검색은 남은 시간에서 추천에 쓸 시간을 뺀 만큼만 사용하고, 그 시간이 짧으면 검색어 하나만 검색
+# - 추천은 남은 시간이 짧으면 빠른 모델을, 더 짧으면 LLM 없이 포맷팅된 검색 결과를 사용
+DEADLINE_RECOMMEND_RESERVE_SECONDS = float(os.getenv("DEADLINE_RECOMMEND_RESERVE_SECONDS", "10"))
+DEADLINE_SINGLE_QUERY_SECONDS = float(os.getenv("DEADLINE_SINGLE_QUERY_SECONDS", "3"))
+DEADLINE_FULL_MODEL_SECONDS = float(os.getenv("DEADLINE_FULL_MODEL_SECONDS", "8"))
+DEADLINE_FAST_MODEL_SECONDS = float(os.getenv("DEADLINE_FAST_MODEL_SECONDS", "3"))
+
+def _time_left(state: GraphState) -> Optional[float]:
+    """마감 시각까지 남은 시간 (초, 마감 시각이 없으면 None)"""
+    return time_left(state.get('deadline_at'))
+
+def _degrade(state: GraphState, step: str, reason: str) -> None:
+    """마감 시각 때문에 축소한 작업을 기록합니다."""
+    state['degraded'] = [*(state.get('degraded') or []), step]
+    print(f"⏱️ {reason}")
+
+def _search_plan(state: GraphState) -> Tuple[Optional[float], bool]:
+    """
+    남은 시간으로 검색 제한 시간과 검색어 하나만 검색할지 여부를 정합니다.
+
+    Returns:
+        Tuple[Optional[float], bool]: (검색 제한 시간(초, None이면 제한 없음, 0이면 네이버 검색 생략), 검색어 하나만 검색)
+    """
+    remaining = _time_left(state)
+    if remaining is None:
+        return None, False
+    budget = max(remaining - DEADLINE_RECOMMEND_RESERVE_SECONDS, 0.0)
+    if budget <= 0:
+        _degrade(state, "skip_naver", f"남은 시간 {remaining:.1f}초: 네이버 검색을 생략합니다.")
+        return 0.0, True
+    if budget < DEADLINE_SINGLE_QUERY_SECONDS:
+        _degrade(state, "single_query", f"검색에 쓸 수 있는 시간 {budget:.1f}초: 검색어 하나만 검색합니다.")
+        return budget, True
+    return budget, False
+
+def _recommendation_model(state: GraphState) -> Optional[str]:
+    """
+    남은 시간으로 추천에 사용할 모델을 정합니다.
+
+    Returns:
+        Optional[str]: 모델 이름 (None이면 LLM 없이 포맷팅된 검색 결과 사용)
+    """
+    remaining = _time_left(state)
+    if remaining is None or remaining >= DEADLINE_FULL_MODEL_SECONDS:
+        return DEFAULT_LLM_MODEL
+    if remaining >= DEADLINE_FAST_MODEL_SECONDS:
+        _degrade(state, "fast_model", f"남은 시간 {remaining:.1f}초: 빠른 모델({FAST_LLM_MODEL})로 추천합니다.")
+        return FAST_LLM_MODEL
+    _degrade(state, "formatted_fallback", f"남은 시간 {remaining:.1f}초: 포맷팅된 검색 결과를 그대로 사용합니다.")
+    return None
+
+def _has_user_input(state: GraphState) -> bool:
+    """API 등을 통해 사용자 입력이 이미 전달되었는지 확인합니다."""
+    return bool(state.get('age') and state.get('cuisine_preference') and state.get('location'))
+
+def _save_user_session_to_db(state: GraphState) -> None:
+    """사용자 입력을 데이터베이스에 저장하고 세션 ID를 상태에 기록합니다. 저장 실패는 워크플로우를 중단시키지 않습니다."""
+    if state.get('session_id'):
+        return
+    try:
+        user_data = {
+            'age': state['age'],
+            'cuisine_preference': state['cuisine_preference'],
+            'weather': state['weather'],
+            'location': state['location'],
+            'companion_type': state['companion_type'],
+            'ambiance': state['ambiance'],
+            'special_requirements': state['special_requirements']
+        }
+        session_id = save_user_session(user_data)
+        state['session_id'] = session_id
+        print(f"✅ 사용자 입력이 데이터베이스에 저장되었습니다. (세션 ID: {session_id})")
+    except Exception as db_error:
+        print(f"⚠️ 데이터베이스 저장 실패: {db_error}")
+        # DB 저장 실패해도 워크플로우는 계속 진행
+
 # 사용자 입력 받기
 def get_user_input(state: GraphState) -> GraphState:
     """사용자로부터 입력을 받는 노드 (터미널 모드용)"""
     print("---사용자 입력 받기---")
     
-    # API를 통해 이미 입력이 전달된 경우 건너뛰기
-    if state.get('age') and state.get('cuisine_preference') and state.get('location'):
+    # API를 통해 이미 입력이 전달된 경우 입력 단계는 건너뛰고 세션만 저장
+    if _has_user_input(state):
         print("이미 사용자 입력이 전달되었습니다. 입력 단계를 건너뜁니다.")
+        _save_user_session_to_db(state)
         return state
     
     try:
@@ -50,22 +136,7 @@ def get_user_input(state: GraphState) -> GraphState:
         print(f"동반자유형={state['companion_type']}, 분위기={state['ambiance']}, 특별요구사항={state['special_requirements']}")
         
         # 사용자 입력을 데이터베이스에 저장
-        try:
-            user_data = {
-                'age': state['age'],
-                'cuisine_preference': state['cuisine_preference'],
-                'weather': state['weather'],
-                'location': state['location'],
-                'companion_type': state['companion_type'],
-                'ambiance': state['ambiance'],
-                'special_requirements': state['special_requirements']
-            }
-            session_id = save_user_session(user_data)
-            state['session_id'] = session_id
-            print(f"✅ 사용자 입력이 데이터베이스에 저장되었습니다. (세션 ID: {session_id})")
-        except Exception as db_error:
-            print(f"⚠️ 데이터베이스 저장 실패: {db_error}")
-            # DB 저장 실패해도 워크플로우는 계속 진행
+        _save_user_session_to_db(state)
         
     except Exception as e:
         print(f"입력 중 오류 발생: {e}")
@@ -76,6 +147,10 @@ def get_user_input(state: GraphState) -> GraphState:
 def analyze_user_preferences(state: GraphState) -> GraphState:
     """사용자 선호도를 분석하고 프로필을 생성하는 노드"""
     print("---사용자 선호도 분석---")
+    # 입력을 받은 뒤(CLI) 실행되었으면 여기서부터 제한 시간 계산
+    if 'deadline_at' not in state:
+        state['deadline_at'] = deadline_after()
+        state['degraded'] = []
     try:
         age = state['age']
         cuisine = state['cuisine_preference']
@@ -134,6 +209,39 @@ def analyze_user_preferences(state: GraphState) -> GraphState:
     
     return state
 
+def _save_search_results_to_db(state: GraphState, results: List[Dict[str, str]], source: str = "naver") -> None:
+    """검색 결과를 데이터베이스에 저장합니다. 저장 실패는 워크플로우를 중단시키지 않습니다."""
+    if not results or not state.get('session_id'):
+        return
+    try:
+        search_result_ids = save_search_results(
+            session_id=state['session_id'],
+            search_results=results,
+            source=source,
+            cuisine_preference=state['cuisine_preference']
+        )
+        print(f"✅ 검색 결과가 데이터베이스에 저장되었습니다. (결과 ID: {search_result_ids})")
+    except Exception as db_error:
+        print(f"⚠️ 검색 결과 DB 저장 실패: {db_error}")
+        # DB 저장 실패해도 워크플로우는 계속 진행
+
+def _naver_available() -> bool:
+    """
+    네이버 서킷 브레이커가 열려 있으면 검색어별 호출을 만들지 않고 바로 로컬 검색으로 넘어가도록 False를 반환합니다.
+    (half_open 상태에서는 복구 확인 호출이 필요하므로 True)
+    """
+    if naver_breaker.state == OPEN:
+        print("⚠️ 네이버 서킷 브레이커가 열려 있어 네이버 검색을 생략합니다.")
+        return False
+    return True
+
+def _search_local(state: GraphState) -> List[Dict[str, str]]:
+    """네이버 검색 결과가 없을 때(API 오류 포함) 네트워크 없이 로컬 색인으로 검색합니다."""
+    print("네이버 검색 결과가 없어 로컬 색인으로 검색합니다.")
+    results = search_restaurants_local(state['user_profile'])
+    print(f"로컬 검색 결과 {len(results)}개")
+    return results
+
 # 맛집 검색
 def search_restaurants(state: GraphState) -> GraphState:
     """네이버 또는 정적 데이터를 사용하여 맛집을 검색하고 search_results에 저장합니다."""
@@ -142,25 +250,22 @@ def search_restaurants(state: GraphState) -> GraphState:
         if not state.get('user_profile'):
             raise ValueError("사용자 프로필 정보가 누락되었습니다.")
 
-        print("네이버 API로 맛집 검색 시도 중...")
-        results = search_restaurants_naver(
-            user_profile=state['user_profile']
-        )
+        # 동기 실행에서는 진행 중인 호출을 중단할 수 없으므로 검색 범위만 줄임
+        budget, single_query = _search_plan(state)
+        results = []
+        if budget != 0 and _naver_available():
+            print("네이버 API로 맛집 검색 시도 중...")
+            results = search_restaurants_naver(
+                user_profile=state['user_profile'],
+                single_query=single_query
+            )
+        source = "naver"
+        if not results:
+            results, source = _search_local(state), LOCAL_SOURCE
         state['search_results'] = results
         
         # 검색 결과를 데이터베이스에 저장
-        if results and state.get('session_id'):
-            try:
-                search_result_ids = save_search_results(
-                    session_id=state['session_id'],
-                    search_results=results,
-                    source="naver",
-                    cuisine_preference=state['cuisine_preference']
-                )
-                print(f"✅ 검색 결과가 데이터베이스에 저장되었습니다. (결과 ID: {search_result_ids})")
-            except Exception as db_error:
-                print(f"⚠️ 검색 결과 DB 저장 실패: {db_error}")
-                # DB 저장 실패해도 워크플로우는 계속 진행
+        _save_search_results_to_db(state, results, source)
     except ValueError as ve:
         print(f"입력값 오류: {ve}")
         state['search_results'] = []
@@ -171,37 +276,42 @@ def search_restaurants(state: GraphState) -> GraphState:
         state['error'] = f"맛집 검색 중 오류가 발생했습니다: {e}"
     return state
 
-# 맛집 추천
-def recommend_restaurants(state: GraphState) -> GraphState:
-    """검색된 맛집을 바탕으로 최종 추천"""
-    print("---맛집 추천---")
-    if state['error']:
-        print(f"오류로 인해 추천을 진행할 수 없습니다: {state['error']}")
-        return state
+# 검색 결과 재정렬
+def rank_restaurants(state: GraphState) -> GraphState:
+    """검색 결과를 사용자 선호와의 관련도(BM25)로 재정렬하여 상위 결과만 ranked_results에 저장합니다."""
+    print("---검색 결과 재정렬---")
+    search_results = state.get('search_results') or []
+    try:
+        state['ranked_results'] = rerank_search_results(state, search_results)
+        print(f"검색 결과 {len(search_results)}개 중 상위 {len(state['ranked_results'])}개를 추천에 사용합니다.")
+    except Exception as e:
+        # 재정렬에 실패하면 검색 순서 그대로 사용
+        print(f"재정렬 중 오류 발생: {e}")
+        state['ranked_results'] = search_results
+    return state
 
-    if not state.get('search_results'):
-        print("추천할 맛집이 없습니다.")
-        state['recommendations'] = ["추천할 맛집을 찾지 못했습니다."]
-        return state
+def _results_for_prompt(state: GraphState) -> List[Dict[str, str]]:
+    """LLM 프롬프트에 넣을 검색 결과 (재정렬 결과가 있으면 그것을 사용)"""
+    return state.get('ranked_results') or state['search_results']
 
-    # 검색 결과를 바탕으로 프롬프트 생성
+def _format_search_results(search_results: List[Dict[str, str]]) -> List[str]:
+    """검색 결과를 LLM 프롬프트에 넣을 번호 목록 문자열로 변환합니다."""
     formatted_recommendations = []
-    for i, result in enumerate(state['search_results'], 1):
+    for i, result in enumerate(search_results, 1):
         title = result.get('title', '제목 없음')
         description = result.get('description', '')
         # 링크 정보는 LLM에 직접 제공하기보다, 최종 결과물에 포함하는 것이 더 유용할 수 있습니다.
         formatted_rec = f"{i}. {title} - {description[:300]}{'...' if len(description) > 300 else ''}"
         formatted_recommendations.append(formatted_rec)
-        
-    try:
-        print("Gemini를 사용하여 맛집 추천을 개인화합니다...")
-        llm = ChatGoogleGenerativeAI(model="gemini-2.0-flash", temperature=0.7)
-        
-        # 사용자 프로필 정보를 포함한 향상된 프롬프트
-        user_profile = state.get('user_profile', {})
-        profile_info = ""
-        if user_profile:
-            profile_info = f"""
+    return formatted_recommendations
+
+def _build_recommendation_prompt(state: GraphState, formatted_recommendations: List[str]) -> str:
+    """사용자 정보와 검색 결과로 Gemini 추천 프롬프트를 생성합니다."""
+    # 사용자 프로필 정보를 포함한 향상된 프롬프트
+    user_profile = state.get('user_profile', {})
+    profile_info = ""
+    if user_profile:
+        profile_info = f"""
 사용자 프로필 분석 결과:
 - 나이대: {user_profile.get('age_group', 'N/A')}
 - 계절: {user_profile.get('season', 'N/A')}
@@ -213,53 +323,90 @@ def recommend_restaurants(state: GraphState) -> GraphState:
 - 가격대: {user_profile.get('price_range', 'N/A')}
 - 분위기 선호도: {', '.join(user_profile.get('ambiance_preference', []))}
 """
-        
-        prompt = (
-            f"다음은 사용자 정보입니다:\n"
-            f"나이: {state['age']}\n"
-            f"선호 음식: {state['cuisine_preference']}\n"
-            f"지역: {state['location']}\n"
-            f"동반자유형: {state['companion_type']}\n"
-            f"원하는 분위기: {state['ambiance']}\n"
-            f"특별 요구사항: {', '.join(state['special_requirements']) if state['special_requirements'] else '없음'}\n"
-            f"{profile_info}\n"
-            f"검색된 맛집 목록:\n"
-            f"{chr(10).join(formatted_recommendations)}\n\n"
-            f"위 정보를 바탕으로 사용자에게 가장 적합한 맛집을 추천해주세요."
-            f"나이대별 선호도, 날씨, 계절, 식이 고려사항, 동반자유형, 분위기, 특별 요구사항을 종합적으로 고려하여 맛집을 선별하고 그 이유도 상세히 설명해주세요. "
-            f"3개의 맛집을 추천하고, 각 맛집에 대한 특징과 추천 이유를 **대표 메뉴, 가격대, 분위기, 전반적인 평점(별점 표현), 동반자유형 적합성, 특별 요구사항 만족도**를 포함하여 한국어로 작성해주세요."
-            f"사용자의 나이대와 선호도를 고려한 맞춤형 추천이 되도록 해주세요."
+
+    return (
+        f"다음은 사용자 정보입니다:\n"
+        f"나이: {state['age']}\n"
+        f"선호 음식: {state['cuisine_preference']}\n"
+        f"지역: {state['location']}\n"
+        f"동반자유형: {state['companion_type']}\n"
+        f"원하는 분위기: {state['ambiance']}\n"
+        f"특별 요구사항: {', '.join(state['special_requirements']) if state['special_requirements'] else '없음'}\n"
+        f"{profile_info}\n"
+        f"검색된 맛집 목록:\n"
+        f"{chr(10).join(formatted_recommendations)}\n\n"
+        f"위 정보를 바탕으로 사용자에게 가장 적합한 맛집을 추천해주세요."
+        f"나이대별 선호도, 날씨, 계절, 식이 고려사항, 동반자유형, 분위기, 특별 요구사항을 종합적으로 고려하여 맛집을 선별하고 그 이유도 상세히 설명해주세요. "
+        f"3개의 맛집을 추천하고, 각 맛집에 대한 특징과 추천 이유를 **대표 메뉴, 가격대, 분위기, 전반적인 평점(별점 표현), 동반자유형 적합성, 특별 요구사항 만족도**를 포함하여 한국어로 작성해주세요."
+        f"사용자의 나이대와 선호도를 고려한 맞춤형 추천이 되도록 해주세요."
+    )
+
+def _save_recommendation_to_db(state: GraphState, refined_recommendation: Any, model: str = DEFAULT_LLM_MODEL) -> None:
+    """추천 결과를 데이터베이스에 저장합니다. 저장 실패는 워크플로우를 중단시키지 않습니다."""
+    if not state.get('session_id'):
+        return
+    try:
+        # Gemini 응답 객체인 경우 content 추출
+        if hasattr(refined_recommendation, 'content'):
+            recommendation_text = refined_recommendation.content
+        else:
+            recommendation_text = str(refined_recommendation)
+
+        recommendation_id = save_recommendation(
+            session_id=state['session_id'],
+            recommendation_text=recommendation_text,
+            ai_model=model
         )
-        
-        refined_recommendation = llm.invoke(prompt)
+        print(f"✅ 추천 결과가 데이터베이스에 저장되었습니다. (추천 ID: {recommendation_id})")
+    except Exception as db_error:
+        print(f"⚠️ 추천 결과 DB 저장 실패: {db_error}")
+        # DB 저장 실패해도 워크플로우는 계속 진행
+
+def _can_recommend(state: GraphState) -> bool:
+    """추천을 진행할 수 있는 상태인지 확인하고, 불가능하면 상태를 정리합니다."""
+    if state['error']:
+        print(f"오류로 인해 추천을 진행할 수 없습니다: {state['error']}")
+        return False
+
+    if not state.get('search_results'):
+        print("추천할 맛집이 없습니다.")
+        state['recommendations'] = ["추천할 맛집을 찾지 못했습니다."]
+        return False
+
+    return True
+
+# 맛집 추천
+def recommend_restaurants(state: GraphState) -> GraphState:
+    """검색된 맛집을 바탕으로 최종 추천"""
+    print("---맛집 추천---")
+    if not _can_recommend(state):
+        return state
+
+    # 검색 결과를 바탕으로 프롬프트 생성
+    formatted_recommendations = _format_search_results(_results_for_prompt(state))
+    model = _recommendation_model(state)
+    if model is None:
+        state['recommendations'] = formatted_recommendations
+        return state
+
+    try:
+        print("Gemini를 사용하여 맛집 추천을 개인화합니다...")
+        prompt = _build_recommendation_prompt(state, formatted_recommendations)
+
+        # 공유 클라이언트 사용, 같은 프롬프트의 동시 호출은 한 번만 실행
+        refined_recommendation = invoke_llm(prompt, model=model)
         # print("gemini 추천 결과:")
         # print(refined_recommendation)
-        
+
         state['recommendations'] = [refined_recommendation]
-        
+
         # 추천 결과를 데이터베이스에 저장
-        if state.get('session_id'):
-            try:
-                # Gemini 응답 객체인 경우 content 추출
-                if hasattr(refined_recommendation, 'content'):
-                    recommendation_text = refined_recommendation.content
-                else:
-                    recommendation_text = str(refined_recommendation)
-                
-                recommendation_id = save_recommendation(
-                    session_id=state['session_id'],
-                    recommendation_text=recommendation_text,
-                    ai_model="gemini-2.0-flash"
-                )
-                print(f"✅ 추천 결과가 데이터베이스에 저장되었습니다. (추천 ID: {recommendation_id})")
-            except Exception as db_error:
-                print(f"⚠️ 추천 결과 DB 저장 실패: {db_error}")
-                # DB 저장 실패해도 워크플로우는 계속 진행
+        _save_recommendation_to_db(state, refined_recommendation, model)
     except Exception as e:
         print(f"gemini 추천 중 오류 발생: {e}")
         print("오류로 인해 포맷팅된 검색 결과를 그대로 사용합니다.")
         state['recommendations'] = formatted_recommendations
-    
+
     return state
 
 # 에러 처리
@@ -268,3 +415,135 @@ def handle_error_node(state: GraphState) -> GraphState:
     print(f"---오류 처리---")
     print(f"오류 발생: {state['error']}")
     return state
+
+# ---------------------------------------------------------------------------
+# 비동기 노드
+#
+# FastAPI 등 이벤트 루프 위에서 워크플로우를 실행할 때(workflow_app.ainvoke) 사용됩니다.
+# 네트워크/DB 같은 블로킹 작업은 run_blocking으로 스레드 풀에 위임하고,
+# Gemini 호출은 비동기 API(ainvoke)를 사용합니다.
+# ---------------------------------------------------------------------------
+
+async def _run_db(func, *args: Any) -> Any:
+    """DB 저장 함수를 동시 실행 수 상한(DB_MAX_CONCURRENCY) 안에서 스레드 풀로 실행합니다."""
+    async with db_limiter.aslot():
+        return await run_blocking(func, *args)
+
+def _emit(event: str, data: Any) -> None:
+    """
+    스트리밍 실행(stream_mode="custom") 중이면 중간 결과 이벤트를 내보냅니다.
+    스트리밍 중이 아니거나 그래프 밖에서 호출된 경우에는 아무 것도 하지 않습니다.
+    """
+    try:
+        writer = get_stream_writer()
+    except RuntimeError:
+        return
+    writer({"event": event, "data": data})
+
+async def _astream_recommendation(prompt: str, model: str = DEFAULT_LLM_MODEL) -> Any:
+    """Gemini 응답을 조각 단위로 받아 token 이벤트로 내보내고, 합친 응답을 반환합니다."""
+    refined_recommendation = None
+    async for chunk in astream_llm(prompt, model):
+        text = chunk_text(chunk)
+        if text:
+            _emit("token", text)
+        refined_recommendation = chunk if refined_recommendation is None else refined_recommendation + chunk
+    return refined_recommendation if refined_recommendation is not None else ""
+
+async def aget_user_input(state: GraphState) -> GraphState:
+    """get_user_input의 비동기 버전"""
+    if _has_user_input(state):
+        print("---사용자 입력 받기---")
+        print("이미 사용자 입력이 전달되었습니다. 입력 단계를 건너뜁니다.")
+        await _run_db(_save_user_session_to_db, state)
+        return state
+
+    # 터미널 입력(input())은 블로킹이므로 스레드 풀에서 실행
+    return await run_blocking(get_user_input, state)
+
+async def aanalyze_user_preferences(state: GraphState) -> GraphState:
+    """analyze_user_preferences의 비동기 버전 (CPU 연산만 수행하므로 그대로 호출)"""
+    return analyze_user_preferences(state)
+
+async def asearch_restaurants(state: GraphState) -> GraphState:
+    """search_restaurants의 비동기 버전"""
+    print("---맛집 검색 중---")
+    try:
+        if not state.get('user_profile'):
+            raise ValueError("사용자 프로필 정보가 누락되었습니다.")
+
+        budget, single_query = _search_plan(state)
+        results = []
+        if budget != 0 and _naver_available():
+            print("네이버 API로 맛집 검색 시도 중...")
+            try:
+                results = await asyncio.wait_for(
+                    asearch_restaurants_naver(user_profile=state['user_profile'], single_query=single_query),
+                    timeout=budget
+                )
+            except asyncio.TimeoutError:
+                _degrade(state, "search_timeout", f"네이버 검색이 {budget:.1f}초 안에 끝나지 않았습니다.")
+        source = "naver"
+        if not results:
+            results, source = _search_local(state), LOCAL_SOURCE
+        state['search_results'] = results
+        # 스트리밍 응답에서는 LLM 추천을 기다리지 않고 검색 결과를 먼저 전달
+        _emit("search_results", results)
+
+        # 검색 결과를 데이터베이스에 저장
+        await _run_db(_save_search_results_to_db, state, results, source)
+    except ValueError as ve:
+        print(f"입력값 오류: {ve}")
+        state['search_results'] = []
+        state['error'] = str(ve)
+    except Exception as e:
+        print(f"검색 중 오류 발생: {e}")
+        state['search_results'] = []
+        state['error'] = f"맛집 검색 중 오류가 발생했습니다: {e}"
+    return state
+
+async def arecommend_restaurants(state: GraphState) -> GraphState:
+    """recommend_restaurants의 비동기 버전"""
+    print("---맛집 추천---")
+    if not _can_recommend(state):
+        return state
+
+    formatted_recommendations = _format_search_results(_results_for_prompt(state))
+    model = _recommendation_model(state)
+    if model is None:
+        state['recommendations'] = formatted_recommendations
+        return state
+
+    try:
+        print("Gemini를 사용하여 맛집 추천을 개인화합니다...")
+        prompt = _build_recommendation_prompt(state, formatted_recommendations)
+
+        # 마감 시각까지 끝나지 않으면 호출을 취소하고 포맷팅된 검색 결과 사용
+        timeout = _time_left(state)
+        if state.get('stream_tokens'):
+            # 생성되는 대로 토큰을 전달 (호출자마다 스트림이 달라야 하므로 병합하지 않음)
+            refined_recommendation = await asyncio.wait_for(_astream_recommendation(prompt, model), timeout)
+        else:
+            # 공유 클라이언트 사용, 같은 프롬프트의 동시 호출은 한 번만 실행
+            refined_recommendation = await asyncio.wait_for(ainvoke_llm(prompt, model=model), timeout)
+        state['recommendations'] = [refined_recommendation]
+
+        # 추천 결과를 데이터베이스에 저장
+        await _run_db(_save_recommendation_to_db, state, refined_recommendation, model)
+    except asyncio.TimeoutError:
+        _degrade(state, "llm_timeout", "마감 시각까지 추천이 끝나지 않아 포맷팅된 검색 결과를 그대로 사용합니다.")
+        state['recommendations'] = formatted_recommendations
+    except Exception as e:
+        print(f"gemini 추천 중 오류 발생: {e}")
+        print("오류로 인해 포맷팅된 검색 결과를 그대로 사용합니다.")
+        state['recommendations'] = formatted_recommendations
+
+    return state
+
+async def arank_restaurants(state: GraphState) -> GraphState:
+    """rank_restaurants의 비동기 버전 (수 ms 이내의 CPU 연산이므로 그대로 호출)"""
+    return rank_restaurants(state)
+
+async def ahandle_error_node(state: GraphState) -> GraphState:
+    """handle_error_node의 비동기 버전"""
+    return handle_error_node(state)
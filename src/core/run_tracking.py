@@ -0,0 +1,119 @@
+"""
+워크플로우 실행 단계 추적과 취소 통계
+
+실행 한 번마다 RunTracker를 만들어 ContextVar에 등록하면, 각 노드가 시작할 때 현재 단계를 기록합니다.
+노드는 ContextVar가 복사된 태스크에서 실행되지만 같은 RunTracker 객체를 공유하므로,
+실행을 시작한 쪽(API 핸들러 등)이 취소 시점에 어느 단계에서 멈췄는지 알 수 있습니다.
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from ..utils.metrics import metrics_registry
+
+
+class RunTracker:
+    """실행 한 번의 현재 단계와 시작 시각"""
+
+    def __init__(self):
+        """RunTracker 초기화"""
+        self.stage = "queued"
+        self.started_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """실행 시작 후 경과 시간 (초)"""
+        return time.monotonic() - self.started_at
+
+
+# 현재 컨텍스트의 실행 추적기 (없으면 None)
+_current_run: ContextVar[Optional[RunTracker]] = ContextVar("food_reco_run", default=None)
+
+
+@contextmanager
+def track_run() -> Iterator[RunTracker]:
+    """
+    컨텍스트 안에서 시작하는 워크플로우 실행의 단계를 추적합니다.
+    (태스크를 만들기 전에 진입해야 태스크에 추적기가 전달됨)
+
+    Yields:
+        RunTracker: 실행 추적기
+    """
+    tracker = RunTracker()
+    token = _current_run.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_run.reset(token)
+
+
+def set_stage(stage: str) -> None:
+    """
+    현재 실행의 단계를 기록합니다 (추적 중이 아니면 아무 것도 하지 않음).
+
+    Args:
+        stage (str): 단계 이름 (노드 이름 등)
+    """
+    tracker = _current_run.get()
+    if tracker is not None:
+        tracker.stage = stage
+
+
+def current_stage() -> Optional[str]:
+    """
+    현재 실행의 단계를 반환합니다.
+
+    Returns:
+        Optional[str]: 단계 이름 (추적 중이 아니면 None)
+    """
+    tracker = _current_run.get()
+    return tracker.stage if tracker is not None else None
+
+
+class CancellationStats:
+    """클라이언트 연결 끊김으로 취소된 실행 수를 단계별로 집계합니다."""
+
+    def __init__(self):
+        """CancellationStats 초기화"""
+        self._lock = threading.Lock()
+        self._by_stage: Counter = Counter()
+        self._total_elapsed = 0.0
+        self._counter = metrics_registry.counter(
+            "food_reco_cancellations_total", "클라이언트 연결 끊김으로 취소된 실행 수", ["stage"]
+        )
+
+    def record(self, tracker: RunTracker) -> None:
+        """
+        취소된 실행 하나를 기록합니다.
+
+        Args:
+            tracker (RunTracker): 취소된 실행의 추적기
+        """
+        with self._lock:
+            self._by_stage[tracker.stage] += 1
+            self._total_elapsed += tracker.elapsed
+        self._counter.labels(tracker.stage).inc()
+        print(f"⚠️ 클라이언트 연결이 끊겨 실행을 취소했습니다 (단계: {tracker.stage}, {tracker.elapsed:.2f}초 경과)")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        취소 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 전체 취소 수, 단계별 취소 수, 취소 전까지의 평균 실행 시간(ms)
+        """
+        with self._lock:
+            total = sum(self._by_stage.values())
+            return {
+                "total": total,
+                "by_stage": dict(self._by_stage),
+                "avg_elapsed_ms": self._total_elapsed / total * 1000 if total else 0.0,
+            }
+
+
+# 프로세스 전역 취소 통계
+cancellation_stats = CancellationStats()
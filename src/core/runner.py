@@ -0,0 +1,123 @@
+"""
+워크플로우 실행기
+
+LangGraph 워크플로우를 실행하는 진입점입니다.
+DB_UNIT_OF_WORK가 켜져 있으면 실행 한 번의 모든 저장 작업을 하나의 트랜잭션으로 묶어
+그래프가 끝날 때(recommend_restaurants 또는 handle_error 어느 쪽으로 끝나든) 한 번만 커밋합니다.
+astream_workflow는 노드가 내보내는 중간 결과(검색 결과, LLM 토큰)를 실행 중에 전달합니다.
+초기 상태에 사용자 입력과 마감 시각(deadline_at)이 있으면 그대로, 마감 시각만 없으면 REQUEST_DEADLINE_SECONDS 뒤로 설정합니다.
+사용자 입력이 없으면(CLI) 입력을 받는 시간이 제한 시간에 포함되지 않도록 analyze_user_preferences에서 설정합니다.
+"""
+
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+from .graph import app as workflow_app
+from .graph_types import GraphState
+from .nodes import _has_user_input
+from ..database import UnitOfWork, unit_of_work_enabled
+from ..utils.deadline import deadline_after
+from .run_tracking import set_stage
+
+
+def _with_deadline(initial_state: Dict[str, Any]) -> Dict[str, Any]:
+    """초기 상태에 사용자 입력이 있고 마감 시각이 없으면 설정합니다."""
+    if "deadline_at" in initial_state or not _has_user_input(initial_state):
+        return initial_state
+    return {**initial_state, "deadline_at": deadline_after(), "degraded": []}
+
+
+def run_workflow(initial_state: Dict[str, Any], unit_of_work: Optional[bool] = None) -> GraphState:
+    """
+    워크플로우를 동기적으로 실행합니다.
+
+    Args:
+        initial_state (Dict[str, Any]): 초기 상태
+        unit_of_work (bool, optional): 실행 단위 트랜잭션 사용 여부. None이면 DB_UNIT_OF_WORK 사용
+
+    Returns:
+        GraphState: 최종 상태
+    """
+    if unit_of_work is None:
+        unit_of_work = unit_of_work_enabled()
+    initial_state = _with_deadline(initial_state)
+
+    if not unit_of_work:
+        return workflow_app.invoke(initial_state)
+
+    with UnitOfWork():
+        final_state = workflow_app.invoke(initial_state)
+        set_stage("commit")
+        return final_state
+
+
+async def arun_workflow(initial_state: Dict[str, Any], unit_of_work: Optional[bool] = None) -> GraphState:
+    """
+    run_workflow의 비동기 버전
+
+    Args:
+        initial_state (Dict[str, Any]): 초기 상태
+        unit_of_work (bool, optional): 실행 단위 트랜잭션 사용 여부. None이면 DB_UNIT_OF_WORK 사용
+
+    Returns:
+        GraphState: 최종 상태
+    """
+    if unit_of_work is None:
+        unit_of_work = unit_of_work_enabled()
+    initial_state = _with_deadline(initial_state)
+
+    if not unit_of_work:
+        return await workflow_app.ainvoke(initial_state)
+
+    async with UnitOfWork():
+        final_state = await workflow_app.ainvoke(initial_state)
+        set_stage("commit")
+        return final_state
+
+
+async def _astream_graph(initial_state: Dict[str, Any]) -> AsyncIterator[Tuple[str, Any]]:
+    """그래프를 실행하면서 노드의 중간 결과 이벤트를 전달하고, 마지막에 최종 상태를 전달합니다."""
+    final_state: Dict[str, Any] = dict(initial_state)
+    async for mode, chunk in workflow_app.astream(initial_state, stream_mode=["custom", "values"]):
+        if mode == "custom":
+            yield chunk["event"], chunk["data"]
+        else:
+            final_state = chunk
+    yield "final_state", final_state
+
+
+async def astream_workflow(initial_state: Dict[str, Any],
+                           unit_of_work: Optional[bool] = None) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    워크플로우를 실행하면서 중간 결과를 (이벤트 이름, 데이터)로 전달합니다.
+
+    - ("search_results", 검색 결과 목록): 맛집 검색 직후
+    - ("token", 텍스트 조각): Gemini 응답이 생성되는 대로
+    - ("final_state", 최종 상태): 모든 노드와 저장이 끝난 뒤 (실행 단위 트랜잭션이면 커밋 후)
+
+    Args:
+        initial_state (Dict[str, Any]): 초기 상태
+        unit_of_work (bool, optional): 실행 단위 트랜잭션 사용 여부. None이면 DB_UNIT_OF_WORK 사용
+
+    Yields:
+        Tuple[str, Any]: (이벤트 이름, 데이터)
+    """
+    if unit_of_work is None:
+        unit_of_work = unit_of_work_enabled()
+
+    initial_state = {**_with_deadline(initial_state), "stream_tokens": True}
+
+    if not unit_of_work:
+        async for event in _astream_graph(initial_state):
+            yield event
+        return
+
+    # final_state는 커밋이 끝난 뒤에 전달 (클라이언트가 받은 session_id로 바로 조회할 수 있도록)
+    final_state = None
+    async with UnitOfWork():
+        async for event, data in _astream_graph(initial_state):
+            if event == "final_state":
+                final_state = data
+                set_stage("commit")
+            else:
+                yield event, data
+    yield "final_state", final_state
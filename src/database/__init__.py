@@ -4,16 +4,31 @@ Database module for food recommendation agent
 이 모듈은 데이터베이스 연결, 모델, 쿼리 관련 기능을 제공합니다.
 """
 
-from .models import Base, UserSession, SearchResult, Recommendation
-from .connection import get_session, get_db, test_database_connection, db_manager
-from .queries import orm_query_examples
+from .models import Base, UserSession, SearchResult, Recommendation, StatsDailyRollup
+from .connection import get_session, get_db, test_database_connection, db_manager, get_pool_stats, db_limiter
+from .queries import (
+    orm_query_examples,
+    get_session_detail,
+    count_rows,
+    get_sessions_page,
+    iter_sessions,
+    encode_cursor,
+    decode_cursor
+)
 from .storage_service import (
     StorageService, 
     save_user_session, 
     save_search_results, 
     save_recommendation, 
-    save_complete_session
+    save_complete_session,
+    UnitOfWork,
+    current_unit_of_work,
+    unit_of_work_enabled,
+    install_write_behind
 )
+from .write_behind import WriteBehindWriter, SessionIdAllocator, write_behind_enabled
+from .migrations import MIGRATIONS, run_migrations, get_current_version
+from .stats_rollup import StatsRollup, stats_rollup, read_statistics, backfill_rollups
 
 __all__ = [
     # 모델
@@ -21,17 +36,43 @@ __all__ = [
     "UserSession",
     "SearchResult", 
     "Recommendation",
+    "StatsDailyRollup",
     # 연결 관리
     "get_session",
     "get_db",
     "test_database_connection",
     "db_manager",
+    "get_pool_stats",
+    "db_limiter",
     # 쿼리 예제
     "orm_query_examples",
+    "get_session_detail",
+    "count_rows",
+    "get_sessions_page",
+    "iter_sessions",
+    "encode_cursor",
+    "decode_cursor",
     # 저장 서비스
     "StorageService",
     "save_user_session",
     "save_search_results", 
     "save_recommendation",
-    "save_complete_session"
+    "save_complete_session",
+    "UnitOfWork",
+    "current_unit_of_work",
+    "unit_of_work_enabled",
+    "install_write_behind",
+    # write-behind 저장
+    "WriteBehindWriter",
+    "SessionIdAllocator",
+    "write_behind_enabled",
+    # 마이그레이션
+    "MIGRATIONS",
+    "run_migrations",
+    "get_current_version",
+    # 통계 집계
+    "StatsRollup",
+    "stats_rollup",
+    "read_statistics",
+    "backfill_rollups"
 ]
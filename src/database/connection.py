@@ -6,15 +6,84 @@
 """
 
 import os
-from typing import Generator
+import threading
+import time
+from typing import Any, Dict, Generator
 from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from dotenv import load_dotenv
 
+from ..utils.concurrency import ConcurrencyLimiter
+
 # 환경변수 로드
 load_dotenv()
 
 
+class PoolWaitStats:
+    """
+    커넥션 체크아웃 대기 시간 통계
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, timed_out: bool) -> None:
+        """체크아웃 한 번의 대기 시간을 기록합니다."""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 통계를 딕셔너리로 반환합니다."""
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "checkout_wait_total_seconds": self.total_wait,
+                "checkout_wait_avg_seconds": (self.total_wait / attempts) if attempts else 0.0,
+                "checkout_wait_max_seconds": self.max_wait,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    풀에서 커넥션을 꺼낼 때까지 기다린 시간을 기록하는 QueuePool
+    """
+
+    wait_stats: PoolWaitStats
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        self.wait_stats.record(time.perf_counter() - start, timed_out=False)
+        return connection
+
+    def recreate(self):
+        # 풀을 재생성(dispose)해도 누적 통계는 유지
+        new_pool = super().recreate()
+        new_pool.wait_stats = self.wait_stats
+        return new_pool
+
+
 class DatabaseManager:
     """
     데이터베이스 연결 및 세션을 관리하는 클래스
@@ -34,8 +103,30 @@ class DatabaseManager:
             f'@{self.host}:{self.port}/{self.database}'
         )
         
+        # 커넥션 풀 설정 (워커 수에 맞춰 환경변수로 조정)
+        self.pool_size = int(os.getenv('DB_POOL_SIZE', '5'))
+        self.max_overflow = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+        self.pool_timeout = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+        self.pool_recycle = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+        self.pool_pre_ping = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+        self.statement_timeout_ms = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '0'))
+        
+        connect_args = {}
+        if self.statement_timeout_ms > 0:
+            # 서버 측에서 오래 걸리는 쿼리를 중단
+            connect_args['options'] = f'-c statement_timeout={self.statement_timeout_ms}'
+        
         # 엔진 및 세션 팩토리 생성
-        self.engine = create_engine(self.database_url)
+        self.engine = create_engine(
+            self.database_url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_timeout=self.pool_timeout,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=self.pool_pre_ping,
+            connect_args=connect_args
+        )
         self.SessionLocal = sessionmaker(bind=self.engine)
     
     def get_session(self) -> Session:
@@ -60,6 +151,30 @@ class DatabaseManager:
         finally:
             session.close()
     
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        커넥션 풀 상태와 체크아웃 대기 시간 통계를 반환합니다.
+        
+        Returns:
+            Dict[str, Any]: 풀 크기, 사용 중/유휴 커넥션 수, overflow, 대기 시간 통계
+        """
+        pool = self.engine.pool
+        stats = {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+        }
+        if isinstance(pool, QueuePool):
+            stats.update({
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        wait_stats = getattr(pool, "wait_stats", None)
+        if wait_stats is not None:
+            stats.update(wait_stats.snapshot())
+        return stats
+    
     def test_connection(self) -> bool:
         """
         데이터베이스 연결을 테스트합니다.
@@ -80,6 +195,10 @@ class DatabaseManager:
 # 전역 데이터베이스 매니저 인스턴스
 db_manager = DatabaseManager()
 
+# 비동기 경로에서 DB 작업을 스레드 풀에 넘길 때의 동시 실행 수 상한
+# (커넥션 풀이 비기를 기다리며 실행기 스레드를 점유하지 않도록 그 앞에서 대기)
+db_limiter = ConcurrencyLimiter("db", int(os.getenv("DB_MAX_CONCURRENCY", "10")))
+
 # 편의를 위한 함수들
 def get_db() -> Generator[Session, None, None]:
     """
@@ -101,6 +220,16 @@ def get_session() -> Session:
     return db_manager.get_session()
 
 
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    커넥션 풀 통계를 조회하는 함수
+    
+    Returns:
+        Dict[str, Any]: 커넥션 풀 통계
+    """
+    return db_manager.pool_stats()
+
+
 def test_database_connection() -> bool:
     """
     데이터베이스 연결을 테스트하는 함수
@@ -0,0 +1,174 @@
+"""
+데이터베이스 스키마 마이그레이션
+
+create_all()은 없는 테이블만 만들 뿐 기존 테이블에 인덱스/외래 키/기본값을 추가하지 않습니다.
+이 모듈은 버전이 매겨진 마이그레이션 목록을 순서대로 적용하고,
+적용된 버전을 food_reco.schema_migrations 테이블에 기록합니다.
+
+모든 마이그레이션은 여러 번 실행해도 안전하도록(IF NOT EXISTS 등) 작성합니다.
+create_all()로 새로 만든 테이블에는 이미 반영된 변경이 있을 수 있기 때문입니다.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from .connection import db_manager
+
+SCHEMA = "food_reco"
+
+# 여러 프로세스(API 워커 등)가 동시에 마이그레이션하지 않도록 잡는 advisory lock 키
+MIGRATION_LOCK_KEY = 72_013_011
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    마이그레이션 하나
+
+    Attributes:
+        version (int): 버전 번호 (오름차순으로 적용)
+        description (str): 설명
+        statements (Tuple[str, ...]): 실행할 SQL 문 목록 (한 트랜잭션에서 실행)
+    """
+    version: int
+    description: str
+    statements: Tuple[str, ...]
+
+
+def _add_foreign_key(table: str, name: str) -> str:
+    """
+    session_id → user_session.id 외래 키를 NOT VALID로 추가하는 SQL을 만듭니다.
+
+    NOT VALID로 추가하면 기존 행을 검사하지 않으므로 테이블을 오래 잠그지 않습니다.
+    기존 행 검증은 이후 마이그레이션의 VALIDATE CONSTRAINT에서 수행합니다.
+    """
+    return f"""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{name}') THEN
+                ALTER TABLE {SCHEMA}.{table}
+                    ADD CONSTRAINT {name} FOREIGN KEY (session_id)
+                    REFERENCES {SCHEMA}.user_session (id) ON DELETE CASCADE NOT VALID;
+            END IF;
+        END $$;
+    """
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "조회/집계용 인덱스 추가", (
+        f"CREATE INDEX IF NOT EXISTS ix_user_session_created_at ON {SCHEMA}.user_session (created_at, id)",
+        f"CREATE INDEX IF NOT EXISTS ix_user_session_location_cuisine "
+        f"ON {SCHEMA}.user_session (location, cuisine_preference)",
+        f"CREATE INDEX IF NOT EXISTS ix_user_session_cuisine ON {SCHEMA}.user_session (cuisine_preference)",
+        f"CREATE INDEX IF NOT EXISTS ix_search_result_session_id ON {SCHEMA}.search_result (session_id)",
+        f"CREATE INDEX IF NOT EXISTS ix_search_result_created_at ON {SCHEMA}.search_result (created_at)",
+        f"CREATE INDEX IF NOT EXISTS ix_recommendation_session_id ON {SCHEMA}.recommendation (session_id)",
+        f"CREATE INDEX IF NOT EXISTS ix_recommendation_created_at ON {SCHEMA}.recommendation (created_at)",
+    )),
+    Migration(2, "created_at 서버 기본값(now()) 설정", (
+        f"ALTER TABLE {SCHEMA}.user_session ALTER COLUMN created_at SET DEFAULT now()",
+        f"ALTER TABLE {SCHEMA}.search_result ALTER COLUMN created_at SET DEFAULT now()",
+        f"ALTER TABLE {SCHEMA}.recommendation ALTER COLUMN created_at SET DEFAULT now()",
+    )),
+    Migration(3, "session_id 외래 키 추가 (NOT VALID)", (
+        _add_foreign_key("search_result", "fk_search_result_session_id"),
+        _add_foreign_key("recommendation", "fk_recommendation_session_id"),
+    )),
+    Migration(4, "고아 행 정리 후 외래 키 검증", (
+        # 세션이 저장되지 않은 채 남은 행(session_id 0 등)은 연결을 끊어 검증이 실패하지 않도록 함
+        f"UPDATE {SCHEMA}.search_result r SET session_id = NULL WHERE session_id IS NOT NULL "
+        f"AND NOT EXISTS (SELECT 1 FROM {SCHEMA}.user_session s WHERE s.id = r.session_id)",
+        f"UPDATE {SCHEMA}.recommendation r SET session_id = NULL WHERE session_id IS NOT NULL "
+        f"AND NOT EXISTS (SELECT 1 FROM {SCHEMA}.user_session s WHERE s.id = r.session_id)",
+        f"ALTER TABLE {SCHEMA}.search_result VALIDATE CONSTRAINT fk_search_result_session_id",
+        f"ALTER TABLE {SCHEMA}.recommendation VALIDATE CONSTRAINT fk_recommendation_session_id",
+        f"ANALYZE {SCHEMA}.user_session",
+        f"ANALYZE {SCHEMA}.search_result",
+        f"ANALYZE {SCHEMA}.recommendation",
+    )),
+    Migration(5, "일별 통계 집계 테이블 추가 (이후 backfill_stats.py로 채움)", (
+        f"CREATE TABLE IF NOT EXISTS {SCHEMA}.stats_daily_rollup ("
+        f"id SERIAL PRIMARY KEY, "
+        f"day DATE NOT NULL, "
+        f"dimension VARCHAR NOT NULL, "
+        f"value VARCHAR NOT NULL, "
+        f"count INTEGER NOT NULL, "
+        f"CONSTRAINT uq_stats_daily_rollup_key UNIQUE (day, dimension, value))",
+    )),
+]
+
+
+def _ensure_migration_table(conn) -> None:
+    """버전 기록 테이블이 없으면 생성합니다."""
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {SCHEMA}.schema_migrations ("
+        f"version INTEGER PRIMARY KEY, "
+        f"description TEXT NOT NULL, "
+        f"applied_at TIMESTAMP NOT NULL DEFAULT now())"
+    ))
+
+
+def get_current_version(engine: Optional[Engine] = None) -> int:
+    """
+    적용된 마지막 마이그레이션 버전을 조회합니다.
+
+    Args:
+        engine (Engine, optional): 대상 엔진 (기본값: db_manager.engine)
+
+    Returns:
+        int: 마지막 버전 (적용된 마이그레이션이 없으면 0)
+    """
+    engine = engine or db_manager.engine
+    with engine.begin() as conn:
+        _ensure_migration_table(conn)
+        version = conn.execute(text(f"SELECT max(version) FROM {SCHEMA}.schema_migrations")).scalar()
+    return version or 0
+
+
+def run_migrations(engine: Optional[Engine] = None, target: Optional[int] = None) -> List[int]:
+    """
+    아직 적용되지 않은 마이그레이션을 버전 순서대로 적용합니다.
+
+    마이그레이션마다 별도 트랜잭션에서 실행하므로 중간에 실패하면
+    그 이전 버전까지는 적용된 상태로 남고, 다음 실행 시 실패한 버전부터 다시 시도합니다.
+
+    Args:
+        engine (Engine, optional): 대상 엔진 (기본값: db_manager.engine)
+        target (int, optional): 이 버전까지만 적용 (기본값: 최신 버전)
+
+    Returns:
+        List[int]: 이번에 적용된 버전 목록
+
+    Raises:
+        Exception: 마이그레이션 SQL 실행 실패
+    """
+    engine = engine or db_manager.engine
+    applied = []
+
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if target is not None and migration.version > target:
+            break
+
+        with engine.begin() as conn:
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            _ensure_migration_table(conn)
+            already_applied = conn.execute(
+                text(f"SELECT 1 FROM {SCHEMA}.schema_migrations WHERE version = :version"),
+                {"version": migration.version}
+            ).first()
+            if already_applied:
+                continue
+
+            print(f"마이그레이션 {migration.version} 적용 중: {migration.description}")
+            for statement in migration.statements:
+                conn.execute(text(statement))
+            conn.execute(
+                text(f"INSERT INTO {SCHEMA}.schema_migrations (version, description) VALUES (:version, :description)"),
+                {"version": migration.version, "description": migration.description}
+            )
+            applied.append(migration.version)
+
+    return applied
@@ -5,8 +5,8 @@
 각 클래스는 해당하는 데이터베이스 테이블과 매핑됩니다.
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, JSON
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import Column, Integer, String, Date, DateTime, Float, Text, JSON, ForeignKey, Index, UniqueConstraint, func
+from sqlalchemy.orm import declarative_base, relationship
 
 # 모든 모델 클래스의 기본 클래스
 Base = declarative_base()
@@ -30,9 +30,18 @@ class UserSession(Base):
         ambiance (str): 원하는 분위기
         special_requirements (str): 특별 요구사항
         created_at (datetime): 생성일시
+        search_results (List[SearchResult]): 세션의 검색 결과 (조회 전용)
+        recommendations (List[Recommendation]): 세션의 추천 결과 (조회 전용)
     """
     __tablename__ = 'user_session'
-    __table_args__ = {'schema': 'food_reco'}
+    __table_args__ = (
+        # 최근 세션 조회(created_at DESC) 및 (created_at, id) 키셋 페이지네이션용
+        Index('ix_user_session_created_at', 'created_at', 'id'),
+        # 지역/음식 종류별 집계(GROUP BY)용
+        Index('ix_user_session_location_cuisine', 'location', 'cuisine_preference'),
+        Index('ix_user_session_cuisine', 'cuisine_preference'),
+        {'schema': 'food_reco'}
+    )
     
     id = Column(Integer, primary_key=True)
     age = Column(Integer)
@@ -42,7 +51,11 @@ class UserSession(Base):
     companion_type = Column(String)
     ambiance = Column(String)
     special_requirements = Column(Text)
-    created_at = Column(DateTime)
+    created_at = Column(DateTime, server_default=func.now())
+
+    # 조회 전용 관계 (저장은 StorageService가 session_id로 직접 수행)
+    search_results = relationship('SearchResult', order_by='SearchResult.id', viewonly=True)
+    recommendations = relationship('Recommendation', order_by='Recommendation.id', viewonly=True)
 
     def __repr__(self) -> str:
         """객체의 문자열 표현을 반환합니다."""
@@ -64,16 +77,23 @@ class SearchResult(Base):
         created_at (datetime): 생성일시
     """
     __tablename__ = 'search_result'
-    __table_args__ = {'schema': 'food_reco'}
+    __table_args__ = (
+        Index('ix_search_result_session_id', 'session_id'),
+        Index('ix_search_result_created_at', 'created_at'),
+        {'schema': 'food_reco'}
+    )
     
     id = Column(Integer, primary_key=True)
-    session_id = Column(Integer)
+    session_id = Column(
+        Integer,
+        ForeignKey('food_reco.user_session.id', ondelete='CASCADE', name='fk_search_result_session_id')
+    )
     title = Column(String)
     description = Column(Text)
     link = Column(String)
     source = Column(String)
     cuisine_preference = Column(String)
-    created_at = Column(DateTime)
+    created_at = Column(DateTime, server_default=func.now())
 
     def __repr__(self) -> str:
         """객체의 문자열 표현을 반환합니다."""
@@ -93,15 +113,51 @@ class Recommendation(Base):
         created_at (datetime): 생성일시
     """
     __tablename__ = 'recommendation'
-    __table_args__ = {'schema': 'food_reco'}
+    __table_args__ = (
+        Index('ix_recommendation_session_id', 'session_id'),
+        Index('ix_recommendation_created_at', 'created_at'),
+        {'schema': 'food_reco'}
+    )
     
     id = Column(Integer, primary_key=True)
-    session_id = Column(Integer)
+    session_id = Column(
+        Integer,
+        ForeignKey('food_reco.user_session.id', ondelete='CASCADE', name='fk_recommendation_session_id')
+    )
     recommendation_text = Column(Text)
     ai_model = Column(String)
-    created_at = Column(DateTime)
+    created_at = Column(DateTime, server_default=func.now())
 
     def __repr__(self) -> str:
         """객체의 문자열 표현을 반환합니다."""
         return (f"<Recommendation(id={self.id}, session_id={self.session_id}, "
                 f"ai_model={self.ai_model}, created_at={self.created_at})>")
+
+
+class StatsDailyRollup(Base):
+    """
+    일별 통계 집계 테이블 (저장 시점에 증분 갱신)
+    
+    Attributes:
+        id (int): 집계 행 고유 ID (Primary Key)
+        day (date): 집계 날짜
+        dimension (str): 집계 차원 (sessions, recommendations, location, cuisine_preference, companion_type, ambiance)
+        value (str): 차원 값 (sessions/recommendations는 빈 문자열)
+        count (int): 건수
+    """
+    __tablename__ = 'stats_daily_rollup'
+    __table_args__ = (
+        UniqueConstraint('day', 'dimension', 'value', name='uq_stats_daily_rollup_key'),
+        {'schema': 'food_reco'}
+    )
+    
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False)
+    dimension = Column(String, nullable=False)
+    value = Column(String, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """객체의 문자열 표현을 반환합니다."""
+        return (f"<StatsDailyRollup(day={self.day}, dimension={self.dimension}, "
+                f"value={self.value}, count={self.count})>")
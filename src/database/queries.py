@@ -5,8 +5,11 @@ SQLAlchemy ORM 쿼리 예제 모음
 실제 프로덕션 코드에서는 이 예제들을 참고하여 필요한 쿼리를 작성하세요.
 """
 
-from sqlalchemy import and_, or_, func
-from sqlalchemy.orm import Session
+import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import and_, or_, func, select, tuple_
+from sqlalchemy.orm import Session, selectinload
 
 # 모듈화된 데이터베이스 관련 클래스들을 import
 try:
@@ -25,10 +28,11 @@ def orm_query_examples():
     try:
         print("=== SQLAlchemy ORM 쿼리 예제 ===\n")
         
-        # 1. READ - 모든 사용자 세션 조회
+        # 1. READ - 모든 사용자 세션 조회 (yield_per로 나눠 읽어 메모리 사용량 일정)
         print("1. READ - 모든 사용자 세션 조회")
-        all_sessions = session.query(UserSession).all()
-        for session_data in all_sessions:
+        for session_data in session.execute(
+            select(UserSession).execution_options(yield_per=1000)
+        ).scalars():
             print(f"  {session_data}")
         print()
         
@@ -71,8 +75,8 @@ def orm_query_examples():
         sessions_by_age = session.query(UserSession).order_by(UserSession.age.desc()).all()
         print(f"나이 내림차순 세션들: {sessions_by_age}")
         
-        # 생성일시순 정렬
-        sessions_by_date = session.query(UserSession).order_by(UserSession.created_at.desc()).all()
+        # 생성일시순 정렬 (최근 10개, 페이지 단위 조회는 get_sessions_page 참고)
+        sessions_by_date = session.query(UserSession).order_by(UserSession.created_at.desc()).limit(10).all()
         print(f"최신 생성 세션들: {sessions_by_date}")
         print()
         
@@ -94,39 +98,40 @@ def orm_query_examples():
         
         # 6. READ - 검색 결과 조회
         print("6. READ - 검색 결과 조회")
-        all_search_results = session.query(SearchResult).all()
-        print(f"전체 검색 결과 수: {len(all_search_results)}")
+        # 개수만 필요하면 객체를 불러오지 않고 COUNT(*)로 조회
+        print(f"전체 검색 결과 수: {count_rows(session, SearchResult)}")
         
         # 네이버 검색 결과만 조회
-        naver_results = session.query(SearchResult).filter(SearchResult.source == 'naver').all()
-        print(f"네이버 검색 결과 수: {len(naver_results)}")
+        naver_count = count_rows(session, SearchResult, SearchResult.source == 'naver')
+        print(f"네이버 검색 결과 수: {naver_count}")
         print()
         
         # 7. READ - 추천 결과 조회
         print("7. READ - 추천 결과 조회")
-        all_recommendations = session.query(Recommendation).all()
-        print(f"전체 추천 결과 수: {len(all_recommendations)}")
+        print(f"전체 추천 결과 수: {count_rows(session, Recommendation)}")
         
         # Gemini 모델로 생성된 추천만 조회
-        gemini_recommendations = session.query(Recommendation).filter(
-            Recommendation.ai_model == 'gemini-2.0-flash'
-        ).all()
-        print(f"Gemini 추천 결과 수: {len(gemini_recommendations)}")
+        gemini_count = count_rows(session, Recommendation, Recommendation.ai_model == 'gemini-2.0-flash')
+        print(f"Gemini 추천 결과 수: {gemini_count}")
         print()
         
         # 8. READ - JOIN 쿼리 (세션과 검색 결과 연결)
         print("8. READ - JOIN 쿼리")
-        # 세션과 검색 결과를 함께 조회
-        sessions_with_results = session.query(UserSession, SearchResult).join(
-            SearchResult, UserSession.id == SearchResult.session_id
-        ).all()
-        print(f"검색 결과가 있는 세션 수: {len(sessions_with_results)}")
+        # 세션과 검색 결과를 함께 조회 (행 수만 필요하므로 JOIN 결과를 COUNT)
+        joined_results = session.execute(
+            select(func.count()).select_from(UserSession).join(
+                SearchResult, UserSession.id == SearchResult.session_id
+            )
+        ).scalar()
+        print(f"세션-검색 결과 JOIN 행 수: {joined_results}")
         
         # 세션과 추천 결과를 함께 조회
-        sessions_with_recommendations = session.query(UserSession, Recommendation).join(
-            Recommendation, UserSession.id == Recommendation.session_id
-        ).all()
-        print(f"추천 결과가 있는 세션 수: {len(sessions_with_recommendations)}")
+        joined_recommendations = session.execute(
+            select(func.count()).select_from(UserSession).join(
+                Recommendation, UserSession.id == Recommendation.session_id
+            )
+        ).scalar()
+        print(f"세션-추천 결과 JOIN 행 수: {joined_recommendations}")
         print()
         
         # 9. READ - 그룹화 (GROUP BY)
@@ -153,20 +158,16 @@ def orm_query_examples():
         # 10. READ - 서브쿼리
         print("10. READ - 서브쿼리")
         # 검색 결과가 있는 세션들만 조회
-        sessions_with_search = session.query(UserSession).filter(
-            UserSession.id.in_(
-                session.query(SearchResult.session_id).distinct()
-            )
-        ).all()
-        print(f"검색 결과가 있는 세션 수: {len(sessions_with_search)}")
+        sessions_with_search = count_rows(
+            session, UserSession, UserSession.id.in_(select(SearchResult.session_id))
+        )
+        print(f"검색 결과가 있는 세션 수: {sessions_with_search}")
         
         # 추천 결과가 있는 세션들만 조회
-        sessions_with_recommendation = session.query(UserSession).filter(
-            UserSession.id.in_(
-                session.query(Recommendation.session_id).distinct()
-            )
-        ).all()
-        print(f"추천 결과가 있는 세션 수: {len(sessions_with_recommendation)}")
+        sessions_with_recommendation = count_rows(
+            session, UserSession, UserSession.id.in_(select(Recommendation.session_id))
+        )
+        print(f"추천 결과가 있는 세션 수: {sessions_with_recommendation}")
         print()
         
         print("=== 쿼리 예제 완료 ===")
@@ -176,6 +177,137 @@ def orm_query_examples():
     finally:
         session.close()
 
+def count_rows(session: Session, model, *criteria) -> int:
+    """
+    조건에 맞는 행 수를 ORM 객체를 불러오지 않고 COUNT(*)로 조회합니다.
+
+    Args:
+        session (Session): 데이터베이스 세션
+        model: 대상 모델 클래스
+        *criteria: WHERE 조건
+
+    Returns:
+        int: 행 수
+    """
+    return session.execute(select(func.count()).select_from(model).where(*criteria)).scalar()
+
+def encode_cursor(created_at: datetime.datetime, session_id: int) -> str:
+    """
+    키셋 페이지네이션 커서를 "<created_at ISO 8601>,<id>" 형식으로 만듭니다.
+
+    Args:
+        created_at (datetime.datetime): 마지막 행의 생성일시
+        session_id (int): 마지막 행의 ID
+
+    Returns:
+        str: 커서 문자열
+    """
+    return f"{created_at.isoformat()},{session_id}"
+
+def decode_cursor(cursor: str) -> Tuple[datetime.datetime, int]:
+    """
+    encode_cursor로 만든 커서를 (created_at, id)로 되돌립니다.
+
+    Args:
+        cursor (str): 커서 문자열
+
+    Returns:
+        Tuple[datetime.datetime, int]: (생성일시, ID)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    created_at, separator, session_id = cursor.rpartition(",")
+    if not separator:
+        raise ValueError(f"잘못된 커서 형식입니다: {cursor}")
+    return datetime.datetime.fromisoformat(created_at), int(session_id)
+
+def session_summary(user_session: UserSession) -> Dict[str, Any]:
+    """
+    세션 목록 응답에 쓰는 세션 요약 딕셔너리를 만듭니다.
+
+    Args:
+        user_session (UserSession): 사용자 세션
+
+    Returns:
+        Dict[str, Any]: 세션 요약
+    """
+    return {
+        'session_id': user_session.id,
+        'age': user_session.age,
+        'cuisine_preference': user_session.cuisine_preference,
+        'weather': user_session.weather,
+        'location': user_session.location,
+        'companion_type': user_session.companion_type,
+        'ambiance': user_session.ambiance,
+        'special_requirements': user_session.special_requirements,
+        'created_at': user_session.created_at,
+    }
+
+def _sessions_newest_first(after: Optional[Tuple[datetime.datetime, int]] = None):
+    """(created_at, id) 내림차순 세션 조회 쿼리 (ix_user_session_created_at 인덱스 사용)"""
+    query = select(UserSession).where(UserSession.created_at.isnot(None)).order_by(
+        UserSession.created_at.desc(), UserSession.id.desc()
+    )
+    if after is not None:
+        # OFFSET 없이 마지막으로 본 행 다음부터 조회 (페이지 깊이와 무관하게 일정한 비용)
+        query = query.where(tuple_(UserSession.created_at, UserSession.id) < tuple_(*after))
+    return query
+
+def get_sessions_page(after: Optional[str] = None, limit: int = 20) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    최근 세션을 키셋 페이지네이션으로 조회합니다.
+
+    created_at이 없는 세션(마이그레이션 이전 데이터)은 정렬 키가 없으므로 제외됩니다.
+
+    Args:
+        after (str, optional): 이전 페이지의 next_cursor (없으면 첫 페이지)
+        limit (int): 페이지 크기
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Optional[str]]: (세션 요약 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    cursor = decode_cursor(after) if after else None
+    session = get_session()
+
+    try:
+        # 다음 페이지 존재 여부를 알기 위해 한 행 더 조회
+        rows = session.execute(_sessions_newest_first(cursor).limit(limit + 1)).scalars().all()
+        items = [session_summary(row) for row in rows[:limit]]
+        next_cursor = encode_cursor(rows[limit - 1].created_at, rows[limit - 1].id) if len(rows) > limit else None
+        return items, next_cursor
+    finally:
+        session.close()
+
+def iter_sessions(after: Optional[str] = None, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """
+    세션 전체를 최신순으로 스트리밍합니다.
+
+    yield_per로 서버 측 커서에서 batch_size개씩 가져오므로 테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        after (str, optional): 이 커서 다음부터 조회
+        batch_size (int): 한 번에 가져올 행 수
+
+    Yields:
+        Dict[str, Any]: 세션 요약
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    cursor = decode_cursor(after) if after else None
+    session = get_session()
+
+    try:
+        result = session.execute(_sessions_newest_first(cursor).execution_options(yield_per=batch_size))
+        for user_session in result.scalars():
+            yield session_summary(user_session)
+    finally:
+        session.close()
+
 def get_user_statistics():
     """사용자 통계 정보를 조회하는 함수"""
     session = get_session()
@@ -226,10 +358,10 @@ def get_recent_activity(limit=10):
     session = get_session()
     
     try:
-        # 최근 세션들
-        recent_sessions = session.query(UserSession).order_by(
-            UserSession.created_at.desc()
-        ).limit(limit).all()
+        # 최근 세션들 (created_at 인덱스를 역순으로 읽고 limit개에서 멈춤)
+        recent_sessions = session.execute(
+            _sessions_newest_first().limit(limit)
+        ).scalars().all()
         
         # 최근 검색 결과들
         recent_searches = session.query(SearchResult).order_by(
@@ -253,6 +385,64 @@ def get_recent_activity(limit=10):
     finally:
         session.close()
 
+def get_session_detail(session_id: int) -> Optional[Dict[str, Any]]:
+    """
+    세션 정보와 검색 결과, 추천 결과를 함께 조회합니다.
+
+    selectinload로 검색 결과/추천 결과를 각각 IN 쿼리 한 번에 불러오므로
+    결과 수와 관계없이 쿼리는 항상 3번만 실행됩니다 (N+1 없음).
+
+    Args:
+        session_id (int): 세션 ID
+
+    Returns:
+        Optional[Dict[str, Any]]: 세션 상세 정보 (세션이 없으면 None)
+    """
+    session = get_session()
+
+    try:
+        user_session = session.execute(
+            select(UserSession)
+            .options(selectinload(UserSession.search_results), selectinload(UserSession.recommendations))
+            .where(UserSession.id == session_id)
+        ).scalar_one_or_none()
+
+        if user_session is None:
+            return None
+
+        return {
+            'session_id': user_session.id,
+            'user_profile': {
+                'age': user_session.age,
+                'cuisine_preference': user_session.cuisine_preference,
+                'weather': user_session.weather,
+                'location': user_session.location,
+                'companion_type': user_session.companion_type,
+                'ambiance': user_session.ambiance,
+                'special_requirements': user_session.special_requirements,
+            },
+            'search_results': [
+                {
+                    'title': result.title or '',
+                    'description': result.description or '',
+                    'link': result.link or '',
+                    'source': result.source or '',
+                }
+                for result in user_session.search_results
+            ],
+            'recommendations': [
+                {
+                    'recommendation_text': recommendation.recommendation_text or '',
+                    'ai_model': recommendation.ai_model or '',
+                    'created_at': recommendation.created_at,
+                }
+                for recommendation in user_session.recommendations
+            ],
+            'created_at': user_session.created_at,
+        }
+    finally:
+        session.close()
+
 # 직접 실행 시 예제 실행
 if __name__ == "__main__":
     print("데이터베이스 연결 테스트...")
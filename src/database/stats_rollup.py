@@ -0,0 +1,304 @@
+"""
+일별 통계 집계(rollup) 서비스
+
+세션/추천이 저장될 때 일별 차원별 건수를 증분으로 기록하여,
+/stats가 원본 테이블을 집계하지 않고 작은 집계 테이블만 읽도록 합니다.
+
+증분은 저장 트랜잭션이 커밋된 뒤에만 반영되며(롤백되면 버림), 프로세스 안에서 모아 두었다가
+flush_interval마다 한 번의 UPSERT(INSERT ... ON CONFLICT DO UPDATE)로 집계 테이블에 더합니다.
+요청마다 같은 집계 행을 갱신하면 동시 트랜잭션이 그 행의 잠금을 기다리게 되므로 이를 피하기 위함입니다.
+"""
+
+import datetime
+import os
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, event, func, literal, literal_column, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .models import UserSession, Recommendation, StatsDailyRollup
+from .connection import get_session
+
+# (날짜, 차원, 값)
+RollupKey = Tuple[datetime.date, str, str]
+
+# 사용자 세션에서 집계하는 차원
+SESSION_DIMENSIONS = ("location", "cuisine_preference", "companion_type", "ambiance")
+SESSIONS = "sessions"
+RECOMMENDATIONS = "recommendations"
+
+_SESSION_INFO_KEY = "stats_rollup_deltas"
+
+
+def session_rollup_keys(user_data: Dict[str, Any], day: datetime.date) -> List[RollupKey]:
+    """
+    사용자 세션 하나가 증가시키는 집계 키 목록을 만듭니다.
+
+    Args:
+        user_data (Dict[str, Any]): 사용자 입력 데이터
+        day (datetime.date): 집계 날짜
+
+    Returns:
+        List[RollupKey]: 집계 키 목록
+    """
+    keys = [(day, SESSIONS, "")]
+    keys.extend((day, dimension, user_data.get(dimension) or "") for dimension in SESSION_DIMENSIONS)
+    return keys
+
+
+def queue_rollup(session: Session, keys: Iterable[RollupKey]) -> None:
+    """
+    집계 증분을 DB 세션에 기록해 둡니다. 세션이 커밋되면 stats_rollup에 반영되고, 롤백되면 버려집니다.
+
+    Args:
+        session (Session): 저장에 사용 중인 DB 세션
+        keys (Iterable[RollupKey]): 1씩 증가시킬 집계 키
+    """
+    session.info.setdefault(_SESSION_INFO_KEY, Counter()).update(keys)
+
+
+class StatsRollup:
+    """
+    커밋된 집계 증분을 모아 두었다가 주기적으로 집계 테이블에 UPSERT하는 클래스
+
+    - start()로 백그라운드 flush 스레드를 시작 (시작하지 않으면 커밋마다 바로 flush)
+    - flush 실패 시 증분을 버리지 않고 다음 flush에서 다시 시도
+    - shutdown() 시 남은 증분을 flush
+    """
+
+    def __init__(self, flush_interval: float = 5.0):
+        """
+        StatsRollup 초기화
+
+        Args:
+            flush_interval (float): flush 주기 (초)
+        """
+        self.flush_interval = flush_interval
+        self._pending: Counter = Counter()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.flushes = 0
+        self.flushed_rows = 0
+        self.failures = 0
+
+    @property
+    def running(self) -> bool:
+        """백그라운드 flush 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def record(self, deltas: Counter) -> None:
+        """
+        커밋된 집계 증분을 추가합니다.
+
+        Args:
+            deltas (Counter): 집계 키별 증가량
+        """
+        with self._lock:
+            self._pending.update(deltas)
+        if not self.running:
+            # 백그라운드 스레드가 없으면(CLI 실행 등) 바로 반영
+            self.flush()
+
+    def pending(self) -> Counter:
+        """
+        아직 집계 테이블에 반영되지 않은 증분의 복사본을 반환합니다.
+
+        Returns:
+            Counter: 집계 키별 증가량
+        """
+        with self._lock:
+            return Counter(self._pending)
+
+    def flush(self) -> int:
+        """
+        모아 둔 증분을 한 번의 UPSERT로 집계 테이블에 더합니다.
+
+        Returns:
+            int: 반영한 집계 행 수 (실패하면 0)
+        """
+        with self._flush_lock:
+            with self._lock:
+                deltas, self._pending = self._pending, Counter()
+            if not deltas:
+                return 0
+
+            session = get_session()
+            try:
+                _upsert(session, deltas)
+                session.commit()
+                self.flushes += 1
+                self.flushed_rows += len(deltas)
+                return len(deltas)
+            except Exception as e:
+                session.rollback()
+                with self._lock:
+                    self._pending.update(deltas)
+                self.failures += 1
+                print(f"⚠️ 통계 집계 반영 실패 (다음 주기에 재시도): {e}")
+                return 0
+            finally:
+                session.close()
+
+    def start(self) -> None:
+        """백그라운드 flush 스레드를 시작합니다."""
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="food-reco-stats-rollup", daemon=True)
+            self._thread.start()
+
+    def shutdown(self, timeout: Optional[float] = 10.0) -> None:
+        """
+        백그라운드 스레드를 멈추고 남은 증분을 반영합니다.
+
+        Args:
+            timeout (float, optional): 스레드 종료를 기다리는 최대 시간 (초)
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        """flush_interval마다 flush하는 백그라운드 루프"""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        집계 반영 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 대기 중인 키 수, flush 횟수, 반영 행 수, 실패 횟수
+        """
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "running": self.running,
+            "pending_keys": pending,
+            "flushes": self.flushes,
+            "flushed_rows": self.flushed_rows,
+            "failures": self.failures,
+        }
+
+
+def _upsert(session: Session, deltas: Counter) -> None:
+    """집계 키별 증가량을 INSERT ... ON CONFLICT DO UPDATE로 더합니다."""
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    table = StatsDailyRollup.__table__
+    statement = dialect.insert(table).values([
+        {"day": day, "dimension": dimension, "value": value, "count": amount}
+        for (day, dimension, value), amount in sorted(deltas.items())
+    ])
+    session.execute(statement.on_conflict_do_update(
+        index_elements=[table.c.day, table.c.dimension, table.c.value],
+        set_={"count": table.c.count + statement.excluded.count}
+    ))
+
+
+stats_rollup = StatsRollup(flush_interval=float(os.getenv("STATS_ROLLUP_FLUSH_INTERVAL", "5")))
+
+
+@event.listens_for(Session, "after_commit")
+def _record_committed_rollups(session: Session) -> None:
+    """커밋된 트랜잭션의 집계 증분을 stats_rollup에 넘깁니다."""
+    deltas = session.info.pop(_SESSION_INFO_KEY, None)
+    if deltas:
+        stats_rollup.record(deltas)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_rollups(session: Session) -> None:
+    """롤백된 트랜잭션의 집계 증분을 버립니다."""
+    session.info.pop(_SESSION_INFO_KEY, None)
+
+
+def read_statistics(days: Optional[int] = None, top_n: int = 5) -> Dict[str, Any]:
+    """
+    집계 테이블(과 아직 반영되지 않은 증분)에서 통계를 계산합니다.
+
+    원본 테이블은 읽지 않으며, 읽는 행 수는 (일수 x 차원 값 수)에 비례합니다.
+
+    Args:
+        days (int, optional): 최근 며칠만 집계 (None이면 전체 기간)
+        top_n (int): 차원별로 반환할 상위 값 개수
+
+    Returns:
+        Dict[str, Any]: 전체 세션/추천 수와 차원별 인기 값 목록
+    """
+    since = datetime.date.today() - datetime.timedelta(days=days - 1) if days else None
+
+    query = select(
+        StatsDailyRollup.dimension, StatsDailyRollup.value, func.sum(StatsDailyRollup.count)
+    ).group_by(StatsDailyRollup.dimension, StatsDailyRollup.value)
+    if since is not None:
+        query = query.where(StatsDailyRollup.day >= since)
+
+    session = get_session()
+    try:
+        totals = Counter({(dimension, value): int(count) for dimension, value, count in session.execute(query)})
+    finally:
+        session.close()
+
+    for (day, dimension, value), amount in stats_rollup.pending().items():
+        if since is None or day >= since:
+            totals[(dimension, value)] += amount
+
+    def top(dimension: str) -> List[Dict[str, Any]]:
+        values = Counter({value: count for (dim, value), count in totals.items() if dim == dimension and value})
+        return [{"name": value, "count": count} for value, count in values.most_common(top_n)]
+
+    return {
+        "total_sessions": totals[(SESSIONS, "")],
+        "total_recommendations": totals[(RECOMMENDATIONS, "")],
+        "popular_cuisines": top("cuisine_preference"),
+        "popular_locations": top("location"),
+        "popular_companion_types": top("companion_type"),
+        "popular_ambiances": top("ambiance"),
+    }
+
+
+def backfill_rollups() -> int:
+    """
+    원본 테이블 전체를 집계하여 집계 테이블을 다시 만듭니다 (한 트랜잭션).
+
+    실행 중인 서버의 아직 반영되지 않은 증분이 있으면 이중 집계될 수 있으므로
+    트래픽이 적을 때 실행하는 것을 권장합니다.
+
+    Returns:
+        int: 생성된 집계 행 수
+    """
+    table = StatsDailyRollup.__table__
+    columns = [table.c.day, table.c.dimension, table.c.value, table.c.count]
+
+    def rollup_select(model, dimension: str, value_column=None):
+        day = func.coalesce(func.date(model.created_at), func.current_date())
+        if value_column is None:
+            return select(day, literal(dimension), literal_column("''"), func.count()).group_by(day)
+        # NULL과 빈 문자열을 같은 값으로 묶음 (바인드 파라미터 없이 써야 SELECT/GROUP BY 식이 일치)
+        value = func.coalesce(value_column, literal_column("''"))
+        return select(day, literal(dimension), value, func.count()).group_by(day, value)
+
+    selects = [rollup_select(UserSession, SESSIONS), rollup_select(Recommendation, RECOMMENDATIONS)]
+    selects.extend(
+        rollup_select(UserSession, dimension, getattr(UserSession, dimension)) for dimension in SESSION_DIMENSIONS
+    )
+
+    session = get_session()
+    try:
+        session.execute(delete(table))
+        for rollup in selects:
+            session.execute(table.insert().from_select(columns, rollup))
+        count = session.execute(select(func.count()).select_from(table)).scalar()
+        session.commit()
+        return count
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
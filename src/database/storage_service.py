@@ -5,12 +5,21 @@
 """
 
 import datetime
+import os
+from contextvars import ContextVar
 from typing import List, Dict, Any, Optional
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from .models import UserSession, SearchResult, Recommendation
 from .connection import get_session
+from .stats_rollup import RECOMMENDATIONS, queue_rollup, session_rollup_keys
+from ..utils.executor import run_blocking
+from ..utils.metrics import CallMetrics, metrics_registry
+
+# StorageService 메서드별 소요 시간/오류/진행 중 수 (method 레이블)
+storage_metrics = CallMetrics(metrics_registry, "food_reco_storage", "method", "StorageService 메서드 호출")
 
 
 class StorageService:
@@ -45,6 +54,7 @@ class StorageService:
             finally:
                 self.session.close()
     
+    @storage_metrics.instrument("save_user_session")
     def save_user_session(self, user_data: Dict[str, Any]) -> int:
         """
         사용자 세션 정보를 데이터베이스에 저장합니다.
@@ -60,6 +70,7 @@ class StorageService:
         """
         try:
             user_session = UserSession(
+                id=user_data.get('id'),  # 미리 할당된 ID가 있으면 사용 (없으면 시퀀스 기본값)
                 age=user_data.get('age', 0),
                 cuisine_preference=user_data.get('cuisine_preference', ''),
                 weather=user_data.get('weather', ''),
@@ -72,6 +83,8 @@ class StorageService:
             
             self.session.add(user_session)
             self.session.flush()  # ID를 얻기 위해 flush
+            # 일별 통계 증분 (커밋된 경우에만 집계 테이블에 반영)
+            queue_rollup(self.session, session_rollup_keys(user_data, user_session.created_at.date()))
             
             return user_session.id
             
@@ -79,6 +92,7 @@ class StorageService:
             self.session.rollback()
             raise SQLAlchemyError(f"사용자 세션 저장 실패: {e}")
     
+    @storage_metrics.instrument("save_search_results")
     def save_search_results(self, session_id: int, search_results: List[Dict[str, str]], source: str = "naver", cuisine_preference: str = "") -> List[int]:
         """
         검색 결과를 데이터베이스에 저장합니다.
@@ -94,30 +108,38 @@ class StorageService:
         Raises:
             SQLAlchemyError: 데이터베이스 저장 실패 시
         """
+        if not search_results:
+            return []
+
         try:
-            result_ids = []
+            created_at = datetime.datetime.now()
+            rows = [
+                {
+                    'session_id': session_id,
+                    'title': result.get('title', ''),
+                    'description': result.get('description', ''),
+                    'link': result.get('link', ''),
+                    'source': source,
+                    'cuisine_preference': cuisine_preference,
+                    'created_at': created_at
+                }
+                for result in search_results
+            ]
             
-            for result in search_results:
-                search_result = SearchResult(
-                    session_id=session_id,
-                    title=result.get('title', ''),
-                    description=result.get('description', ''),
-                    link=result.get('link', ''),
-                    source=source,
-                    cuisine_preference=cuisine_preference,
-                    created_at=datetime.datetime.now()
-                )
-                
-                self.session.add(search_result)
-                self.session.flush()
-                result_ids.append(search_result.id)
+            # 행마다 flush하지 않고 다중 행 INSERT ... RETURNING id 한 번으로 저장
+            # (sort_by_parameter_order로 입력 순서와 같은 순서의 ID를 보장)
+            result_ids = self.session.scalars(
+                insert(SearchResult).returning(SearchResult.id, sort_by_parameter_order=True),
+                rows
+            ).all()
             
-            return result_ids
+            return list(result_ids)
             
         except SQLAlchemyError as e:
             self.session.rollback()
             raise SQLAlchemyError(f"검색 결과 저장 실패: {e}")
     
+    @storage_metrics.instrument("save_recommendation")
     def save_recommendation(self, session_id: int, recommendation_text: str, ai_model: str = "gemini") -> int:
         """
         추천 결과를 데이터베이스에 저장합니다.
@@ -143,6 +165,7 @@ class StorageService:
             
             self.session.add(recommendation)
             self.session.flush()
+            queue_rollup(self.session, [(recommendation.created_at.date(), RECOMMENDATIONS, "")])
             
             return recommendation.id
             
@@ -150,6 +173,7 @@ class StorageService:
             self.session.rollback()
             raise SQLAlchemyError(f"추천 결과 저장 실패: {e}")
     
+    @storage_metrics.instrument("save_complete_session")
     def save_complete_session(self, user_data: Dict[str, Any], search_results: List[Dict[str, str]], 
                             recommendations: List[str], source: str = "naver", ai_model: str = "gemini") -> Dict[str, int]:
         """
@@ -198,6 +222,140 @@ class StorageService:
             raise SQLAlchemyError(f"전체 세션 저장 실패: {e}")
 
 
+class UnitOfWork:
+    """
+    워크플로우 실행 한 번의 모든 저장 작업을 하나의 세션/트랜잭션으로 묶는 클래스
+
+    컨텍스트 안에서 호출되는 편의 함수(save_user_session 등)는 각자 세션을 열고 커밋하는 대신
+    이 세션을 공유하며, 컨텍스트를 빠져나올 때 한 번만 커밋합니다.
+    중간에 저장이 하나라도 실패하면 이후 저장은 건너뛰고 전체를 롤백합니다.
+
+    사용 예시:
+        with UnitOfWork():
+            workflow_app.invoke(state)
+
+        async with UnitOfWork():
+            await workflow_app.ainvoke(state)
+    """
+
+    def __init__(self):
+        """UnitOfWork 초기화"""
+        self.session: Optional[Session] = None
+        self.failed = False
+        self._token = None
+
+    def _begin(self) -> None:
+        """세션을 열고 현재 컨텍스트에 등록합니다."""
+        self.session = get_session()
+        self._token = _current_unit_of_work.set(self)
+
+    def _finish(self, commit: bool) -> None:
+        """트랜잭션을 커밋 또는 롤백하고 세션을 닫습니다."""
+        try:
+            if commit and not self.failed:
+                self.session.commit()
+                print("✅ 워크플로우 저장 내용이 하나의 트랜잭션으로 커밋되었습니다.")
+            else:
+                self.session.rollback()
+        finally:
+            self.session.close()
+
+    def _reset(self) -> None:
+        """현재 컨텍스트에서 등록을 해제합니다."""
+        if self._token is not None:
+            _current_unit_of_work.reset(self._token)
+            self._token = None
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        self._begin()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        try:
+            self._finish(commit=exc_type is None)
+        finally:
+            self._reset()
+
+    async def __aenter__(self):
+        """비동기 컨텍스트 매니저 진입 (세션 생성은 연결을 맺지 않으므로 바로 실행)"""
+        self._begin()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """비동기 컨텍스트 매니저 종료 (커밋은 스레드 풀에서 실행)"""
+        try:
+            await run_blocking(self._finish, exc_type is None)
+        finally:
+            self._reset()
+
+
+# 현재 실행 중인 워크플로우의 UnitOfWork (없으면 None)
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar("food_reco_unit_of_work", default=None)
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """
+    현재 컨텍스트의 UnitOfWork를 반환합니다.
+
+    Returns:
+        Optional[UnitOfWork]: 활성화된 UnitOfWork, 없으면 None
+    """
+    return _current_unit_of_work.get()
+
+
+def unit_of_work_enabled() -> bool:
+    """
+    워크플로우 실행 단위 트랜잭션 사용 여부 (환경변수 DB_UNIT_OF_WORK)
+
+    Returns:
+        bool: 사용 여부
+    """
+    return os.getenv("DB_UNIT_OF_WORK", "false").lower() == "true"
+
+
+# 설치된 write-behind 저장기 (없으면 None, write_behind.WriteBehindWriter)
+_write_behind_writer = None
+
+
+def install_write_behind(writer) -> None:
+    """
+    write-behind 저장기를 설치합니다. 설치되어 있으면 편의 함수들의 저장 요청은
+    즉시 실행되지 않고 저장기의 큐로 전달됩니다. None을 넘기면 해제합니다.
+
+    Args:
+        writer (WriteBehindWriter): 시작된 write-behind 저장기
+    """
+    global _write_behind_writer
+    _write_behind_writer = writer
+
+
+def _run_storage(operation, *args):
+    """
+    StorageService 작업을 실행합니다.
+    write-behind 저장기가 설치되어 있으면 큐에 넣고 바로 반환하고,
+    UnitOfWork가 활성화되어 있으면 그 세션을 공유하며(커밋은 UnitOfWork가 담당),
+    둘 다 아니면 작업마다 세션을 열고 커밋합니다.
+    """
+    writer = _write_behind_writer
+    if writer is not None and hasattr(writer, operation.__name__):
+        return getattr(writer, operation.__name__)(*args)
+
+    uow = current_unit_of_work()
+    if uow is None:
+        with StorageService() as storage:
+            return operation(storage, *args)
+
+    if uow.failed:
+        raise SQLAlchemyError("이전 저장이 실패하여 이번 워크플로우의 저장을 건너뜁니다.")
+    try:
+        return operation(StorageService(uow.session), *args)
+    except Exception:
+        uow.failed = True
+        raise
+
+
 # 편의를 위한 함수들
 def save_user_session(user_data: Dict[str, Any]) -> int:
     """
@@ -209,8 +367,7 @@ def save_user_session(user_data: Dict[str, Any]) -> int:
     Returns:
         int: 저장된 세션 ID
     """
-    with StorageService() as storage:
-        return storage.save_user_session(user_data)
+    return _run_storage(StorageService.save_user_session, user_data)
 
 
 def save_search_results(session_id: int, search_results: List[Dict[str, str]], source: str = "naver", cuisine_preference: str = "") -> List[int]:
@@ -226,8 +383,7 @@ def save_search_results(session_id: int, search_results: List[Dict[str, str]], s
     Returns:
         List[int]: 저장된 검색 결과 ID 리스트
     """
-    with StorageService() as storage:
-        return storage.save_search_results(session_id, search_results, source, cuisine_preference)
+    return _run_storage(StorageService.save_search_results, session_id, search_results, source, cuisine_preference)
 
 
 def save_recommendation(session_id: int, recommendation_text: str, ai_model: str = "gemini") -> int:
@@ -242,8 +398,7 @@ def save_recommendation(session_id: int, recommendation_text: str, ai_model: str
     Returns:
         int: 저장된 추천 결과 ID
     """
-    with StorageService() as storage:
-        return storage.save_recommendation(session_id, recommendation_text, ai_model)
+    return _run_storage(StorageService.save_recommendation, session_id, recommendation_text, ai_model)
 
 
 def save_complete_session(user_data: Dict[str, Any], search_results: List[Dict[str, str]], 
@@ -261,5 +416,4 @@ def save_complete_session(user_data: Dict[str, Any], search_results: List[Dict[s
     Returns:
         Dict[str, int]: 저장된 데이터의 ID들
     """
-    with StorageService() as storage:
-        return storage.save_complete_session(user_data, search_results, recommendations, source, ai_model)
+    return _run_storage(StorageService.save_complete_session, user_data, search_results, recommendations, source, ai_model)
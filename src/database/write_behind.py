@@ -0,0 +1,300 @@
+"""
+Write-behind 저장 서비스
+
+사용자 세션/검색 결과/추천 결과 저장을 요청 처리 경로에서 분리합니다.
+저장 요청은 크기가 제한된 메모리 큐에 들어가고, 백그라운드 스레드가 배치 단위로
+하나의 트랜잭션에 모아 저장합니다. 세션 ID는 DB 시퀀스에서 블록 단위로 미리 할당하므로
+API는 저장이 끝나기를 기다리지 않고 바로 세션 ID를 반환할 수 있습니다.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from .connection import get_session
+from .storage_service import StorageService
+
+# (StorageService 메서드 이름, 인자)
+WriteItem = Tuple[str, Tuple[Any, ...]]
+
+_STOP = object()
+
+
+class SessionIdAllocator:
+    """
+    user_session 시퀀스에서 ID를 블록 단위로 미리 받아 두고 하나씩 나눠 주는 클래스
+
+    블록 하나를 받는 데 DB 왕복이 한 번 필요하며, 블록을 다 쓰기 전까지는 DB 접근 없이 ID를 반환합니다.
+    (프로세스가 종료되면 남은 ID는 사용되지 않고 건너뛰어집니다.)
+    """
+
+    def __init__(self, block_size: int = 100, sequence: str = "food_reco.user_session_id_seq"):
+        """
+        SessionIdAllocator 초기화
+
+        Args:
+            block_size (int): 한 번에 받아 올 ID 개수
+            sequence (str): user_session.id 시퀀스 이름
+        """
+        self.block_size = block_size
+        self.sequence = sequence
+        self._ids: List[int] = []
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        """
+        미리 할당된 세션 ID를 하나 반환합니다.
+
+        Returns:
+            int: 세션 ID
+        """
+        with self._lock:
+            if not self._ids:
+                self._ids = self._reserve_block()
+            return self._ids.pop()
+
+    def _reserve_block(self) -> List[int]:
+        """시퀀스에서 block_size개의 ID를 한 번의 쿼리로 받아 옵니다 (pop 순서가 오름차순이 되도록 역순 정렬)."""
+        session = get_session()
+        try:
+            rows = session.execute(
+                text("SELECT nextval(CAST(:sequence AS regclass)) FROM generate_series(1, :count)"),
+                {"sequence": self.sequence, "count": self.block_size}
+            ).scalars().all()
+            session.commit()
+            return sorted(rows, reverse=True)
+        finally:
+            session.close()
+
+
+class WriteBehindWriter:
+    """
+    저장 요청을 큐에 넣고 백그라운드 스레드에서 배치로 저장하는 클래스
+
+    - 큐가 가득 차면 enqueue_timeout 동안 기다리고(backpressure), 그래도 자리가 없으면 버림
+    - batch_size개가 모이거나 첫 항목 이후 flush_interval이 지나면 한 트랜잭션으로 저장
+    - 배치 저장이 실패하면 항목별로 다시 시도하여 실패한 항목만 버림
+    - shutdown() 시 큐에 남은 항목을 모두 저장한 뒤 종료
+    """
+
+    def __init__(self, max_queue_size: int = 10000, batch_size: int = 100, flush_interval: float = 0.5,
+                 enqueue_timeout: float = 0.05, id_allocator: Optional[SessionIdAllocator] = None):
+        """
+        WriteBehindWriter 초기화
+
+        Args:
+            max_queue_size (int): 큐 최대 길이
+            batch_size (int): 한 트랜잭션에 저장할 최대 항목 수
+            flush_interval (float): 배치를 채우기 위해 기다리는 최대 시간 (초)
+            enqueue_timeout (float): 큐가 가득 찼을 때 기다리는 최대 시간 (초)
+            id_allocator (SessionIdAllocator, optional): 세션 ID 할당기
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.id_allocator = id_allocator or SessionIdAllocator()
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    @classmethod
+    def from_env(cls) -> "WriteBehindWriter":
+        """
+        환경변수 설정으로 WriteBehindWriter를 생성합니다.
+
+        Returns:
+            WriteBehindWriter: 새 인스턴스
+        """
+        return cls(
+            max_queue_size=int(os.getenv("WRITE_BEHIND_MAX_QUEUE_SIZE", "10000")),
+            batch_size=int(os.getenv("WRITE_BEHIND_BATCH_SIZE", "100")),
+            flush_interval=float(os.getenv("WRITE_BEHIND_FLUSH_INTERVAL", "0.5")),
+            enqueue_timeout=float(os.getenv("WRITE_BEHIND_ENQUEUE_TIMEOUT", "0.05")),
+            id_allocator=SessionIdAllocator(
+                block_size=int(os.getenv("WRITE_BEHIND_ID_BLOCK_SIZE", "100")),
+                sequence=os.getenv("DB_SESSION_ID_SEQUENCE", "food_reco.user_session_id_seq")
+            )
+        )
+
+    def start(self) -> None:
+        """백그라운드 저장 스레드를 시작합니다."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="food-reco-write-behind", daemon=True)
+            self._thread.start()
+
+    def shutdown(self, timeout: Optional[float] = 30.0) -> None:
+        """
+        큐에 남은 항목을 모두 저장한 뒤 백그라운드 스레드를 종료합니다.
+
+        Args:
+            timeout (float, optional): 종료를 기다리는 최대 시간 (초)
+        """
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            print(f"⚠️ write-behind 종료 대기 시간 초과 (남은 항목: {self._queue.qsize()}개)")
+        self._thread = None
+
+    def submit(self, operation: str, *args: Any) -> bool:
+        """
+        저장 요청을 큐에 넣습니다.
+
+        Args:
+            operation (str): 실행할 StorageService 메서드 이름
+            *args: 메서드 인자
+
+        Returns:
+            bool: 큐에 들어갔으면 True, 큐가 가득 차 버려졌으면 False
+        """
+        try:
+            self._queue.put((operation, args), timeout=self.enqueue_timeout)
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+            print(f"⚠️ write-behind 큐가 가득 차 저장 요청을 버립니다: {operation}")
+            return False
+        with self._stats_lock:
+            self.enqueued += 1
+        return True
+
+    def save_user_session(self, user_data: Dict[str, Any]) -> int:
+        """
+        세션 ID를 미리 할당하고 사용자 세션 저장을 예약합니다.
+
+        Args:
+            user_data (Dict[str, Any]): 사용자 입력 데이터
+
+        Returns:
+            int: 미리 할당된 세션 ID
+        """
+        session_id = self.id_allocator.next_id()
+        self.submit("save_user_session", {**user_data, "id": session_id})
+        return session_id
+
+    def save_search_results(self, session_id: int, search_results: List[Dict[str, str]],
+                            source: str = "naver", cuisine_preference: str = "") -> List[int]:
+        """
+        검색 결과 저장을 예약합니다. 저장 전이므로 결과 ID는 반환하지 않습니다.
+
+        Returns:
+            List[int]: 빈 리스트
+        """
+        self.submit("save_search_results", session_id, list(search_results), source, cuisine_preference)
+        return []
+
+    def save_recommendation(self, session_id: int, recommendation_text: str, ai_model: str = "gemini") -> int:
+        """
+        추천 결과 저장을 예약합니다. 저장 전이므로 추천 ID는 0을 반환합니다.
+
+        Returns:
+            int: 0
+        """
+        self.submit("save_recommendation", session_id, recommendation_text, ai_model)
+        return 0
+
+    def _run(self) -> None:
+        """큐를 배치 단위로 비우는 백그라운드 루프"""
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if batch:
+                self._write_batch(batch)
+
+    def _next_batch(self) -> Tuple[List[WriteItem], bool]:
+        """첫 항목을 기다린 뒤 batch_size개가 모이거나 flush_interval이 지날 때까지 항목을 모읍니다."""
+        item = self._queue.get()
+        if item is _STOP:
+            return self._drain(), True
+
+        batch = [item]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch + self._drain(), True
+            batch.append(item)
+        return batch, False
+
+    def _drain(self) -> List[WriteItem]:
+        """종료 시 큐에 남은 항목을 모두 꺼냅니다."""
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is not _STOP:
+                items.append(item)
+
+    def _write_batch(self, batch: List[WriteItem]) -> None:
+        """배치를 한 트랜잭션으로 저장합니다. 실패하면 항목별로 다시 시도합니다."""
+        for start in range(0, len(batch), self.batch_size):
+            chunk = batch[start:start + self.batch_size]
+            try:
+                with StorageService() as storage:
+                    for operation, args in chunk:
+                        getattr(storage, operation)(*args)
+                with self._stats_lock:
+                    self.written += len(chunk)
+                    self.batches += 1
+            except Exception as e:
+                print(f"⚠️ write-behind 배치 저장 실패, 항목별로 재시도합니다: {e}")
+                for item in chunk:
+                    self._write_one(item)
+
+    def _write_one(self, item: WriteItem) -> None:
+        """항목 하나를 별도 트랜잭션으로 저장합니다."""
+        operation, args = item
+        try:
+            with StorageService() as storage:
+                getattr(storage, operation)(*args)
+            with self._stats_lock:
+                self.written += 1
+        except Exception as e:
+            with self._stats_lock:
+                self.failed += 1
+            print(f"⚠️ write-behind 저장 실패 ({operation}): {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        write-behind 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 큐 길이, 예약/저장/버림/실패 건수, 배치 수
+        """
+        with self._stats_lock:
+            return {
+                "queue_size": self._queue.qsize(),
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "batches": self.batches,
+            }
+
+
+def write_behind_enabled() -> bool:
+    """
+    write-behind 저장 사용 여부 (환경변수 DB_WRITE_BEHIND)
+
+    Returns:
+        bool: 사용 여부
+    """
+    return os.getenv("DB_WRITE_BEHIND", "false").lower() == "true"
@@ -4,13 +4,74 @@ Services module for food recommendation agent
 이 모듈은 외부 API 서비스 및 데이터 소스를 제공합니다.
 """
 
-from .naver_search import search_web, search_restaurants_naver, NaverAPIError
+from .naver_search import (
+    search_web,
+    asearch_web,
+    search_restaurants_naver,
+    asearch_restaurants_naver,
+    NaverAPIError,
+    NaverCircuitOpenError,
+    NaverRateLimitedError,
+    NaverSearchClient,
+    naver_client,
+    naver_limiter,
+    naver_breaker,
+    naver_rate_limiter,
+    naver_hedge,
+    search_cache,
+    search_flight
+)
 from .restaurant_data import restaurant_data, search_restaurants_backup
+from .dedup import canonicalize_url, simhash, dedupe_search_results
+from .local_index import LocalIndex, LocalIndexError, build_local_index, get_local_index, reload_local_index, search_restaurants_local
+from .text_ngrams import normalize_text, result_text
+from .reranker import BM25Reranker, reranker, rerank_search_results
+from .llm_client import (
+    LLMClientRegistry, llm_registry, get_llm, invoke_llm, ainvoke_llm, astream_llm, chunk_text, llm_flight,
+    llm_limiter, DEFAULT_LLM_MODEL, FAST_LLM_MODEL
+)
 
 __all__ = [
     "search_web",
+    "asearch_web",
     "search_restaurants_naver", 
+    "asearch_restaurants_naver",
     "NaverAPIError",
+    "NaverCircuitOpenError",
+    "NaverRateLimitedError",
+    "NaverSearchClient",
+    "naver_client",
+    "naver_limiter",
+    "naver_breaker",
+    "naver_rate_limiter",
+    "naver_hedge",
+    "search_cache",
+    "search_flight",
     "restaurant_data",
-    "search_restaurants_backup"
+    "search_restaurants_backup",
+    "LLMClientRegistry",
+    "llm_registry",
+    "get_llm",
+    "invoke_llm",
+    "ainvoke_llm",
+    "astream_llm",
+    "chunk_text",
+    "llm_flight",
+    "llm_limiter",
+    "DEFAULT_LLM_MODEL",
+    "FAST_LLM_MODEL",
+    "normalize_text",
+    "result_text",
+    "BM25Reranker",
+    "reranker",
+    "rerank_search_results",
+    "canonicalize_url",
+    "simhash",
+    "dedupe_search_results",
+    "LocalIndex",
+    "LocalIndexError",
+    "build_local_index",
+    "get_local_index",
+    "reload_local_index",
+    "search_restaurants_local"
 ]
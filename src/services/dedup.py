@@ -0,0 +1,244 @@
+"""
+검색 결과 중복 제거
+
+네이버 웹 검색 결과에는 같은 식당 글이 여러 번 섞여 있습니다
+(추적 파라미터만 다른 같은 링크, 모바일/PC 주소, 블로그 퍼가기, 모음 페이지 등).
+이 모듈은 두 단계로 중복을 제거합니다.
+
+1. URL 정규화: 추적 파라미터/프래그먼트/모바일 서브도메인 등을 제거한 정규 URL이 같으면 중복
+2. SimHash: 제목 + 설명의 문자 3-gram으로 64비트 SimHash를 만들고, 해밍 거리가
+   max_distance 이하이면 중복. 지문을 (max_distance + 1)개 구간으로 나눈 LSH 버킷으로
+   후보만 비교하므로 결과 수에 선형 시간으로 동작합니다
+   (해밍 거리가 d 이하인 두 지문은 d + 1개 구간 중 적어도 하나가 같음).
+
+먼저 나온 결과(검색 엔진 순위가 높은 결과)를 남기고 뒤에 나온 중복을 버립니다.
+"""
+
+import os
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+from .text_ngrams import concat_codepoints, document_ngrams, normalize_text, result_text
+
+SIMHASH_BITS = 64
+_SHINGLE_SIZE = 3
+_BIT_POSITIONS = np.arange(SIMHASH_BITS, dtype=np.uint64)
+
+# 값과 관계없이 제거하는 추적/광고 파라미터 (소문자로 비교)
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "_ga", "napm",
+    "ref", "ref_src", "fromrss", "trackingcode", "proxyreferer", "redirect", "widgettypecall",
+})
+TRACKING_PARAM_PREFIXES = ("utm_", "n_")
+# 같은 페이지를 가리키는 서브도메인 접두어 (www.example.com, m.blog.naver.com 등)
+_HOST_PREFIXES = ("www.", "m.")
+
+SEARCH_DEDUP_ENABLED = os.getenv("SEARCH_DEDUP_ENABLED", "true").lower() == "true"
+SEARCH_DEDUP_MAX_DISTANCE = int(os.getenv("SEARCH_DEDUP_MAX_DISTANCE", "6"))
+
+
+def _is_tracking_param(name: str) -> bool:
+    """추적/광고용 쿼리 파라미터인지 확인합니다."""
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    중복 판단용 정규 URL을 만듭니다.
+
+    - 스킴(http/https), 기본 포트, 프래그먼트, 끝의 슬래시 무시
+    - 호스트 소문자 변환, www./m. 접두어 제거
+    - 추적 파라미터(utm_*, n_*, fbclid 등) 제거 후 나머지 파라미터 정렬
+    - 네이버 블로그 PostView 주소(?blogId=..&logNo=..)를 /{blogId}/{logNo} 형식으로 통일
+
+    Args:
+        url (str): 원본 URL
+
+    Returns:
+        str: 정규 URL (파싱할 수 없으면 앞뒤 공백만 제거한 원본)
+    """
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        port = parts.port
+    except ValueError:
+        return url
+    if not host:
+        return url
+
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    path = parts.path.rstrip("/")
+    params = [(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+              if not _is_tracking_param(name)]
+
+    if host == "blog.naver.com" and path.lower() in ("/postview.naver", "/postview.nhn"):
+        query = dict(params)
+        if query.get("blogId") and query.get("logNo"):
+            path = f"/{query['blogId']}/{query['logNo']}"
+            params = []
+
+    return urlunsplit(("https", host, path, urlencode(sorted(params)), ""))
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """
+    64비트 정수 배열을 비트가 고르게 섞인 해시로 변환합니다 (MurmurHash3 fmix64).
+
+    3-gram ID는 코드 포인트를 이어 붙인 값이라 상위 비트가 거의 같으므로 그대로 쓸 수 없습니다.
+    """
+    values = values ^ (values >> np.uint64(33))
+    values = values * np.uint64(0xFF51AFD7ED558CCD)
+    values = values ^ (values >> np.uint64(33))
+    values = values * np.uint64(0xC4CEB9FE1A85EC53)
+    return values ^ (values >> np.uint64(33))
+
+
+def simhash_many(texts: Sequence[str]) -> List[Optional[int]]:
+    """
+    여러 텍스트의 64비트 SimHash를 한 번에 계산합니다.
+
+    정규화한 텍스트의 고유 문자 3-gram을 해시하고, 비트 위치별로 1인 해시가 과반이면
+    지문의 해당 비트를 1로 설정합니다. 모든 텍스트를 이어 붙여 NumPy 연산으로 처리합니다.
+
+    Args:
+        texts (Sequence[str]): 텍스트 목록
+
+    Returns:
+        List[Optional[int]]: 텍스트별 지문 (3-gram을 만들 수 없을 만큼 짧으면 None)
+    """
+    fingerprints: List[Optional[int]] = [None] * len(texts)
+    if not texts:
+        return fingerprints
+
+    joined, doc_of_char = concat_codepoints([normalize_text(text) for text in texts])
+    ids, doc_ids = document_ngrams(joined, doc_of_char, _SHINGLE_SIZE)
+    if not len(ids):
+        return fingerprints
+
+    # (문서, 3-gram) 순으로 정렬한 뒤 문서 안에서 중복된 3-gram 제거
+    order = np.lexsort((ids, doc_ids))
+    ids, doc_ids = ids[order], doc_ids[order]
+    unique = np.ones(len(ids), dtype=bool)
+    unique[1:] = (ids[1:] != ids[:-1]) | (doc_ids[1:] != doc_ids[:-1])
+    ids, doc_ids = ids[unique], doc_ids[unique]
+
+    # 해시별 비트(3-gram 수 x 64)를 문서별로 합산 (3-gram 수에 비례하는 시간/메모리)
+    bits = np.unpackbits(_mix64(ids).view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    bit_columns = np.ascontiguousarray(bits.T)
+    ones = np.stack(
+        [np.bincount(doc_ids, weights=column, minlength=len(texts)) for column in bit_columns], axis=1
+    )
+    shingle_counts = np.bincount(doc_ids, minlength=len(texts))
+    majority = (ones * 2 > shingle_counts[:, None]).astype(np.uint64)
+    packed = (majority << _BIT_POSITIONS).sum(axis=1, dtype=np.uint64)
+
+    for doc in np.flatnonzero(shingle_counts).tolist():
+        fingerprints[doc] = int(packed[doc])
+    return fingerprints
+
+
+def simhash(text: str) -> Optional[int]:
+    """
+    텍스트 하나의 64비트 SimHash를 계산합니다.
+
+    Args:
+        text (str): 텍스트
+
+    Returns:
+        Optional[int]: 지문 (3-gram을 만들 수 없을 만큼 짧으면 None)
+    """
+    return simhash_many([text])[0]
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문의 해밍 거리"""
+    return bin(a ^ b).count("1")
+
+
+def _bands(fingerprint: int, band_count: int) -> List[int]:
+    """지문을 band_count개 구간으로 나눈 값 목록 (마지막 구간이 남는 비트를 가짐)"""
+    width = SIMHASH_BITS // band_count
+    bands = []
+    for band in range(band_count):
+        bits = width if band < band_count - 1 else SIMHASH_BITS - width * band
+        bands.append((fingerprint >> (width * band)) & ((1 << bits) - 1))
+    return bands
+
+
+def dedupe_search_results(search_results: List[Dict[str, str]],
+                          max_distance: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    정규 URL과 SimHash로 중복 검색 결과를 제거합니다. 먼저 나온 결과를 남기고 순서를 유지합니다.
+
+    Args:
+        search_results (List[Dict[str, str]]): 검색 결과 목록 ('title', 'description', 'link')
+        max_distance (int, optional): 같은 글로 볼 최대 해밍 거리 (None이면 SEARCH_DEDUP_MAX_DISTANCE,
+            0 미만이면 SimHash 비교를 하지 않고 URL만 비교)
+
+    Returns:
+        List[Dict[str, str]]: 중복이 제거된 검색 결과
+    """
+    if max_distance is None:
+        max_distance = SEARCH_DEDUP_MAX_DISTANCE
+    band_count = min(max_distance + 1, SIMHASH_BITS)
+
+    seen_urls = set()
+    fingerprints: List[int] = []
+    buckets: List[Dict[int, List[int]]] = [{} for _ in range(max(band_count, 0))]
+    kept = []
+
+    if max_distance >= 0:
+        result_fingerprints = simhash_many([result_text(result) for result in search_results])
+    else:
+        result_fingerprints = [None] * len(search_results)
+
+    for result, fingerprint in zip(search_results, result_fingerprints):
+        link = result.get('link', '')
+        if link:
+            canonical = canonicalize_url(link)
+            if canonical in seen_urls:
+                continue
+
+        if fingerprint is not None:
+            bands = _bands(fingerprint, band_count)
+            candidates = {index for bucket, band in zip(buckets, bands) for index in bucket.get(band, ())}
+            if any(hamming_distance(fingerprint, fingerprints[index]) <= max_distance for index in candidates):
+                continue
+            for bucket, band in zip(buckets, bands):
+                bucket.setdefault(band, []).append(len(fingerprints))
+            fingerprints.append(fingerprint)
+
+        if link:
+            seen_urls.add(canonical)
+        kept.append(result)
+
+    return kept
+
+
+def dedupe_if_enabled(search_results: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """
+    SEARCH_DEDUP_ENABLED가 켜져 있으면 중복을 제거하고, 제거한 수를 출력합니다.
+
+    Args:
+        search_results (List[Dict[str, str]]): 검색 결과 목록
+
+    Returns:
+        List[Dict[str, str]]: 중복이 제거된 검색 결과 (꺼져 있으면 그대로)
+    """
+    if not SEARCH_DEDUP_ENABLED:
+        return search_results
+    deduped = dedupe_search_results(search_results)
+    removed = len(search_results) - len(deduped)
+    if removed:
+        print(f"중복 검색 결과 {removed}개 제거 ({len(search_results)}개 → {len(deduped)}개)")
+    return deduped
@@ -0,0 +1,243 @@
+"""
+LLM 클라이언트 레지스트리
+
+Gemini 클라이언트(ChatGoogleGenerativeAI)를 프로세스당 한 번만 생성하고
+(모델, temperature) 조합별로 재사용합니다. 클라이언트를 재사용하면
+인증 정보 확인과 HTTP 연결(TLS 핸드셰이크) 비용을 요청마다 다시 지불하지 않습니다.
+"""
+
+import os
+import threading
+from collections import Counter
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Tuple
+
+import xxhash
+from dotenv import load_dotenv
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from ..utils.concurrency import ConcurrencyLimiter
+from ..utils.metrics import external_call_metrics
+from ..utils.singleflight import SingleFlight
+
+load_dotenv()
+
+# 기본 모델 설정 (환경변수로 조정 가능)
+DEFAULT_LLM_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
+DEFAULT_LLM_TEMPERATURE = float(os.getenv("GEMINI_TEMPERATURE", "0.7"))
+# 남은 시간이 부족할 때 사용하는 빠른 모델
+FAST_LLM_MODEL = os.getenv("GEMINI_FAST_MODEL", "gemini-2.0-flash-lite")
+
+ClientKey = Tuple[str, float]
+
+
+class LLMClientRegistry:
+    """
+    (모델, temperature) 별로 LLM 클라이언트를 한 번만 생성해 공유하는 레지스트리
+
+    조회(get)는 이벤트 루프를 양보하지 않는 짧은 동기 연산이므로 asyncio 태스크 간에도
+    안전하며, 스레드 간 중복 생성은 잠금으로 막습니다.
+    """
+
+    def __init__(self, factory: Optional[Callable[[str, float], Any]] = None):
+        """
+        LLMClientRegistry 초기화
+
+        Args:
+            factory (Callable, optional): (model, temperature)를 받아 클라이언트를 생성하는 함수.
+                None이면 ChatGoogleGenerativeAI를 사용
+        """
+        self._factory = factory or self._create_gemini_client
+        self._clients: Dict[ClientKey, Any] = {}
+        self._lock = threading.Lock()
+        self._created: Counter = Counter()
+        self._reused: Counter = Counter()
+
+    @staticmethod
+    def _create_gemini_client(model: str, temperature: float) -> ChatGoogleGenerativeAI:
+        """Gemini 클라이언트를 생성합니다."""
+        return ChatGoogleGenerativeAI(model=model, temperature=temperature)
+
+    def get(self, model: str = DEFAULT_LLM_MODEL, temperature: float = DEFAULT_LLM_TEMPERATURE) -> Any:
+        """
+        (모델, temperature)에 해당하는 클라이언트를 반환합니다. 없으면 생성합니다.
+
+        Args:
+            model (str): 모델 이름
+            temperature (float): 샘플링 temperature
+
+        Returns:
+            Any: 공유 LLM 클라이언트
+        """
+        return self._get_or_create((model, float(temperature)), count_reuse=True)
+
+    def _get_or_create(self, key: ClientKey, count_reuse: bool) -> Any:
+        """잠금 안에서 클라이언트를 조회하거나 생성합니다."""
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._factory(*key)
+                self._clients[key] = client
+                self._created[key] += 1
+            elif count_reuse:
+                self._reused[key] += 1
+            return client
+
+    def warmup(self, keys: Optional[Iterable[ClientKey]] = None) -> None:
+        """
+        클라이언트를 미리 생성합니다. 서버 시작 시 호출하면 첫 요청의 생성 비용이 사라집니다.
+
+        Args:
+            keys (Iterable[Tuple[str, float]], optional): 미리 생성할 (모델, temperature) 목록.
+                None이면 기본 모델과 빠른 모델을 생성
+        """
+        default_keys = dict.fromkeys([(DEFAULT_LLM_MODEL, DEFAULT_LLM_TEMPERATURE), (FAST_LLM_MODEL, DEFAULT_LLM_TEMPERATURE)])
+        for model, temperature in keys or default_keys:
+            try:
+                self._get_or_create((model, float(temperature)), count_reuse=False)
+                print(f"✅ LLM 클라이언트 준비 완료: {model} (temperature={temperature})")
+            except Exception as e:
+                print(f"⚠️ LLM 클라이언트 준비 실패: {model} - {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        클라이언트 생성/재사용 횟수를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 클라이언트별 생성 횟수와 재사용 횟수
+        """
+        with self._lock:
+            return {
+                "clients": [
+                    {
+                        "model": model,
+                        "temperature": temperature,
+                        "created": self._created[(model, temperature)],
+                        "reused": self._reused[(model, temperature)],
+                    }
+                    for model, temperature in self._clients
+                ],
+                "total_created": sum(self._created.values()),
+                "total_reused": sum(self._reused.values()),
+            }
+
+    def clear(self) -> None:
+        """등록된 클라이언트와 카운터를 모두 제거합니다."""
+        with self._lock:
+            self._clients.clear()
+            self._created.clear()
+            self._reused.clear()
+
+
+# 프로세스 전역 LLM 클라이언트 레지스트리
+llm_registry = LLMClientRegistry()
+
+
+def get_llm(model: str = DEFAULT_LLM_MODEL, temperature: float = DEFAULT_LLM_TEMPERATURE) -> Any:
+    """
+    공유 LLM 클라이언트를 가져오는 편의 함수
+
+    Args:
+        model (str): 모델 이름
+        temperature (float): 샘플링 temperature
+
+    Returns:
+        Any: 공유 LLM 클라이언트
+    """
+    return llm_registry.get(model, temperature)
+
+
+# 동일 프롬프트의 동시 호출 병합
+llm_flight = SingleFlight("llm")
+
+# Gemini 동시 호출 수 상한 (스트리밍 호출은 응답이 끝날 때까지 슬롯을 점유)
+llm_limiter = ConcurrencyLimiter("llm", int(os.getenv("LLM_MAX_CONCURRENCY", "8")))
+
+
+# Gemini 실제 호출 지표 (single-flight로 병합된 호출은 한 번만 기록)
+_gemini_call_metrics = external_call_metrics.bind("gemini")
+
+
+def _prompt_key(prompt: str, model: str, temperature: float) -> Tuple[str, float, str]:
+    """프롬프트 전체를 해시하여 single-flight 키를 생성합니다."""
+    return (model, float(temperature), xxhash.xxh3_128_hexdigest(prompt.encode("utf-8")))
+
+
+def _invoke(prompt: str, model: str, temperature: float) -> Any:
+    """공유 클라이언트로 프롬프트를 실행합니다."""
+    with llm_limiter.slot(), _gemini_call_metrics.track():
+        return get_llm(model, temperature).invoke(prompt)
+
+
+async def _ainvoke(prompt: str, model: str, temperature: float) -> Any:
+    """_invoke의 비동기 버전"""
+    async with llm_limiter.aslot():
+        with _gemini_call_metrics.track():
+            return await get_llm(model, temperature).ainvoke(prompt)
+
+
+def invoke_llm(prompt: str, model: str = DEFAULT_LLM_MODEL, temperature: float = DEFAULT_LLM_TEMPERATURE) -> Any:
+    """
+    공유 LLM 클라이언트로 프롬프트를 실행합니다.
+    같은 프롬프트로 진행 중인 호출이 있으면 새로 호출하지 않고 그 결과를 함께 받습니다.
+
+    Args:
+        prompt (str): 완성된 프롬프트
+        model (str): 모델 이름
+        temperature (float): 샘플링 temperature
+
+    Returns:
+        Any: LLM 응답 (동시 호출자 간에 공유되므로 수정하지 말 것)
+    """
+    return llm_flight.do(_prompt_key(prompt, model, temperature), _invoke, prompt, model, temperature)
+
+
+async def ainvoke_llm(prompt: str, model: str = DEFAULT_LLM_MODEL, temperature: float = DEFAULT_LLM_TEMPERATURE) -> Any:
+    """
+    invoke_llm의 비동기 버전
+
+    Args:
+        prompt (str): 완성된 프롬프트
+        model (str): 모델 이름
+        temperature (float): 샘플링 temperature
+
+    Returns:
+        Any: LLM 응답 (동시 호출자 간에 공유되므로 수정하지 말 것)
+    """
+    return await llm_flight.ado(_prompt_key(prompt, model, temperature), _ainvoke, prompt, model, temperature)
+
+
+async def astream_llm(prompt: str, model: str = DEFAULT_LLM_MODEL,
+                      temperature: float = DEFAULT_LLM_TEMPERATURE) -> AsyncIterator[Any]:
+    """
+    LLM 응답을 생성되는 대로 조각(chunk) 단위로 반환합니다.
+
+    조각은 호출자마다 따로 전달해야 하므로 single-flight 병합을 거치지 않습니다.
+
+    Args:
+        prompt (str): 완성된 프롬프트
+        model (str): 모델 이름
+        temperature (float): 샘플링 temperature
+
+    Yields:
+        Any: 응답 조각 (AIMessageChunk, 조각끼리 + 로 합칠 수 있음)
+    """
+    async with llm_limiter.aslot():
+        with _gemini_call_metrics.track():
+            async for chunk in get_llm(model, temperature).astream(prompt):
+                yield chunk
+
+
+def chunk_text(chunk: Any) -> str:
+    """
+    응답 조각에서 텍스트를 추출합니다 (content가 파트 목록인 경우 텍스트 파트만 이어 붙임).
+
+    Args:
+        chunk (Any): 응답 조각 또는 메시지
+
+    Returns:
+        str: 텍스트
+    """
+    content = getattr(chunk, "content", chunk)
+    if isinstance(content, list):
+        return "".join(part if isinstance(part, str) else part.get("text", "") for part in content)
+    return str(content)
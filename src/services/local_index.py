@@ -0,0 +1,507 @@
+"""
+오프라인 로컬 검색 색인
+
+restaurant_data(백업 데이터)와 DB에 저장된 검색 결과(SearchResult)로 역색인을 만들어
+네트워크 없이 맛집을 검색합니다. 네이버 검색 결과가 없거나 실패했을 때의 대체 검색 계층입니다.
+
+- 토큰: 정규화한 텍스트의 문자 2-gram (띄어쓰기/조사와 무관하게 한국어 부분 일치)
+  2-gram은 코드 포인트 두 개를 묶은 정수이므로 해시 충돌 없이 그대로 용어 ID로 사용합니다.
+- 점수: BM25. 용어-문서 쌍마다 BM25 가중치(impact)를 색인 생성 시 미리 계산해 두므로
+  검색은 질의 용어의 포스팅을 더하기만 합니다.
+- 파일: 헤더 + 배열 구간으로 된 단일 파일. np.memmap으로 열어 필요한 페이지만 읽으므로
+  시작 시 로딩이 파일 크기와 무관하게 빠릅니다.
+
+파일 구조 (리틀 엔디언, 각 구간은 8바이트 정렬):
+    헤더        magic(8) version(u32) n_docs(u32) n_terms(u64) n_postings(u64) doc_bytes(u64) k1(f64) b(f64)
+    term_ids    uint64[n_terms]       정렬된 용어 ID (searchsorted로 조회)
+    term_starts uint64[n_terms + 1]   용어별 포스팅 시작 위치
+    term_max    float32[n_terms]      용어별 최대 BM25 가중치 (검색 시 점수 상한 계산용)
+    post_docs   uint32[n_postings]    포스팅 문서 번호
+    post_impact float32[n_postings]   포스팅 BM25 가중치
+    doc_starts  uint64[n_docs + 1]    문서별 JSON 시작 위치
+    doc_json    bytes[doc_bytes]      문서 JSON (title, description, link, source)
+"""
+
+import os
+import struct
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+from .dedup import canonicalize_url
+from .text_ngrams import codepoints, concat_codepoints, document_ngrams, ngram_ids, normalize_text
+from .restaurant_data import restaurant_data, search_restaurants_backup
+
+INDEX_MAGIC = b"FRLIDX\x00\x01"
+INDEX_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQdd")
+_ALIGN = 8
+_NGRAM_SIZE = 2
+
+LOCAL_INDEX_PATH = os.getenv("LOCAL_INDEX_PATH", "data/local_index.bin")
+LOCAL_INDEX_TOP_K = int(os.getenv("LOCAL_INDEX_TOP_K", "20"))
+# 전체 문서 중 이 비율보다 많은 문서에 나오는 용어는 처음에는 후보 선정에 쓰지 않음 (점수에는 반영)
+COMMON_TERM_RATIO = float(os.getenv("LOCAL_INDEX_COMMON_TERM_RATIO", "0.05"))
+
+# 로컬 검색 결과를 DB에 저장할 때의 source 값 (색인을 다시 만들 때는 제외)
+LOCAL_SOURCE = "local"
+
+
+class LocalIndexError(Exception):
+    """색인 파일을 읽거나 쓸 수 없을 때 발생하는 오류"""
+    pass
+
+
+def _padding(size: int) -> int:
+    """size 뒤에 붙일 정렬용 바이트 수"""
+    return -size % _ALIGN
+
+
+def _query_terms(query: str) -> Tuple[np.ndarray, np.ndarray]:
+    """질의의 고유 2-gram ID(정렬됨)와 질의 내 빈도"""
+    return np.unique(ngram_ids(codepoints(normalize_text(query)), _NGRAM_SIZE), return_counts=True)
+
+
+class LocalIndex:
+    """
+    memmap으로 연 로컬 검색 색인
+
+    build()로 만들고 load()로 엽니다. 열린 색인은 읽기 전용이므로 여러 스레드에서 동시에 검색해도 안전합니다.
+    """
+
+    def __init__(self, buffer: Any, path: Optional[str] = None):
+        """
+        LocalIndex 초기화 (직접 호출하지 말고 load() 사용)
+
+        Args:
+            buffer: 색인 파일 전체 바이트 (np.memmap 또는 bytes)
+            path (str, optional): 색인 파일 경로
+
+        Raises:
+            LocalIndexError: 색인 형식이 올바르지 않은 경우
+        """
+        if len(buffer) < _HEADER.size:
+            raise LocalIndexError("색인 파일이 너무 짧습니다.")
+        magic, version, n_docs, n_terms, n_postings, doc_bytes, k1, b = _HEADER.unpack_from(buffer, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise LocalIndexError(f"지원하지 않는 색인 형식입니다: {magic!r} v{version}")
+
+        self.path = path
+        self.n_docs = n_docs
+        self.n_terms = n_terms
+        self.n_postings = n_postings
+        self.k1 = k1
+        self.b = b
+        self._buffer = buffer
+
+        offset = _HEADER.size + _padding(_HEADER.size)
+
+        def section(dtype, count: int) -> np.ndarray:
+            nonlocal offset
+            array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+            offset += array.nbytes + _padding(array.nbytes)
+            return array
+
+        self.term_ids = section("<u8", n_terms)
+        self.term_starts = section("<u8", n_terms + 1)
+        self.term_max = section("<f4", n_terms)
+        self.post_docs = section("<u4", n_postings)
+        self.post_impact = section("<f4", n_postings)
+        self.doc_starts = section("<u8", n_docs + 1)
+        self.doc_json = section("u1", doc_bytes)
+        if offset != len(buffer):
+            raise LocalIndexError("색인 파일 크기가 헤더와 일치하지 않습니다.")
+
+    @classmethod
+    def load(cls, path: str) -> "LocalIndex":
+        """
+        색인 파일을 memmap으로 엽니다 (내용은 검색 시 필요한 페이지만 읽힘).
+
+        Args:
+            path (str): 색인 파일 경로
+
+        Returns:
+            LocalIndex: 열린 색인
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+            LocalIndexError: 색인 형식이 올바르지 않은 경우
+        """
+        return cls(np.memmap(path, dtype=np.uint8, mode="r"), path)
+
+    @staticmethod
+    def build(documents: Iterable[Dict[str, str]], k1: float = 1.2, b: float = 0.75) -> bytes:
+        """
+        문서 목록으로 색인 파일 내용을 만듭니다.
+
+        Args:
+            documents (Iterable[Dict[str, str]]): 'title', 'description', 'link', 'source' 키를 가진 문서.
+                'keywords' 키가 있으면 검색에만 사용하고 저장하지 않음
+            k1 (float): BM25 단어 빈도 포화 계수
+            b (float): BM25 문서 길이 정규화 계수
+
+        Returns:
+            bytes: 색인 파일 내용
+        """
+        stored, texts = [], []
+        for document in documents:
+            stored.append(orjson.dumps({
+                "title": document.get("title", ""),
+                "description": document.get("description", ""),
+                "link": document.get("link", ""),
+                "source": document.get("source", ""),
+            }))
+            texts.append(normalize_text(" ".join(
+                document.get(field, "") for field in ("title", "description", "keywords")
+            )))
+
+        n_docs = len(texts)
+        joined, doc_of_char = concat_codepoints(texts)
+        term_ids, doc_ids = document_ngrams(joined, doc_of_char, _NGRAM_SIZE)
+        doc_ids = doc_ids.astype(np.uint32)
+
+        # (용어, 문서) 순으로 정렬하여 같은 쌍을 묶으면 포스팅 목록과 단어 빈도가 됨
+        order = np.lexsort((doc_ids, term_ids))
+        term_ids, doc_ids = term_ids[order], doc_ids[order]
+        pair_start = np.ones(len(term_ids), dtype=bool)
+        pair_start[1:] = (term_ids[1:] != term_ids[:-1]) | (doc_ids[1:] != doc_ids[:-1])
+        pair_index = np.flatnonzero(pair_start)
+        tf = np.diff(np.r_[pair_index, len(term_ids)]).astype(np.float64)
+        post_terms, post_docs = term_ids[pair_index], doc_ids[pair_index]
+
+        term_first = np.ones(len(post_terms), dtype=bool)
+        term_first[1:] = post_terms[1:] != post_terms[:-1]
+        term_starts = np.r_[np.flatnonzero(term_first), len(post_terms)].astype(np.uint64)
+        unique_terms = post_terms[term_first]
+
+        doc_lengths = np.bincount(doc_ids, minlength=n_docs).astype(np.float64)
+        avg_length = doc_lengths.mean() if n_docs and doc_lengths.any() else 1.0
+        df = np.diff(term_starts).astype(np.float64)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        norm = k1 * (1 - b + b * doc_lengths[post_docs] / avg_length)
+        impact = np.repeat(idf, np.diff(term_starts).astype(np.int64)) * tf * (k1 + 1) / (tf + norm)
+
+        term_max = np.maximum.reduceat(impact, term_starts[:-1].astype(np.int64)) if len(impact) else impact
+
+        doc_starts = np.r_[0, np.cumsum([len(blob) for blob in stored], dtype=np.uint64)].astype(np.uint64)
+        doc_json = b"".join(stored)
+
+        parts = [_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, n_docs, len(unique_terms), len(post_docs),
+                              len(doc_json), k1, b)]
+        for array in (unique_terms.astype("<u8"), term_starts.astype("<u8"), term_max.astype("<f4"),
+                      post_docs.astype("<u4"),
+                      impact.astype("<f4"), doc_starts.astype("<u8")):
+            parts.append(array.tobytes())
+        parts.append(doc_json)
+
+        content = bytearray()
+        for part in parts:
+            content += part
+            content += b"\0" * _padding(len(part))
+        return bytes(content)
+
+    @classmethod
+    def write(cls, path: str, documents: Iterable[Dict[str, str]], k1: float = 1.2, b: float = 0.75) -> int:
+        """
+        색인을 만들어 파일로 저장합니다. 임시 파일에 쓴 뒤 교체하므로 읽는 중인 프로세스에 영향이 없습니다.
+
+        Args:
+            path (str): 저장할 경로
+            documents (Iterable[Dict[str, str]]): 색인할 문서
+            k1 (float): BM25 단어 빈도 포화 계수
+            b (float): BM25 문서 길이 정규화 계수
+
+        Returns:
+            int: 파일 크기 (바이트)
+        """
+        content = cls.build(documents, k1, b)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        return len(content)
+
+    def document(self, doc_id: int) -> Dict[str, str]:
+        """
+        문서 번호로 저장된 문서를 읽습니다.
+
+        Args:
+            doc_id (int): 문서 번호
+
+        Returns:
+            Dict[str, str]: 'title', 'description', 'link', 'source' 키를 가진 문서
+        """
+        start, end = int(self.doc_starts[doc_id]), int(self.doc_starts[doc_id + 1])
+        return orjson.loads(self.doc_json[start:end].tobytes())
+
+    def search_ids(self, query: str, top_k: int = 10) -> List[Tuple[int, float]]:
+        """
+        질의와 관련도가 높은 문서 번호와 점수를 반환합니다.
+
+        흔한 질의 용어(COMMON_TERM_RATIO보다 많은 문서에 나오는 용어)의 긴 포스팅을 모두 읽지 않도록
+        MaxScore 방식으로 후보를 줄입니다. 결과는 전체 포스팅을 합산한 것과 같습니다.
+
+        Args:
+            query (str): 검색어
+            top_k (int): 반환할 최대 개수
+
+        Returns:
+            List[Tuple[int, float]]: (문서 번호, 점수) 목록 (점수 내림차순)
+        """
+        terms, counts = _query_terms(query)
+        if not len(terms) or not self.n_terms or top_k <= 0:
+            return []
+
+        positions = np.searchsorted(self.term_ids, terms)
+        positions[positions == self.n_terms] = 0
+        found = self.term_ids[positions] == terms
+        positions, counts = positions[found], counts[found]
+        if not len(positions):
+            return []
+
+        # 포스팅이 짧은(드문) 용어부터 처리
+        order = np.argsort(self.term_starts[positions + 1] - self.term_starts[positions], kind="stable")
+        positions, counts = positions[order], counts[order]
+        starts = self.term_starts[positions].astype(np.int64)
+        ends = self.term_starts[positions + 1].astype(np.int64)
+        upper_bounds = self.term_max[positions] * counts
+
+        # MaxScore: 드문 용어(앞쪽 essential개)의 포스팅에 있는 문서만 후보로 삼고, 흔한 용어는 후보에 대해서만
+        # 이진 탐색으로 점수를 더함. 후보가 아닌 문서가 얻을 수 있는 최대 점수(흔한 용어 상한의 합)가
+        # top_k번째 점수보다 크면 결과가 달라질 수 있으므로 전체 포스팅을 합산
+        essential = int(np.sum((ends - starts) <= max(self.n_docs * COMMON_TERM_RATIO, top_k)))
+        candidates = scores = None
+        if 0 < essential < len(positions):
+            candidates, scores = self._accumulate(starts[:essential], ends[:essential], counts[:essential])
+            for start, end, count in zip(starts[essential:], ends[essential:], counts[essential:]):
+                segment = self.post_docs[start:end]
+                hit_positions = np.minimum(np.searchsorted(segment, candidates), len(segment) - 1)
+                hits = segment[hit_positions] == candidates
+                scores[hits] += self.post_impact[start + hit_positions[hits]] * count
+            if len(scores) < top_k or upper_bounds[essential:].sum() > np.partition(scores, -top_k)[-top_k]:
+                candidates = scores = None
+        if candidates is None:
+            candidates, scores = self._accumulate(starts, ends, counts)
+
+        if len(candidates) > top_k:
+            best = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            best = np.arange(len(candidates))
+        # 점수가 같으면 문서 번호 순 (색인 생성 시 넣은 순서)
+        best = best[np.lexsort((candidates[best], -scores[best]))]
+        return [(int(candidates[i]), float(scores[i])) for i in best]
+
+    def _accumulate(self, starts: np.ndarray, ends: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """주어진 포스팅 구간들의 가중치를 문서별로 합산하여 (문서 번호, 점수) 배열을 반환합니다."""
+        lengths = ends - starts
+        # 여러 포스팅 구간을 한 번에 모으기 위한 인덱스
+        index = np.repeat(starts - np.r_[0, np.cumsum(lengths)[:-1]], lengths) + np.arange(lengths.sum())
+        docs = self.post_docs[index]
+        weights = self.post_impact[index] * np.repeat(counts, lengths)
+
+        # 정렬 없이 문서 번호로 바로 누적 (포스팅 수 + 문서 수에 선형)
+        scores = np.bincount(docs, weights=weights, minlength=self.n_docs)
+        candidates = np.flatnonzero(scores)
+        return candidates, scores[candidates]
+
+    def search(self, query: str, top_k: int = 10) -> List[Dict[str, str]]:
+        """
+        질의로 검색하여 검색 결과 형식('title', 'description', 'link', 'source')의 목록을 반환합니다.
+
+        Args:
+            query (str): 검색어
+            top_k (int): 반환할 최대 개수
+
+        Returns:
+            List[Dict[str, str]]: 검색 결과 (점수 내림차순)
+        """
+        return [self.document(doc_id) for doc_id, _ in self.search_ids(query, top_k)]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        색인 정보를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 경로, 문서/용어/포스팅 수, 파일 크기
+        """
+        return {
+            "path": self.path,
+            "documents": self.n_docs,
+            "terms": self.n_terms,
+            "postings": self.n_postings,
+            "size_bytes": len(self._buffer),
+        }
+
+
+def backup_documents() -> List[Dict[str, str]]:
+    """
+    restaurant_data의 항목을 색인용 문서로 변환합니다. 지역/음식 종류/날씨는 검색 키워드로 넣습니다.
+
+    Returns:
+        List[Dict[str, str]]: 색인용 문서 목록
+    """
+    documents = []
+    for location, cuisines in restaurant_data.items():
+        for cuisine, weathers in cuisines.items():
+            for weather, entries in weathers.items():
+                for entry in entries:
+                    title, _, description = entry.partition(" - ")
+                    documents.append({
+                        "title": title,
+                        "description": description,
+                        "link": "",
+                        "source": "backup",
+                        "keywords": f"{location} {cuisine} {weather}",
+                    })
+    return documents
+
+
+def search_result_documents(batch_size: int = 1000) -> Iterable[Dict[str, str]]:
+    """
+    DB에 저장된 검색 결과를 색인용 문서로 읽습니다 (정규 URL 기준으로 중복 제거, 최신 행 우선).
+    로컬 검색으로 얻어 저장된 결과는 이미 색인에 있으므로 제외합니다.
+
+    Args:
+        batch_size (int): 서버 측 커서에서 한 번에 가져올 행 수
+
+    Yields:
+        Dict[str, str]: 색인용 문서
+    """
+    # DB 설정 없이도 색인 검색을 쓸 수 있도록 색인 생성 시에만 DB 모듈을 불러옴
+    from sqlalchemy import select
+
+    from ..database import SearchResult, get_session
+
+    seen = set()
+    session = get_session()
+    try:
+        query = (
+            select(SearchResult.title, SearchResult.description, SearchResult.link,
+                   SearchResult.source, SearchResult.cuisine_preference)
+            .where(SearchResult.source.is_distinct_from(LOCAL_SOURCE))
+            .order_by(SearchResult.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        for title, description, link, source, cuisine in session.execute(query):
+            key = canonicalize_url(link) if link else (title, description)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield {
+                "title": title or "",
+                "description": description or "",
+                "link": link or "",
+                "source": source or "",
+                "keywords": cuisine or "",
+            }
+    finally:
+        session.close()
+
+
+def build_local_index(path: str = LOCAL_INDEX_PATH, include_search_results: bool = True) -> LocalIndex:
+    """
+    백업 데이터와 (선택) DB 검색 결과로 색인 파일을 만들고 엽니다.
+
+    Args:
+        path (str): 저장할 경로
+        include_search_results (bool): DB에 저장된 검색 결과 포함 여부
+
+    Returns:
+        LocalIndex: 새로 만든 색인
+    """
+    documents = backup_documents()
+    if include_search_results:
+        documents.extend(search_result_documents())
+    LocalIndex.write(path, documents)
+    return LocalIndex.load(path)
+
+
+_local_index: Optional[LocalIndex] = None
+_local_index_lock = threading.Lock()
+_local_index_missing = False
+
+
+def get_local_index() -> Optional[LocalIndex]:
+    """
+    LOCAL_INDEX_PATH의 색인을 한 번만 열어 반환합니다.
+
+    Returns:
+        Optional[LocalIndex]: 색인 (파일이 없거나 읽을 수 없으면 None)
+    """
+    global _local_index, _local_index_missing
+    if _local_index is not None or _local_index_missing:
+        return _local_index
+    with _local_index_lock:
+        if _local_index is None and not _local_index_missing:
+            try:
+                _local_index = LocalIndex.load(LOCAL_INDEX_PATH)
+                print(f"로컬 검색 색인 로드 완료: {LOCAL_INDEX_PATH} (문서 {_local_index.n_docs}개)")
+            except (OSError, ValueError, LocalIndexError) as e:
+                _local_index_missing = True
+                print(f"⚠️ 로컬 검색 색인을 사용할 수 없습니다 ({LOCAL_INDEX_PATH}): {e}")
+    return _local_index
+
+
+def reload_local_index() -> Optional[LocalIndex]:
+    """
+    색인 파일을 다시 엽니다 (build_local_index.py로 새로 만든 뒤 호출).
+
+    Returns:
+        Optional[LocalIndex]: 새 색인 (파일이 없으면 None)
+    """
+    global _local_index, _local_index_missing
+    with _local_index_lock:
+        _local_index, _local_index_missing = None, False
+    return get_local_index()
+
+
+def _profile_query(user_profile: Dict[str, Any]) -> str:
+    """사용자 프로필로 로컬 검색어를 만듭니다."""
+    special_requirements = user_profile.get('special_requirements') or []
+    if isinstance(special_requirements, (list, tuple)):
+        special_requirements = " ".join(special_requirements)
+    elif special_requirements == "없음":
+        special_requirements = ""
+    fields = [
+        user_profile.get('location', ''),
+        user_profile.get('preferred_cuisine', ''),
+        user_profile.get('weather_condition', ''),
+        user_profile.get('companion_type', ''),
+        user_profile.get('preferred_ambiance', ''),
+        special_requirements,
+    ]
+    return " ".join(field for field in fields if field)
+
+
+def search_restaurants_local(user_profile: Dict[str, Any], top_k: int = LOCAL_INDEX_TOP_K) -> List[Dict[str, str]]:
+    """
+    사용자 프로필로 로컬 색인을 검색합니다. 색인이 없으면 restaurant_data 백업 데이터를 사용합니다.
+
+    Args:
+        user_profile (Dict[str, Any]): 사용자 프로필 정보
+        top_k (int): 반환할 최대 개수
+
+    Returns:
+        List[Dict[str, str]]: 검색 결과 ('title', 'description', 'link', 'source')
+    """
+    index = get_local_index()
+    if index is not None:
+        results = index.search(_profile_query(user_profile), top_k)
+        if results:
+            return results
+
+    entries = search_restaurants_backup(
+        user_profile.get('location', ''),
+        user_profile.get('preferred_cuisine', ''),
+        user_profile.get('weather_condition', ''),
+    )
+    results = []
+    for entry in entries:
+        title, _, description = entry.partition(" - ")
+        results.append({"title": title, "description": description, "link": "", "source": "backup"})
+    return results
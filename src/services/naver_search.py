@@ -1,103 +1,464 @@
+import asyncio
+import concurrent.futures
+import contextvars
 import os
-import json
-import urllib.request
-import urllib.parse
-import urllib.error
-from typing import List, Dict, Any
+import threading
+import unicodedata
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+import httpx
+import orjson
+
+from ..utils.cache import TTLCache
+from ..utils.circuit_breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpenError
+from ..utils.concurrency import ConcurrencyLimiter
+from ..utils.hedging import HedgePolicy
+from ..utils.metrics import external_call_metrics
+from ..utils.rate_limiter import RateLimitError, TokenBucketLimiter
+from ..utils.executor import get_executor
+from ..utils.singleflight import SingleFlight
+from .dedup import SEARCH_DEDUP_ENABLED, dedupe_if_enabled, dedupe_search_results
 
 class NaverAPIError(Exception):
     """네이버 API 호출 시 발생하는 오류"""
     pass
 
+class NaverCircuitOpenError(NaverAPIError):
+    """네이버 서킷 브레이커가 열려 있어 호출하지 않았을 때 발생하는 오류"""
+    pass
+
+class NaverRateLimitedError(NaverAPIError):
+    """네이버 API가 속도 제한(HTTP 429)으로 거절했거나, 로컬 속도 제한/쿼터로 호출하지 않았을 때 발생하는 오류"""
+    pass
+
+NAVER_WEB_SEARCH_URL = "https://openapi.naver.com/v1/search/webkr.json"  # 웹 검색 API
+
+def _http2_available() -> bool:
+    """HTTP/2 사용에 필요한 h2 패키지가 설치되어 있는지 확인합니다."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+class NaverSearchClient:
+    """
+    커넥션 풀을 재사용하는 네이버 검색 API 클라이언트
+
+    동기(httpx.Client)와 비동기(httpx.AsyncClient) 클라이언트를 지연 생성하여 재사용합니다.
+    연결은 keep-alive로 유지되고, h2 패키지가 설치되어 있으면 HTTP/2를 사용합니다.
+    연결/읽기 타임아웃은 환경변수로 설정할 수 있습니다.
+    """
+
+    def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None,
+                 connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None,
+                 max_connections: Optional[int] = None, max_keepalive_connections: Optional[int] = None,
+                 http2: Optional[bool] = None):
+        """
+        NaverSearchClient 초기화
+
+        Args:
+            client_id (str, optional): 네이버 클라이언트 ID. None이면 호출 시 환경변수에서 읽음
+            client_secret (str, optional): 네이버 클라이언트 시크릿. None이면 호출 시 환경변수에서 읽음
+            connect_timeout (float, optional): 연결 타임아웃 (초)
+            read_timeout (float, optional): 읽기 타임아웃 (초)
+            max_connections (int, optional): 풀의 최대 연결 수
+            max_keepalive_connections (int, optional): 유지할 최대 keep-alive 연결 수
+            http2 (bool, optional): HTTP/2 사용 여부. None이면 h2 설치 여부로 결정
+        """
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self.connect_timeout = connect_timeout if connect_timeout is not None else float(os.getenv("NAVER_CONNECT_TIMEOUT", "3.0"))
+        self.read_timeout = read_timeout if read_timeout is not None else float(os.getenv("NAVER_READ_TIMEOUT", "5.0"))
+        self.max_connections = max_connections or int(os.getenv("NAVER_MAX_CONNECTIONS", "20"))
+        self.max_keepalive_connections = max_keepalive_connections or int(os.getenv("NAVER_MAX_KEEPALIVE_CONNECTIONS", "10"))
+        if http2 is None:
+            http2 = os.getenv("NAVER_HTTP2", "true").lower() == "true" and _http2_available()
+        self.http2 = http2
+
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _timeout(self) -> httpx.Timeout:
+        """연결/읽기/쓰기/풀 대기 타임아웃을 생성합니다."""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.read_timeout,
+            pool=self.connect_timeout
+        )
+
+    def _limits(self) -> httpx.Limits:
+        """커넥션 풀 한도를 생성합니다."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections
+        )
+
+    def _headers(self) -> Dict[str, str]:
+        """인증 헤더를 생성합니다."""
+        client_id = self._client_id or os.getenv("NAVER_CLIENT_ID")
+        client_secret = self._client_secret or os.getenv("NAVER_CLIENT_SECRET")
+
+        if not client_id or not client_secret:
+            raise ValueError("네이버 API 클라이언트 ID와 시크릿이 설정되지 않았습니다. .env 파일을 확인하세요.")
+
+        return {
+            "X-Naver-Client-Id": client_id,
+            "X-Naver-Client-Secret": client_secret
+        }
+
+    @staticmethod
+    def _params(query: str, display: int) -> Dict[str, Any]:
+        """검색 요청 파라미터를 생성합니다."""
+        return {
+            "query": query,
+            "display": display,
+            "start": 1,
+            "sort": "sim"  # 정렬 옵션: sim(유사도순), date(날짜순)
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        """공유 동기 HTTP 클라이언트"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        http2=self.http2,
+                        timeout=self._timeout(),
+                        limits=self._limits()
+                    )
+        return self._client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        공유 비동기 HTTP 클라이언트
+
+        비동기 연결은 생성된 이벤트 루프에 묶이므로, 다른 루프에서 호출되면 새로 생성합니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self._timeout(),
+                limits=self._limits()
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def search(self, query: str, display: int = 50) -> List[Dict[str, str]]:
+        """
+        네이버 웹 검색 API를 호출합니다.
+
+        Args:
+            query (str): 검색어
+            display (int): 검색 결과 출력 건수
+
+        Returns:
+            List[Dict[str, str]]: 검색 결과 목록
+
+        Raises:
+            ValueError: API 키가 설정되지 않은 경우
+            NaverAPIError: API 호출에 실패한 경우
+        """
+        headers = self._headers()
+        try:
+            response = self.client.get(NAVER_WEB_SEARCH_URL, params=self._params(query, display), headers=headers)
+        except httpx.TimeoutException as e:
+            raise NaverAPIError(f"요청 시간 초과: {e}") from e
+        except httpx.HTTPError as e:
+            raise NaverAPIError(f"URL 오류: {e}") from e
+        return self._parse_response(response)
+
+    async def asearch(self, query: str, display: int = 50) -> List[Dict[str, str]]:
+        """
+        search의 비동기 버전
+
+        Args:
+            query (str): 검색어
+            display (int): 검색 결과 출력 건수
+
+        Returns:
+            List[Dict[str, str]]: 검색 결과 목록
+
+        Raises:
+            ValueError: API 키가 설정되지 않은 경우
+            NaverAPIError: API 호출에 실패한 경우
+        """
+        headers = self._headers()
+        try:
+            response = await self.async_client.get(NAVER_WEB_SEARCH_URL, params=self._params(query, display), headers=headers)
+        except httpx.TimeoutException as e:
+            raise NaverAPIError(f"요청 시간 초과: {e}") from e
+        except httpx.HTTPError as e:
+            raise NaverAPIError(f"URL 오류: {e}") from e
+        return self._parse_response(response)
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> List[Dict[str, str]]:
+        """응답을 검색 결과 목록으로 변환합니다."""
+        if response.status_code == 429:
+            raise NaverRateLimitedError(f"HTTP 오류: 429 - {response.text}")
+        if response.status_code != 200:
+            raise NaverAPIError(f"HTTP 오류: {response.status_code} - {response.text}")
+
+        try:
+            # 바이트를 문자열로 디코딩하지 않고 바로 파싱
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise NaverAPIError(f"응답 파싱 실패: {e}") from e
+
+        # 결과 가공
+        search_results = []
+        try:
+            for item in result.get('items') or []:
+                # HTML 태그 제거
+                title = item['title'].replace('<b>', '').replace('</b>', '')
+                description = item['description'].replace('<b>', '').replace('</b>', '')
+                search_results.append({
+                    "title": title,
+                    "description": description,
+                    "link": item['link']
+                })
+        except (KeyError, TypeError, AttributeError) as e:
+            # 형식이 잘못된 항목도 API 오류로 처리해야 대체 검색과 서킷 브레이커 집계가 동작함
+            raise NaverAPIError(f"응답 형식 오류: {e!r}") from e
+        return search_results
+
+    def close(self) -> None:
+        """동기 HTTP 클라이언트를 닫습니다."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    async def aclose(self) -> None:
+        """비동기 HTTP 클라이언트를 닫습니다."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+
+# 프로세스 전역 네이버 검색 클라이언트
+naver_client = NaverSearchClient()
+
+# 검색 결과 캐시 (같은 검색어가 반복되므로 네트워크 왕복과 일일 쿼터를 절약)
+search_cache = TTLCache(
+    max_entries=int(os.getenv("NAVER_CACHE_MAX_ENTRIES", "1024")),
+    max_bytes=int(os.getenv("NAVER_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+    ttl=float(os.getenv("NAVER_CACHE_TTL_SECONDS", "600")),
+)
+
+# 동일 검색어의 동시 요청 병합 (트래픽이 몰릴 때 네이버 호출 수를 제한)
+search_flight = SingleFlight("naver_search")
+
+# 네이버 API 동시 호출 수 상한 (캐시/병합을 거친 실제 호출에만 적용)
+naver_limiter = ConcurrencyLimiter("naver", int(os.getenv("NAVER_MAX_CONCURRENCY", "8")))
+
+# 네이버 장애 시 요청마다 타임아웃을 기다리지 않도록 호출을 차단 (차단 중에는 로컬 색인으로 대체)
+naver_breaker = CircuitBreaker(
+    "naver",
+    failure_rate_threshold=float(os.getenv("NAVER_BREAKER_FAILURE_RATE", "0.5")),
+    slow_call_seconds=float(os.getenv("NAVER_BREAKER_SLOW_CALL_SECONDS", "2.0")),
+    slow_call_rate_threshold=float(os.getenv("NAVER_BREAKER_SLOW_CALL_RATE", "0.8")),
+    window_size=int(os.getenv("NAVER_BREAKER_WINDOW_SIZE", "20")),
+    minimum_calls=int(os.getenv("NAVER_BREAKER_MINIMUM_CALLS", "10")),
+    open_seconds=float(os.getenv("NAVER_BREAKER_OPEN_SECONDS", "30")),
+    half_open_probes=int(os.getenv("NAVER_BREAKER_HALF_OPEN_PROBES", "3")),
+    failure_exceptions=(NaverAPIError,),
+)
+
+# 초당 호출 수/일일 쿼터 제한 (초과분은 기한 안에서 대기열에서 기다리고, 쿼터가 얼마 남지 않으면 degraded)
+naver_rate_limiter = TokenBucketLimiter(
+    "naver",
+    rate=float(os.getenv("NAVER_RATE_PER_SECOND", "10")),
+    burst=int(os.getenv("NAVER_RATE_BURST", "10")),
+    max_queue=int(os.getenv("NAVER_RATE_MAX_QUEUE", "100")),
+    default_timeout=float(os.getenv("NAVER_RATE_MAX_WAIT_SECONDS", "2.0")),
+    daily_quota=int(os.getenv("NAVER_DAILY_QUOTA", "25000")),
+    degraded_ratio=float(os.getenv("NAVER_QUOTA_DEGRADED_RATIO", "0.9")),
+    timezone=os.getenv("NAVER_QUOTA_TIMEZONE", "Asia/Seoul"),
+    penalty_seconds=float(os.getenv("NAVER_RATE_429_PENALTY_SECONDS", "1.0")),
+)
+
+# 느린 요청이 응답 시간 꼬리를 결정하지 않도록, 최근 지연 시간의 p90을 넘기면 같은 요청을 한 번 더 보냄
+# (비동기 경로에만 적용. 비활성화해도 지연 시간 분포는 기록)
+naver_hedge = HedgePolicy(
+    "naver",
+    quantile=float(os.getenv("NAVER_HEDGE_QUANTILE", "0.9")),
+    initial_delay=float(os.getenv("NAVER_HEDGE_INITIAL_DELAY_MS", "500")) / 1000,
+    min_delay=float(os.getenv("NAVER_HEDGE_MIN_DELAY_MS", "50")) / 1000,
+    max_delay=float(os.getenv("NAVER_HEDGE_MAX_DELAY_MS", "2000")) / 1000,
+    max_hedge_ratio=(
+        float(os.getenv("NAVER_HEDGE_MAX_PERCENT", "5")) / 100
+        if os.getenv("NAVER_HEDGE_ENABLED", "false").lower() == "true" else 0.0
+    ),
+)
+
+# 네이버 API 실제 호출 지표 (서킷 브레이커가 차단한 호출은 제외)
+_naver_call_metrics = external_call_metrics.bind("naver")
+
+def _check_breaker() -> None:
+    """서킷이 열려 있으면 속도 제한 토큰/쿼터를 쓰기 전에 바로 실패합니다."""
+    if naver_breaker.state == OPEN:
+        raise NaverCircuitOpenError(f"서킷 브레이커 [{naver_breaker.name}]가 열려 있어 호출하지 않았습니다.")
+
+@contextmanager
+def _naver_call() -> Iterator[None]:
+    """
+    네이버 API 호출 하나를 서킷 브레이커로 보호합니다.
+    차단된 경우 기존 오류 처리(NaverAPIError)를 그대로 타도록 NaverCircuitOpenError로 바꿔 발생시킵니다.
+    """
+    try:
+        with naver_breaker.call(), _naver_call_metrics.track():
+            yield
+    except CircuitOpenError as e:
+        raise NaverCircuitOpenError(str(e)) from e
+    except NaverRateLimitedError:
+        # 429를 받으면 즉시 재시도하지 않도록 이후 호출을 일정 시간 미룸
+        naver_rate_limiter.penalize()
+        raise
+
+def _acquire_rate_limit() -> None:
+    """네이버 호출 전 속도 제한/쿼터 토큰을 기다립니다 (기한을 넘거나 쿼터가 없으면 NaverRateLimitedError)."""
+    _check_breaker()
+    try:
+        naver_rate_limiter.acquire()
+    except RateLimitError as e:
+        raise NaverRateLimitedError(str(e)) from e
+
+async def _aacquire_rate_limit() -> None:
+    """_acquire_rate_limit의 비동기 버전"""
+    _check_breaker()
+    try:
+        await naver_rate_limiter.aacquire()
+    except RateLimitError as e:
+        raise NaverRateLimitedError(str(e)) from e
+
+def _can_hedge() -> bool:
+    """
+    헤지 요청을 보낼 수 있는지 확인합니다.
+    서킷이 정상이고, 쿼터가 넉넉하고, 기다리지 않고 속도 제한 토큰을 얻을 수 있을 때만 보냅니다.
+    """
+    if naver_breaker.state != CLOSED or naver_rate_limiter.degraded:
+        return False
+    return naver_rate_limiter.try_acquire()
+
+def normalize_query(query: str) -> str:
+    """
+    캐시 키로 사용할 수 있도록 검색어를 정규화합니다.
+    (유니코드 NFC 정규화, 연속 공백 축소, 소문자 변환)
+
+    Args:
+        query (str): 검색어
+
+    Returns:
+        str: 정규화된 검색어
+    """
+    return " ".join(unicodedata.normalize("NFC", query).split()).lower()
+
+def _cache_key(query: str, display: int) -> Tuple[str, int]:
+    """검색어와 출력 건수로 캐시 키를 생성합니다."""
+    return (normalize_query(query), display)
+
+def _get_cached(key: Tuple[str, int]) -> Optional[List[Dict[str, str]]]:
+    """캐시된 검색 결과를 조회합니다. 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본을 반환합니다."""
+    cached = search_cache.get(key)
+    if cached is None:
+        return None
+    return [dict(item) for item in cached]
+
+def _set_cached(key: Tuple[str, int], search_results: List[Dict[str, str]]) -> None:
+    """검색 결과를 캐시에 저장합니다."""
+    search_cache.set(key, tuple(dict(item) for item in search_results))
+
 def search_web(query: str, display: int = 50) -> List[Dict[str, str]]:
     """
     네이버 웹 검색 API를 사용하여 정보를 검색하고 구조화된 딕셔너리 리스트를 반환합니다.
-    
+    같은 검색어의 결과가 캐시에 있으면 네트워크 요청 없이 캐시된 결과를 반환합니다.
+
     Args:
         query (str): 검색어
         display (int): 검색 결과 출력 건수 (기본값 50)
-        
+
     Returns:
         List[Dict[str, str]]: 검색 결과 목록. 각 항목은 'title', 'description', 'link' 키를 가집니다.
-        
+
     Raises:
         ValueError: API 키가 설정되지 않은 경우
         NaverAPIError: API 호출에 실패한 경우
     """
-    client_id = os.getenv("NAVER_CLIENT_ID")
-    client_secret = os.getenv("NAVER_CLIENT_SECRET")
-    
-    if not client_id or not client_secret:
-        raise ValueError("네이버 API 클라이언트 ID와 시크릿이 설정되지 않았습니다. .env 파일을 확인하세요.")
-    
-    url = "https://openapi.naver.com/v1/search/webkr.json"  # 웹 검색 API
-    params = {
-        "query": query,
-        "display": display,
-        "start": 1,
-        "sort": "sim"  # 정렬 옵션: sim(유사도순), date(날짜순)
-    }
-    
-    # URL 인코딩
-    query_string = urllib.parse.urlencode(params)
-    request_url = url + "?" + query_string
-    
-    # HTTP 요청 헤더 설정
-    request = urllib.request.Request(request_url)
-    request.add_header("X-Naver-Client-Id", client_id)
-    request.add_header("X-Naver-Client-Secret", client_secret)
-    
-    try:
-        # API 요청 보내기
-        response = urllib.request.urlopen(request)
-        
-        # 응답 처리
-        response_code = response.getcode()
-        if response_code == 200:  # 정상 응답
-            response_body = response.read()
-            response_body_str = response_body.decode('utf-8')
-            result = json.loads(response_body_str)
-            
-            # 결과 가공
-            search_results = []
-            if 'items' in result and result['items']:
-                for item in result['items']:
-                    # HTML 태그 제거
-                    title = item['title'].replace('<b>', '').replace('</b>', '')
-                    description = item['description'].replace('<b>', '').replace('</b>', '')
-                    search_results.append({
-                        "title": title,
-                        "description": description,
-                        "link": item['link']
-                    })
-            return search_results
-        else:
-            raise NaverAPIError(f"API 호출 실패: {response_code}")
-            
-    except urllib.error.HTTPError as e:
-        raise NaverAPIError(f"HTTP 오류: {e.code} - {e.read().decode('utf-8')}") from e
-    except urllib.error.URLError as e:
-        raise NaverAPIError(f"URL 오류: {e.reason}") from e
-    except Exception as e:
-        raise NaverAPIError(f"검색 중 알 수 없는 오류 발생: {e}") from e
-
-def search_restaurants_naver(user_profile: Dict[str, Any]) -> List[Dict[str, str]]:
+    key = _cache_key(query, display)
+    cached = _get_cached(key)
+    if cached is not None:
+        return cached
+
+    # 같은 검색어로 진행 중인 요청이 있으면 그 결과를 함께 사용
+    search_results = search_flight.do(key, _fetch_and_cache, key, query, display)
+    return [dict(item) for item in search_results]
+
+def _fetch_and_cache(key: Tuple[str, int], query: str, display: int) -> Tuple[Dict[str, str], ...]:
+    """네이버 API를 호출하고 결과를 캐시에 저장합니다. 공유되는 결과이므로 튜플로 반환합니다."""
+    _acquire_rate_limit()
+    with naver_limiter.slot(), _naver_call():
+        search_results = naver_client.search(query, display)
+    # 중복을 제거한 뒤 캐시하여 캐시 적중 시에도 다시 계산하지 않음
+    search_results = dedupe_if_enabled(search_results)
+    _set_cached(key, search_results)
+    return tuple(search_results)
+
+async def asearch_web(query: str, display: int = 50) -> List[Dict[str, str]]:
     """
-    사용자 프로필을 기반으로 네이버 웹 검색 API를 사용하여 맛집을 검색합니다.
-    
+    search_web의 비동기 버전
+
     Args:
-        user_profile (Dict[str, Any]): 사용자 프로필 정보
-        
+        query (str): 검색어
+        display (int): 검색 결과 출력 건수 (기본값 50)
+
     Returns:
-        List[Dict[str, str]]: 맛집 추천 목록
+        List[Dict[str, str]]: 검색 결과 목록
+
+    Raises:
+        ValueError: API 키가 설정되지 않은 경우
+        NaverAPIError: API 호출에 실패한 경우
     """
+    key = _cache_key(query, display)
+    cached = _get_cached(key)
+    if cached is not None:
+        return cached
+
+    # 같은 검색어로 진행 중인 요청이 있으면 그 결과를 함께 사용
+    search_results = await search_flight.ado(key, _afetch_and_cache, key, query, display)
+    return [dict(item) for item in search_results]
+
+async def _afetch_and_cache(key: Tuple[str, int], query: str, display: int) -> Tuple[Dict[str, str], ...]:
+    """_fetch_and_cache의 비동기 버전 (헤징 적용)"""
+    await _aacquire_rate_limit()
+
+    async def attempt() -> List[Dict[str, str]]:
+        async with naver_limiter.aslot():
+            with _naver_call():
+                return await naver_client.asearch(query, display)
+
+    search_results = await naver_hedge.run(attempt, can_hedge=_can_hedge)
+    search_results = dedupe_if_enabled(search_results)
+    _set_cached(key, search_results)
+    return tuple(search_results)
+
+def _build_queries(user_profile: Dict[str, Any]) -> Tuple[str, str]:
+    """사용자 프로필로 전체 검색어와 단순 검색어를 생성합니다."""
     location = user_profile.get('location', '')
     cuisine = user_profile.get('preferred_cuisine', '')
     weather = user_profile.get('weather_condition', '')
     companion_type = user_profile.get('companion_type', '')
     ambiance = user_profile.get('preferred_ambiance', '')
     special_requirements = user_profile.get('special_requirements', [])
-    
+
     # 특별 요구사항을 검색어에 추가
     requirements_str = ""
     if special_requirements and special_requirements != "없음":
@@ -105,29 +466,169 @@ def search_restaurants_naver(user_profile: Dict[str, Any]) -> List[Dict[str, str
             requirements_str = special_requirements
         elif isinstance(special_requirements, list):
             requirements_str = " ".join(special_requirements)
-    
+
     # 검색어 조합
     query_parts = [location, cuisine, weather, companion_type, ambiance, requirements_str, "맛집 추천"]
     query = " ".join([part for part in query_parts if part])
-    
+    query_simple = f"{location} {cuisine} 맛집"
+    return query, query_simple
+
+def _search_queries(user_profile: Dict[str, Any], single_query: bool = False) -> List[str]:
+    """
+    동시에 실행할 검색어 목록을 생성합니다.
+    두 검색어가 같거나, 일일 쿼터가 부족하거나, single_query이면 한 번만 검색합니다.
+    """
+    query, query_simple = _build_queries(user_profile)
     print(f"네이버 검색어: {query}")
-    
+    if normalize_query(query) == normalize_query(query_simple):
+        return [query]
+    if single_query:
+        # 남은 시간이 적으면 두 번째 검색어를 기다리거나 재시도하지 않음
+        print("남은 시간이 부족하여 단순 검색어 동시 검색을 생략합니다.")
+        return [query]
+    if naver_rate_limiter.degraded:
+        # 일일 쿼터가 얼마 남지 않으면 요청당 호출 수를 줄임
+        print("네이버 일일 쿼터가 얼마 남지 않아 단순 검색어 동시 검색을 생략합니다.")
+        return [query]
+    print(f"동시 검색어: {query_simple}")
+    return [query, query_simple]
+
+def _merge_results(results_list: List[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    """
+    여러 검색 결과를 순서대로 합치고 중복을 제거합니다.
+    (SEARCH_DEDUP_ENABLED가 꺼져 있어도 정규 URL이 같은 결과는 제거)
+    """
+    merged = [result for results in results_list for result in results]
+    if not SEARCH_DEDUP_ENABLED:
+        return dedupe_search_results(merged, max_distance=-1)
+    return dedupe_if_enabled(merged)
+
+def _fanout_options(strategy: Optional[str], cancel_pending: Optional[bool]) -> Tuple[str, bool]:
+    """fan-out 전략과 미완료 요청 취소 여부를 결정합니다 (인자가 없으면 환경변수 사용)."""
+    strategy = (strategy or os.getenv("NAVER_FANOUT_STRATEGY", "first")).lower()
+    if strategy not in ("first", "merge"):
+        raise ValueError(f"지원하지 않는 검색 전략입니다: {strategy}")
+    if cancel_pending is None:
+        cancel_pending = os.getenv("NAVER_FANOUT_CANCEL_PENDING", "true").lower() == "true"
+    return strategy, cancel_pending
+
+def search_restaurants_naver(user_profile: Dict[str, Any], strategy: Optional[str] = None,
+                             cancel_pending: Optional[bool] = None,
+                             single_query: bool = False) -> List[Dict[str, str]]:
+    """
+    사용자 프로필을 기반으로 네이버 웹 검색 API를 사용하여 맛집을 검색합니다.
+
+    전체 검색어와 단순 검색어("{지역} {음식} 맛집")를 동시에 요청하므로
+    첫 번째 검색이 실패하거나 비어 있어도 추가 왕복 시간이 들지 않습니다.
+
+    Args:
+        user_profile (Dict[str, Any]): 사용자 프로필 정보
+        strategy (str, optional): "first"(먼저 도착한 비어 있지 않은 결과 사용) 또는
+            "merge"(두 결과를 합치고 링크 기준 중복 제거). None이면 NAVER_FANOUT_STRATEGY 사용
+        cancel_pending (bool, optional): "first" 전략에서 결과가 정해진 뒤 남은 요청을 취소할지 여부.
+            None이면 NAVER_FANOUT_CANCEL_PENDING 사용
+        single_query (bool): True이면 전체 검색어 하나만 검색 (마감 시각이 가까운 경우)
+
+    Returns:
+        List[Dict[str, str]]: 맛집 추천 목록
+    """
+    strategy, cancel_pending = _fanout_options(strategy, cancel_pending)
+    queries = _search_queries(user_profile, single_query)
+
+    executor = get_executor()
+    futures = [executor.submit(contextvars.copy_context().run, search_web, q) for q in queries]
+
+    if strategy == "merge":
+        results_list = []
+        for query, future in zip(queries, futures):
+            try:
+                results_list.append(future.result())
+            except NaverAPIError as e:
+                print(f"네이버 API 오류 발생 ({query}): {e}")
+        return _merge_results(results_list)
+
     try:
-        results = search_web(query)
-        if not results:
-            # 결과가 없을 경우, 더 간단한 검색어로 재시도
-            print("첫 번째 검색 결과가 없습니다. 단순 검색어로 재시도합니다.")
-            query_simple = f"{location} {cuisine} 맛집"
-            print(f"재시도 검색어: {query_simple}")
-            results = search_web(query_simple)
-    except NaverAPIError as e:
-        print(f"네이버 API 오류 발생: {e}. 단순 검색어로 재시도합니다.")
-        query_simple = f"{location} {cuisine} 맛집"
-        print(f"재시도 검색어: {query_simple}")
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results = future.result()
+            except NaverAPIError as e:
+                print(f"네이버 API 오류 발생: {e}")
+                continue
+            if results:
+                return results
+        print("모든 검색어의 결과가 없습니다.")
+        return []
+    finally:
+        if cancel_pending:
+            # 아직 시작되지 않은 요청만 취소됨 (이미 실행 중인 스레드는 끝까지 실행되어 캐시를 채움)
+            for future in futures:
+                future.cancel()
+
+async def asearch_restaurants_naver(user_profile: Dict[str, Any], strategy: Optional[str] = None,
+                                    cancel_pending: Optional[bool] = None,
+                                    single_query: bool = False) -> List[Dict[str, str]]:
+    """
+    search_restaurants_naver의 비동기 버전
+
+    Args:
+        user_profile (Dict[str, Any]): 사용자 프로필 정보
+        strategy (str, optional): "first" 또는 "merge". None이면 NAVER_FANOUT_STRATEGY 사용
+        cancel_pending (bool, optional): 결과가 정해진 뒤 남은 요청을 취소할지 여부.
+            None이면 NAVER_FANOUT_CANCEL_PENDING 사용
+        single_query (bool): True이면 전체 검색어 하나만 검색 (마감 시각이 가까운 경우)
+
+    Returns:
+        List[Dict[str, str]]: 맛집 추천 목록
+    """
+    strategy, cancel_pending = _fanout_options(strategy, cancel_pending)
+    queries = _search_queries(user_profile, single_query)
+    tasks = [asyncio.ensure_future(asearch_web(q)) for q in queries]
+
+    if strategy == "merge":
         try:
-            results = search_web(query_simple)
-        except NaverAPIError as e_simple:
-            print(f"재시도 중에도 오류 발생: {e_simple}")
-            return []  # 재시도 실패 시 빈 리스트 반환
-            
-    return results
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+        results_list = []
+        for query, outcome in zip(queries, outcomes):
+            if isinstance(outcome, NaverAPIError):
+                print(f"네이버 API 오류 발생 ({query}): {outcome}")
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results_list.append(outcome)
+        return _merge_results(results_list)
+
+    cancelled = False
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                results = await next_done
+            except NaverAPIError as e:
+                print(f"네이버 API 오류 발생: {e}")
+                continue
+            if results:
+                return results
+        print("모든 검색어의 결과가 없습니다.")
+        return []
+    except asyncio.CancelledError:
+        cancelled = True
+        raise
+    finally:
+        for task in tasks:
+            if task.done():
+                # 이미 끝났지만 결과를 확인하지 않은 태스크 (다른 태스크의 예외로 먼저 빠져나온 경우)
+                _consume_task_result(task)
+                continue
+            if cancel_pending or cancelled:
+                task.cancel()
+            else:
+                # 남은 요청은 백그라운드에서 끝까지 실행되어 캐시를 채움
+                task.add_done_callback(_consume_task_result)
+
+def _consume_task_result(task: "asyncio.Task") -> None:
+    """백그라운드로 남겨 둔 태스크의 예외를 소비하여 경고 로그를 막습니다."""
+    if not task.cancelled():
+        task.exception()
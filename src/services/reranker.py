@@ -0,0 +1,173 @@
+"""
+검색 결과 로컬 재정렬(re-ranking)
+
+네이버 검색 결과를 사용자 프로필(음식 종류, 분위기, 동반자 유형, 특별 요구사항)과의
+BM25 점수로 재정렬하여 상위 k개만 LLM 프롬프트에 넣습니다.
+
+한국어는 띄어쓰기와 조사 때문에 단어 단위 매칭이 잘 맞지 않으므로 문자 n-gram(기본 2, 3-gram)을
+토큰으로 사용합니다 (text_ngrams 모듈). 문서 전체의 토큰화와 단어 빈도(TF) 계산을
+파이썬 반복문 없이 NumPy 연산으로 처리합니다.
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .text_ngrams import MAX_NGRAM, codepoints, concat_codepoints, document_ngrams, ngram_ids, normalize_text, result_text
+
+
+class BM25Reranker:
+    """
+    문자 n-gram BM25 점수 계산기
+
+    문서 집합(검색 결과 목록)마다 IDF를 새로 계산하므로 별도의 색인이나 학습이 필요 없습니다.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, ngram_sizes: Tuple[int, ...] = (2, 3)):
+        """
+        BM25Reranker 초기화
+
+        Args:
+            k1 (float): 단어 빈도 포화 계수
+            b (float): 문서 길이 정규화 계수
+            ngram_sizes (Tuple[int, ...]): 사용할 n-gram 크기 (1~3)
+
+        Raises:
+            ValueError: 지원하지 않는 n-gram 크기
+        """
+        if not ngram_sizes or any(n < 1 or n > MAX_NGRAM for n in ngram_sizes):
+            raise ValueError(f"n-gram 크기는 1~{MAX_NGRAM} 사이여야 합니다: {ngram_sizes}")
+        self.k1 = k1
+        self.b = b
+        self.ngram_sizes = tuple(ngram_sizes)
+
+    def _query_terms(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """질의의 고유 n-gram ID(정렬됨)와 질의 내 빈도를 반환합니다."""
+        query_codepoints = codepoints(normalize_text(query))
+        ids = np.concatenate([ngram_ids(query_codepoints, n) for n in self.ngram_sizes])
+        return np.unique(ids, return_counts=True)
+
+    def _term_frequencies(self, documents: Sequence[str], terms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        문서별 질의 n-gram 빈도 행렬(문서 수 x 질의 n-gram 수)과 문서 길이(n-gram 수)를 계산합니다.
+
+        모든 문서를 구분자(코드 포인트 0)로 이어 붙여 한 번에 n-gram을 만들고,
+        구분자를 포함한 n-gram은 버린 뒤 질의 n-gram과 searchsorted로 매칭합니다.
+        """
+        texts = [normalize_text(document) for document in documents]
+        joined, doc_of_char = concat_codepoints(texts)
+
+        n_docs, n_terms = len(texts), len(terms)
+        tf = np.zeros(n_docs * n_terms, dtype=np.float64)
+        lengths = np.zeros(n_docs, dtype=np.float64)
+
+        for n in self.ngram_sizes:
+            ids, doc_ids = document_ngrams(joined, doc_of_char, n)
+            if not len(ids):
+                continue
+            lengths += np.bincount(doc_ids, minlength=n_docs)
+
+            positions = np.searchsorted(terms, ids)
+            positions[positions == n_terms] = 0
+            matched = terms[positions] == ids
+            tf += np.bincount(doc_ids[matched] * n_terms + positions[matched], minlength=n_docs * n_terms)
+
+        return tf.reshape(n_docs, n_terms), lengths
+
+    def score(self, query: str, documents: Sequence[str]) -> np.ndarray:
+        """
+        문서별 BM25 점수를 계산합니다.
+
+        Args:
+            query (str): 질의 (사용자 선호 정보를 이어 붙인 문자열)
+            documents (Sequence[str]): 문서 목록
+
+        Returns:
+            np.ndarray: 문서별 점수 (documents와 같은 순서)
+        """
+        if not documents:
+            return np.zeros(0)
+        terms, query_counts = self._query_terms(query)
+        if not len(terms):
+            return np.zeros(len(documents))
+
+        tf, lengths = self._term_frequencies(documents, terms)
+        n_docs = len(documents)
+        df = np.count_nonzero(tf, axis=0)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        avg_length = lengths.mean() or 1.0
+
+        norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+        weights = tf * (self.k1 + 1) / (tf + norm[:, None])
+        return weights @ (idf * query_counts)
+
+    def rerank(self, query: str, items: Sequence[Any], top_k: int,
+               text_of: Callable[[Any], str] = str) -> List[Any]:
+        """
+        항목을 BM25 점수 내림차순으로 정렬하여 상위 top_k개를 반환합니다.
+        점수가 같으면 원래 순서(검색 엔진 순위)를 유지합니다.
+
+        Args:
+            query (str): 질의
+            items (Sequence[Any]): 정렬할 항목 목록
+            top_k (int): 반환할 개수 (0 이하이면 전체)
+            text_of (Callable): 항목에서 점수 계산에 쓸 텍스트를 꺼내는 함수
+
+        Returns:
+            List[Any]: 재정렬된 상위 항목
+        """
+        if not items:
+            return []
+        scores = self.score(query, [text_of(item) for item in items])
+        order = np.argsort(-scores, kind="stable")
+        if top_k > 0:
+            order = order[:top_k]
+        return [items[i] for i in order]
+
+
+# 프롬프트에 넣을 상위 결과 수 (0이면 재정렬만 하고 자르지 않음)
+RERANK_TOP_K = int(os.getenv("RERANK_TOP_K", "10"))
+
+reranker = BM25Reranker(
+    k1=float(os.getenv("RERANK_BM25_K1", "1.2")),
+    b=float(os.getenv("RERANK_BM25_B", "0.75")),
+)
+
+
+def profile_query(state: Dict[str, Any]) -> str:
+    """
+    사용자 입력에서 재정렬 질의를 만듭니다 (음식 종류, 분위기, 동반자 유형, 특별 요구사항).
+
+    Args:
+        state (Dict[str, Any]): 워크플로우 상태
+
+    Returns:
+        str: 질의 문자열
+    """
+    special_requirements = state.get('special_requirements') or ""
+    if isinstance(special_requirements, (list, tuple)):
+        special_requirements = " ".join(special_requirements)
+    fields = [
+        state.get('cuisine_preference') or "",
+        state.get('ambiance') or "",
+        state.get('companion_type') or "",
+        special_requirements,
+    ]
+    return " ".join(field for field in fields if field)
+
+
+def rerank_search_results(state: Dict[str, Any], search_results: List[Dict[str, str]],
+                          top_k: int = RERANK_TOP_K) -> List[Dict[str, str]]:
+    """
+    검색 결과를 사용자 선호와의 관련도로 재정렬하여 상위 top_k개를 반환합니다.
+
+    Args:
+        state (Dict[str, Any]): 워크플로우 상태 (사용자 입력 포함)
+        search_results (List[Dict[str, str]]): 검색 결과 목록
+        top_k (int): 반환할 개수 (0 이하이면 전체)
+
+    Returns:
+        List[Dict[str, str]]: 재정렬된 검색 결과
+    """
+    return reranker.rerank(profile_query(state), search_results, top_k, text_of=result_text)
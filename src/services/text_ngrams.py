@@ -0,0 +1,114 @@
+"""
+문자 n-gram 토큰화
+
+검색 결과 재정렬(BM25), 중복 제거(SimHash), 오프라인 로컬 색인이 함께 사용하는 토큰화 함수입니다.
+
+한국어는 띄어쓰기와 조사 때문에 단어 단위 매칭이 잘 맞지 않으므로 문자 n-gram을 토큰으로 사용합니다.
+n-gram은 유니코드 코드 포인트를 비트 연산으로 묶은 정수로 표현하므로(최대 3-gram까지 64비트 정수 하나)
+해시 충돌 없이 그대로 용어 ID로 쓸 수 있고, 여러 문서의 토큰화를 파이썬 반복문 없이 NumPy 연산으로 처리합니다.
+"""
+
+import re
+import unicodedata
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+# 유니코드 코드 포인트는 21비트 이내이므로 n-gram 하나를 64비트 정수 하나로 표현 (최대 3-gram)
+CODEPOINT_BITS = 21
+MAX_NGRAM = 3
+# 영숫자/한글 이외의 문자(공백, 문장 부호, 밑줄)는 제거
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    n-gram 추출 전 텍스트를 정규화합니다 (NFC 정규화, 소문자 변환, 공백/문장 부호 제거).
+
+    Args:
+        text (str): 원본 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    return _NON_WORD.sub("", unicodedata.normalize("NFC", text).lower())
+
+
+def codepoints(text: str) -> np.ndarray:
+    """
+    텍스트를 코드 포인트 배열로 변환합니다.
+
+    Args:
+        text (str): 텍스트 (보통 normalize_text로 정규화한 값)
+
+    Returns:
+        np.ndarray: 코드 포인트 배열 (uint64)
+    """
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+
+def ngram_ids(codepoints: np.ndarray, n: int) -> np.ndarray:
+    """
+    코드 포인트 배열에서 n-gram 정수 ID 배열을 만듭니다.
+
+    Args:
+        codepoints (np.ndarray): 코드 포인트 배열 (uint64)
+        n (int): n-gram 크기 (1~MAX_NGRAM)
+
+    Returns:
+        np.ndarray: n-gram ID 배열 (길이 len(codepoints) - n + 1, 짧으면 빈 배열)
+    """
+    count = len(codepoints) - n + 1
+    if count <= 0:
+        return np.empty(0, dtype=np.uint64)
+    ids = codepoints[:count].copy()
+    for offset in range(1, n):
+        ids = (ids << np.uint64(CODEPOINT_BITS)) | codepoints[offset:offset + count]
+    return ids
+
+
+def concat_codepoints(texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    정규화된 텍스트들을 구분자(코드 포인트 0)로 이어 붙입니다.
+
+    Args:
+        texts (Sequence[str]): 정규화된 텍스트 목록
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 이어 붙인 코드 포인트 배열, 문자별 문서 번호
+    """
+    joined = codepoints("\0".join(texts))
+    # 각 문자가 속한 문서 번호 (구분자 위치에서 다음 문서로 넘어감)
+    return joined, np.cumsum(joined == 0)
+
+
+def document_ngrams(codepoints: np.ndarray, doc_of_char: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    concat_codepoints로 이어 붙인 배열에서 구분자를 포함하지 않는 n-gram과 그 문서 번호를 만듭니다.
+
+    Args:
+        codepoints (np.ndarray): 이어 붙인 코드 포인트 배열
+        doc_of_char (np.ndarray): 문자별 문서 번호
+        n (int): n-gram 크기 (1~MAX_NGRAM)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: n-gram ID 배열, n-gram별 문서 번호 (문서 번호 순서)
+    """
+    ids = ngram_ids(codepoints, n)
+    doc_ids = doc_of_char[:len(ids)]
+    # 구분자로 시작하지 않고, 시작/끝 위치의 문서 번호가 같아야 구분자를 포함하지 않음
+    valid = (codepoints[:len(ids)] != 0) & (doc_ids == doc_of_char[n - 1:n - 1 + len(ids)])
+    return ids[valid], doc_ids[valid]
+
+
+def result_text(result: Dict[str, str]) -> str:
+    """
+    검색 결과에서 토큰화할 텍스트를 꺼냅니다 (재정렬 점수와 중복 제거 지문에 함께 사용).
+
+    Args:
+        result (Dict[str, str]): 검색 결과 ('title', 'description')
+
+    Returns:
+        str: 제목 + 설명
+    """
+    return f"{result.get('title', '')} {result.get('description', '')}"
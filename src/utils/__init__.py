@@ -4,6 +4,38 @@ Utils module for food recommendation agent
 이 모듈은 유틸리티 함수들을 제공합니다.
 """
 
-# 현재는 빈 모듈이지만 향후 유틸리티 함수들을 추가할 수 있습니다.
+from .executor import get_executor, run_blocking, shutdown_executor
+from .cache import TTLCache, estimate_size
+from .singleflight import SingleFlight
+from .concurrency import ConcurrencyLimiter
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .rate_limiter import TokenBucketLimiter, RateLimitError, QuotaExceededError
+from .metrics import Counter, Gauge, Histogram, MetricsRegistry, CallMetrics, metrics_registry, external_call_metrics
+from .hedging import HedgePolicy
+from .deadline import REQUEST_DEADLINE_SECONDS, deadline_after, time_left
 
-__all__ = []
+__all__ = [
+    "get_executor",
+    "run_blocking",
+    "shutdown_executor",
+    "TTLCache",
+    "estimate_size",
+    "SingleFlight",
+    "ConcurrencyLimiter",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "TokenBucketLimiter",
+    "RateLimitError",
+    "QuotaExceededError",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "CallMetrics",
+    "metrics_registry",
+    "external_call_metrics",
+    "HedgePolicy",
+    "REQUEST_DEADLINE_SECONDS",
+    "deadline_after",
+    "time_left"
+]
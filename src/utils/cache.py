@@ -0,0 +1,181 @@
+"""
+TTL + LRU 인메모리 캐시
+
+항목 수와 대략적인 메모리 사용량으로 크기가 제한되고, 항목마다 만료 시간(TTL)을 갖는
+스레드 안전 캐시를 제공합니다. 적중/미스/축출 통계를 함께 기록합니다.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+def estimate_size(value: Any) -> int:
+    """
+    값이 차지하는 메모리를 대략적으로 계산합니다 (리스트/튜플/딕셔너리는 재귀적으로 합산).
+
+    Args:
+        value (Any): 크기를 계산할 값
+
+    Returns:
+        int: 추정 바이트 수
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item) for item in value)
+    return size
+
+
+class TTLCache:
+    """
+    만료 시간과 LRU 축출을 지원하는 스레드 안전 캐시
+
+    - 항목 수가 max_entries를, 추정 메모리가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 축출
+    - 만료된 항목은 조회 시점에 제거
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: Optional[int] = None, ttl: float = 300.0,
+                 sizeof: Callable[[Any], int] = estimate_size, clock: Callable[[], float] = time.monotonic):
+        """
+        TTLCache 초기화
+
+        Args:
+            max_entries (int): 최대 항목 수
+            max_bytes (int, optional): 최대 추정 메모리 (바이트). None이면 제한 없음
+            ttl (float): 기본 만료 시간 (초). 0 이하이면 캐시를 사용하지 않음
+            sizeof (Callable): 값의 크기를 계산하는 함수
+            clock (Callable): 현재 시각을 반환하는 함수 (단조 증가)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        # key -> (만료 시각, 크기, 값)
+        self._data: "OrderedDict[Hashable, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부"""
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시된 값을 조회합니다.
+
+        Args:
+            key (Hashable): 캐시 키
+            default (Any): 값이 없거나 만료된 경우 반환할 값
+
+        Returns:
+            Any: 캐시된 값 또는 default
+        """
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            expires_at, size, value = entry
+            if expires_at <= self._clock():
+                self._remove(key, size)
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        값을 캐시에 저장합니다.
+
+        Args:
+            key (Hashable): 캐시 키
+            value (Any): 저장할 값
+            ttl (float, optional): 이 항목의 만료 시간 (초). None이면 기본값 사용
+        """
+        if not self.enabled:
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+        size = self._sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # 한 항목이 전체 한도를 넘으면 저장하지 않음
+            return
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            self._data[key] = (self._clock() + ttl, size, value)
+            self._bytes += size
+
+            while len(self._data) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """
+        항목을 삭제합니다.
+
+        Args:
+            key (Hashable): 캐시 키
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._remove(key, entry[1])
+
+    def clear(self) -> None:
+        """모든 항목을 삭제합니다 (통계는 유지)."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable, size: int) -> None:
+        """잠금을 잡은 상태에서 항목을 제거합니다."""
+        del self._data[key]
+        self._bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 적중/미스/축출/만료 횟수, 항목 수, 추정 메모리 사용량
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+            }
@@ -0,0 +1,217 @@
+"""
+서킷 브레이커
+
+외부 API(네이버 검색 등)가 장애 상태일 때 요청마다 타임아웃까지 기다리지 않도록,
+최근 호출의 오류율/지연 비율이 임계값을 넘으면 일정 시간 호출을 차단합니다.
+
+- closed: 정상. 최근 window_size개 호출의 결과를 기록
+- open: 차단. 호출하지 않고 바로 CircuitOpenError 발생. open_seconds 후 half_open으로 전환
+- half_open: 복구 확인. half_open_probes개의 시험 호출만 허용하고,
+  모두 성공하면 closed, 하나라도 실패(또는 느림)하면 다시 open
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple, Type
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출이 차단되었을 때 발생하는 오류"""
+    pass
+
+
+class CircuitBreaker:
+    """
+    호출 수 기반 슬라이딩 윈도우 서킷 브레이커
+
+    call() 컨텍스트 안의 코드(동기 또는 await 포함)를 하나의 호출로 보고
+    소요 시간과 예외 여부를 기록합니다. 여러 스레드/코루틴에서 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, name: str, failure_rate_threshold: float = 0.5, slow_call_seconds: float = 2.0,
+                 slow_call_rate_threshold: float = 0.8, window_size: int = 20, minimum_calls: int = 10,
+                 open_seconds: float = 30.0, half_open_probes: int = 3,
+                 failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        CircuitBreaker 초기화
+
+        Args:
+            name (str): 통계 표시용 이름
+            failure_rate_threshold (float): 이 비율 이상의 호출이 실패하면 open (0~1)
+            slow_call_seconds (float): 이 시간(초)보다 오래 걸린 호출은 느린 호출로 집계
+            slow_call_rate_threshold (float): 이 비율 이상의 호출이 느리면 open (0~1)
+            window_size (int): 비율 계산에 사용하는 최근 호출 수
+            minimum_calls (int): 비율을 판단하기 위한 최소 호출 수
+            open_seconds (float): open 상태를 유지하는 시간 (초)
+            half_open_probes (int): half_open 상태에서 허용하는 시험 호출 수
+            failure_exceptions (Tuple[Type[BaseException], ...]): 실패로 집계할 예외 타입
+                (그 외 예외는 호출 측 문제로 보고 성공/실패 어느 쪽에도 집계하지 않음)
+            clock (Callable[[], float]): 단조 증가 시계 (초, 테스트에서 교체 가능)
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = min(minimum_calls, window_size)
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(half_open_probes, 1)
+        self.failure_exceptions = failure_exceptions
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._window: Deque[Tuple[bool, bool]] = deque()
+        self._failures = 0
+        self._slow_calls = 0
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+
+        self.calls = 0
+        self.rejected = 0
+        self.times_opened = 0
+        self.last_opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open 유지 시간이 지났으면 half_open으로 표시)"""
+        with self._lock:
+            self._maybe_half_open(self._clock())
+            return self._state
+
+    def _maybe_half_open(self, now: float) -> None:
+        """open 유지 시간이 지났으면 half_open으로 전환합니다 (락을 잡은 상태에서 호출)."""
+        if self._state == OPEN and now - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probes_started = 0
+            self._probes_succeeded = 0
+            print(f"서킷 브레이커 [{self.name}] half-open: 복구 확인 호출 {self.half_open_probes}회 허용")
+
+    def _open(self, now: float, reason: str) -> None:
+        """open 상태로 전환합니다 (락을 잡은 상태에서 호출)."""
+        self._state = OPEN
+        self._opened_at = now
+        self._window.clear()
+        self._failures = 0
+        self._slow_calls = 0
+        self.times_opened += 1
+        self.last_opened_at = time.time()
+        print(f"⚠️ 서킷 브레이커 [{self.name}] open ({reason}): {self.open_seconds:.0f}초 동안 호출 차단")
+
+    def _acquire(self) -> bool:
+        """호출을 허용할지 결정합니다. 허용된 호출이 half_open 시험 호출이면 True를 반환합니다."""
+        with self._lock:
+            self._maybe_half_open(self._clock())
+            if self._state == CLOSED:
+                self.calls += 1
+                return False
+            if self._state == HALF_OPEN and self._probes_started < self.half_open_probes:
+                self._probes_started += 1
+                self.calls += 1
+                return True
+            self.rejected += 1
+        raise CircuitOpenError(f"서킷 브레이커 [{self.name}]가 열려 있어 호출이 차단되었습니다.")
+
+    def _record(self, probe: bool, failed: bool, elapsed: float) -> None:
+        """호출 결과를 기록하고 상태를 갱신합니다."""
+        slow = elapsed >= self.slow_call_seconds
+        now = self._clock()
+        with self._lock:
+            if probe:
+                if self._state != HALF_OPEN:
+                    return
+                if failed or slow:
+                    self._open(now, "복구 확인 호출 실패" if failed else "복구 확인 호출 지연")
+                    return
+                self._probes_succeeded += 1
+                if self._probes_succeeded >= self.half_open_probes:
+                    self._state = CLOSED
+                    print(f"✅ 서킷 브레이커 [{self.name}] closed: 복구 확인 완료")
+                return
+
+            if self._state != CLOSED:
+                # 차단 전에 시작된 호출의 결과는 판단에 쓰지 않음
+                return
+            self._window.append((failed, slow))
+            self._failures += failed
+            self._slow_calls += slow
+            if len(self._window) > self.window_size:
+                old_failed, old_slow = self._window.popleft()
+                self._failures -= old_failed
+                self._slow_calls -= old_slow
+
+            calls = len(self._window)
+            if calls < self.minimum_calls:
+                return
+            if self._failures / calls >= self.failure_rate_threshold:
+                self._open(now, f"오류율 {self._failures}/{calls}")
+            elif self._slow_calls / calls >= self.slow_call_rate_threshold:
+                self._open(now, f"지연 호출 {self._slow_calls}/{calls}")
+
+    @contextmanager
+    def call(self) -> Iterator[None]:
+        """
+        컨텍스트 안의 코드를 보호된 호출 하나로 실행합니다.
+
+        Yields:
+            None
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우 (컨텍스트 안의 코드는 실행되지 않음)
+        """
+        probe = self._acquire()
+        start = self._clock()
+        try:
+            yield
+        except self.failure_exceptions:
+            self._record(probe, True, self._clock() - start)
+            raise
+        except BaseException:
+            # 집계하지 않는 예외(설정 오류, 취소 등): half_open 시험 호출이었다면 다른 호출이 시험하도록 반환
+            if probe:
+                with self._lock:
+                    if self._state == HALF_OPEN:
+                        self._probes_started -= 1
+            raise
+        self._record(probe, False, self._clock() - start)
+
+    def reset(self) -> None:
+        """closed 상태로 초기화합니다 (기록도 삭제)."""
+        with self._lock:
+            self._state = CLOSED
+            self._window.clear()
+            self._failures = 0
+            self._slow_calls = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        서킷 브레이커 상태와 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 상태, 최근 호출의 오류율/지연 비율, 누적 호출/차단/open 횟수, 남은 차단 시간(초)
+        """
+        with self._lock:
+            now = self._clock()
+            self._maybe_half_open(now)
+            calls = len(self._window)
+            return {
+                "state": self._state,
+                "window_calls": calls,
+                "failure_rate": self._failures / calls if calls else 0.0,
+                "slow_call_rate": self._slow_calls / calls if calls else 0.0,
+                "calls": self.calls,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened,
+                "last_opened_at": self.last_opened_at,
+                "open_remaining_seconds": (
+                    max(self.open_seconds - (now - self._opened_at), 0.0) if self._state == OPEN else 0.0
+                ),
+            }
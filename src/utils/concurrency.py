@@ -0,0 +1,142 @@
+"""
+외부 의존성(upstream)별 동시 실행 수 제한
+
+네이버 API, Gemini, DB처럼 동시에 보낼 수 있는 요청 수가 정해진 자원에
+동시 실행 수 상한을 둡니다. 배치 요청 등으로 워크플로우가 많이 동시에 실행되어도
+각 자원에는 설정한 수만큼만 요청이 나가고, 나머지는 순서대로 기다립니다.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator
+
+
+class ConcurrencyLimiter:
+    """
+    동시 실행 수를 제한하는 클래스
+
+    - slot(): 스레드용 (동기 코드)
+    - aslot(): 코루틴용 (이벤트 루프마다 별도 세마포어, 기다리는 동안 루프를 막지 않음)
+
+    max_concurrency가 0 이하이면 제한하지 않고 통계만 기록합니다.
+    """
+
+    def __init__(self, name: str, max_concurrency: int):
+        """
+        ConcurrencyLimiter 초기화
+
+        Args:
+            name (str): 통계 표시용 이름
+            max_concurrency (int): 최대 동시 실행 수 (0 이하이면 제한 없음)
+        """
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self._thread_semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+        self._loop_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """제한 사용 여부"""
+        return self.max_concurrency > 0
+
+    def _loop_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프의 세마포어를 반환합니다 (없으면 생성)."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._loop_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop_semaphores[loop] = semaphore
+        return semaphore
+
+    def _record_wait(self, delta: int) -> None:
+        """대기 중인 호출 수를 갱신합니다."""
+        with self._lock:
+            self.waiting += delta
+
+    def _record_acquire(self, waited: float) -> None:
+        """슬롯 획득을 기록합니다."""
+        with self._lock:
+            self.in_use += 1
+            self.acquired += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def _record_release(self) -> None:
+        """슬롯 반환을 기록합니다."""
+        with self._lock:
+            self.in_use -= 1
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """
+        동기 코드에서 슬롯 하나를 점유합니다. 빈 슬롯이 없으면 스레드가 기다립니다.
+
+        Yields:
+            None
+        """
+        start = time.monotonic()
+        if self._thread_semaphore is not None:
+            self._record_wait(1)
+            try:
+                self._thread_semaphore.acquire()
+            finally:
+                self._record_wait(-1)
+        self._record_acquire(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self._record_release()
+            if self._thread_semaphore is not None:
+                self._thread_semaphore.release()
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """
+        코루틴에서 슬롯 하나를 점유합니다. 빈 슬롯이 없으면 이벤트 루프를 막지 않고 기다립니다.
+
+        Yields:
+            None
+        """
+        start = time.monotonic()
+        semaphore = self._loop_semaphore() if self.enabled else None
+        if semaphore is not None:
+            self._record_wait(1)
+            try:
+                await semaphore.acquire()
+            finally:
+                self._record_wait(-1)
+        self._record_acquire(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self._record_release()
+            if semaphore is not None:
+                semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        동시 실행 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 상한, 사용 중/대기 중인 수, 누적 획득 수, 평균/최대 대기 시간(ms)
+        """
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "in_use": self.in_use,
+                "waiting": self.waiting,
+                "acquired": self.acquired,
+                "avg_wait_ms": self.total_wait / self.acquired * 1000 if self.acquired else 0.0,
+                "max_wait_ms": self.max_wait * 1000,
+            }
@@ -0,0 +1,47 @@
+"""
+요청 마감 시각(deadline)
+
+워크플로우 실행 한 번에 쓸 수 있는 전체 시간을 정해 두고, 각 단계가 남은 시간을 확인하여
+작업을 줄이거나(검색어 하나만 검색, 빠른 모델 사용, 포맷팅된 목록으로 대체) 제때 끝낼 수 있게 합니다.
+
+마감 시각은 time.monotonic() 기준 값(초)으로 저장하므로 같은 프로세스 안에서만 의미가 있습니다.
+"""
+
+import os
+import time
+from typing import Optional
+
+# 워크플로우 실행 한 번의 기본 제한 시간 (초, 0 이하이면 제한 없음)
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "25"))
+
+
+def deadline_after(seconds: Optional[float] = None) -> Optional[float]:
+    """
+    지금부터 seconds초 뒤의 마감 시각을 반환합니다.
+
+    Args:
+        seconds (float, optional): 제한 시간 (초). None이면 REQUEST_DEADLINE_SECONDS
+
+    Returns:
+        Optional[float]: 마감 시각 (time.monotonic() 기준, 제한 시간이 0 이하이면 None)
+    """
+    if seconds is None:
+        seconds = REQUEST_DEADLINE_SECONDS
+    if seconds <= 0:
+        return None
+    return time.monotonic() + seconds
+
+
+def time_left(deadline_at: Optional[float]) -> Optional[float]:
+    """
+    마감 시각까지 남은 시간을 반환합니다.
+
+    Args:
+        deadline_at (float, optional): 마감 시각 (time.monotonic() 기준)
+
+    Returns:
+        Optional[float]: 남은 시간 (초, 이미 지났으면 0). 마감 시각이 없으면 None
+    """
+    if not deadline_at:
+        return None
+    return max(deadline_at - time.monotonic(), 0.0)
@@ -0,0 +1,75 @@
+"""
+블로킹 작업 실행기
+
+이 모듈은 이벤트 루프를 막지 않도록 동기(블로킹) 함수를 크기가 제한된
+스레드 풀에서 실행하는 기능을 제공합니다.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# 블로킹 작업에 사용할 최대 스레드 수 (환경변수로 조정 가능)
+DEFAULT_MAX_WORKERS = int(os.getenv("BLOCKING_EXECUTOR_MAX_WORKERS", "32"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    프로세스 전역 블로킹 작업용 스레드 풀을 반환합니다.
+
+    Returns:
+        ThreadPoolExecutor: 최대 스레드 수가 제한된 스레드 풀
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_MAX_WORKERS,
+                    thread_name_prefix="food-reco-blocking"
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    블로킹 함수를 스레드 풀에서 실행하고 결과를 기다립니다.
+
+    호출 시점의 contextvars 컨텍스트를 복사해 전달하므로
+    작업 스레드에서도 동일한 컨텍스트 변수를 사용할 수 있습니다.
+
+    Args:
+        func (Callable): 실행할 동기 함수
+        *args: 함수 위치 인자
+        **kwargs: 함수 키워드 인자
+
+    Returns:
+        T: 함수 실행 결과
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+
+def shutdown_executor(wait: bool = True) -> None:
+    """
+    블로킹 작업용 스레드 풀을 종료합니다.
+
+    Args:
+        wait (bool): 진행 중인 작업이 끝날 때까지 기다릴지 여부
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
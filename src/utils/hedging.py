@@ -0,0 +1,194 @@
+"""
+요청 헤징(hedging)
+
+첫 요청이 일정 시간(최근 지연 시간의 p90 등) 안에 응답하지 않으면 같은 요청을 한 번 더 보내고
+먼저 도착한 응답을 사용합니다. 느린 소수의 요청이 전체 응답 시간의 꼬리(p99)를 결정하는 경우,
+추가 요청 비용을 조금 내고 꼬리 지연을 크게 줄일 수 있습니다.
+
+추가 요청이 늘어나지 않도록 헤지 요청 수를 전체 요청 수의 max_hedge_ratio 이하로 제한합니다.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from .metrics import Histogram
+
+
+class HedgePolicy:
+    """
+    적응형 헤지 지연 시간과 헤지 비율 상한을 관리하는 클래스
+
+    - 헤지 지연 시간: 최근 sample_size개 요청 지연 시간의 quantile 분위 (min_delay~max_delay로 제한).
+      샘플이 min_samples개보다 적으면 initial_delay 사용
+    - 헤지 예산: 요청마다 max_hedge_ratio만큼 쌓이고 헤지 요청마다 1씩 사용 (최대 max_burst까지 저축)
+    """
+
+    def __init__(self, name: str, quantile: float = 0.9, initial_delay: float = 0.3, min_delay: float = 0.05,
+                 max_delay: float = 2.0, max_hedge_ratio: float = 0.1, sample_size: int = 200,
+                 min_samples: int = 20, max_burst: float = 5.0):
+        """
+        HedgePolicy 초기화
+
+        Args:
+            name (str): 통계 표시용 이름
+            quantile (float): 헤지 지연 시간으로 사용할 최근 지연 시간 분위 (0~1)
+            initial_delay (float): 샘플이 부족할 때의 헤지 지연 시간 (초)
+            min_delay (float): 헤지 지연 시간 하한 (초)
+            max_delay (float): 헤지 지연 시간 상한 (초)
+            max_hedge_ratio (float): 전체 요청 대비 헤지 요청 비율 상한 (0이면 헤징하지 않고 지연 시간만 기록)
+            sample_size (int): 지연 시간 분위 계산에 사용하는 최근 요청 수
+            min_samples (int): 분위 계산을 시작하는 최소 샘플 수
+            max_burst (float): 쌓아 둘 수 있는 최대 헤지 예산
+        """
+        self.name = name
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self.max_burst = max_burst
+
+        self._lock = threading.Lock()
+        self._samples: Deque[float] = deque(maxlen=sample_size)
+        self._delay = initial_delay
+        self._samples_since_update = 0
+        self._budget = 0.0
+
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.skipped_budget = 0
+        # 요청 하나(첫 요청 또는 헤지 요청)의 지연 시간
+        self.attempt_latency = Histogram(f"{name}_attempt")
+        # 헤징을 포함한 호출 전체의 지연 시간 (호출자가 체감하는 지연 시간)
+        self.call_latency = Histogram(f"{name}_call")
+
+    @property
+    def delay(self) -> float:
+        """현재 헤지 지연 시간 (초)"""
+        with self._lock:
+            return self._delay
+
+    def record_attempt(self, latency: float) -> None:
+        """
+        완료된 요청 하나의 지연 시간을 기록합니다 (헤지 지연 시간 갱신에 사용).
+
+        Args:
+            latency (float): 지연 시간 (초)
+        """
+        self.attempt_latency.observe(latency)
+        with self._lock:
+            self._samples.append(latency)
+            self._samples_since_update += 1
+            # 매 요청마다 정렬하지 않도록 샘플이 일정 수 쌓일 때마다 갱신
+            if len(self._samples) >= self.min_samples and self._samples_since_update >= 10:
+                ordered = sorted(self._samples)
+                value = ordered[min(int(len(ordered) * self.quantile), len(ordered) - 1)]
+                self._delay = min(max(value, self.min_delay), self.max_delay)
+                self._samples_since_update = 0
+
+    def _start_request(self) -> None:
+        """요청 하나를 시작할 때 헤지 예산을 쌓습니다."""
+        with self._lock:
+            self.requests += 1
+            self._budget = min(self._budget + self.max_hedge_ratio, self.max_burst)
+
+    def _try_hedge(self) -> bool:
+        """헤지 예산이 있으면 사용하고 True를 반환합니다."""
+        with self._lock:
+            if self._budget >= 1.0:
+                self._budget -= 1.0
+                self.hedges += 1
+                return True
+            self.skipped_budget += 1
+            return False
+
+    async def run(self, attempt: Callable[[], Awaitable[Any]],
+                  can_hedge: Optional[Callable[[], bool]] = None) -> Any:
+        """
+        attempt()를 실행하고, 헤지 지연 시간 안에 끝나지 않으면 한 번 더 실행하여 먼저 성공한 결과를 반환합니다.
+        남은 요청은 취소합니다.
+
+        Args:
+            attempt (Callable[[], Awaitable[Any]]): 요청 하나를 보내는 코루틴 함수 (여러 번 호출될 수 있음)
+            can_hedge (Callable[[], bool], optional): 헤지 직전에 호출하여 False이면 헤징하지 않음
+                (속도 제한 토큰이 없는 경우 등)
+
+        Returns:
+            Any: 먼저 성공한 요청의 결과
+
+        Raises:
+            Exception: 모든 요청이 실패한 경우 마지막으로 실패한 요청의 예외
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self._start_request()
+
+        async def timed_attempt() -> Any:
+            attempt_start = loop.time()
+            result = await attempt()
+            self.record_attempt(loop.time() - attempt_start)
+            return result
+
+        if self.max_hedge_ratio <= 0:
+            try:
+                return await timed_attempt()
+            finally:
+                self.call_latency.observe(loop.time() - start)
+
+        tasks = [asyncio.ensure_future(timed_attempt())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.delay)
+            if not done and self._try_hedge():
+                if can_hedge is None or can_hedge():
+                    tasks.append(asyncio.ensure_future(timed_attempt()))
+                else:
+                    # 헤지를 보내지 못했으면 예산 반환
+                    with self._lock:
+                        self.hedges -= 1
+                        self._budget += 1.0
+
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        self.call_latency.observe(loop.time() - start)
+                        return task.result()
+                    error = task.exception()
+            self.call_latency.observe(loop.time() - start)
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        헤징 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 현재 헤지 지연 시간(ms), 요청/헤지/헤지 승리 수, 헤지 비율, 지연 시간 분포
+        """
+        with self._lock:
+            requests, hedges, wins, skipped, delay = (
+                self.requests, self.hedges, self.hedge_wins, self.skipped_budget, self._delay
+            )
+        return {
+            "delay_ms": delay * 1000,
+            "requests": requests,
+            "hedges": hedges,
+            "hedge_wins": wins,
+            "hedge_ratio": hedges / requests if requests else 0.0,
+            "max_hedge_ratio": self.max_hedge_ratio,
+            "skipped_budget": skipped,
+            "attempt_latency": self.attempt_latency.stats(),
+            "call_latency": self.call_latency.stats(),
+        }
@@ -0,0 +1,489 @@
+"""
+지표(메트릭) 수집과 Prometheus 텍스트 형식 출력
+
+- Counter: 누적 횟수 (오류 수 등)
+- Gauge: 현재 값 (진행 중인 호출 수 등)
+- Histogram: 버킷 경계(le, 이하)마다 관측 수를 세는 누적 히스토그램. 값을 모두 저장하지 않으므로
+  관측 수와 관계없이 메모리가 일정하고, 분위수(p50/p90/p99)는 버킷 안에서 선형 보간으로 추정합니다.
+
+지표는 레이블 이름(labelnames)을 가질 수 있으며, labels(값...)으로 레이블 조합별 지표를 얻습니다.
+MetricsRegistry에 등록한 지표는 render()로 Prometheus 텍스트 형식(GET /metrics)으로 출력합니다.
+CallMetrics는 호출 하나의 지연 시간/오류/진행 중 수를 함께 기록하는 묶음입니다.
+
+핫 패스에서는 bind()/labels()로 얻은 지표를 미리 보관해 두고 사용하면 호출마다 레이블을 찾지 않습니다.
+"""
+
+import asyncio
+import bisect
+import functools
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 기본 지연 시간 버킷 (초): 5ms ~ 10s
+DEFAULT_LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5, 0.75,
+    1.0, 1.5, 2.0, 3.0, 5.0, 7.5, 10.0,
+)
+
+
+def _format_value(value: float) -> str:
+    """Prometheus 텍스트 형식의 숫자 표기"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    """레이블 값의 역슬래시/따옴표/줄바꿈을 이스케이프합니다."""
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    """레이블 목록을 {name="value",...} 형식으로 변환합니다."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels) + "}"
+
+
+class _Metric:
+    """
+    지표 공통 기능 (레이블 조합별 하위 지표 관리와 텍스트 출력)
+
+    레이블이 없는 지표는 자기 자신에 값을 기록하고,
+    레이블이 있는 지표는 labels()로 얻은 하위 지표(같은 클래스)에 기록합니다.
+    """
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str = "", labelnames: Sequence[str] = ()):
+        """
+        지표 초기화
+
+        Args:
+            name (str): 지표 이름
+            documentation (str): 설명 (# HELP)
+            labelnames (Sequence[str]): 레이블 이름 목록
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+        self._children_lock = threading.Lock()
+
+    def _new_child(self) -> "_Metric":
+        """레이블 조합 하나에 해당하는 하위 지표를 생성합니다."""
+        return type(self)(self.name)
+
+    def labels(self, *values: Any) -> Any:
+        """
+        레이블 값 조합에 해당하는 하위 지표를 반환합니다 (없으면 생성).
+
+        Args:
+            *values: labelnames 순서의 레이블 값
+
+        Returns:
+            Any: 하위 지표 (Counter/Gauge/Histogram)
+
+        Raises:
+            ValueError: 레이블 값 수가 labelnames와 다른 경우
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"지표 {self.name}의 레이블은 {self.labelnames}입니다: {values}")
+            with self._children_lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _series(self) -> List[Tuple[List[Tuple[str, str]], "_Metric"]]:
+        """(레이블 목록, 값을 가진 지표) 목록"""
+        if not self.labelnames:
+            return [([], self)]
+        with self._children_lock:
+            children = list(self._children.items())
+        return [(list(zip(self.labelnames, key)), child) for key, child in sorted(children)]
+
+    def _samples(self) -> Iterable[Tuple[str, List[Tuple[str, str]], float]]:
+        """(이름 접미사, 추가 레이블, 값) 목록 (하위 클래스에서 구현)"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """
+        Prometheus 텍스트 형식으로 출력합니다.
+
+        Returns:
+            List[str]: 출력 줄 목록
+        """
+        lines = []
+        if self.documentation:
+            lines.append(f"# HELP {self.name} {self.documentation}")
+        lines.append(f"# TYPE {self.name} {self.type_name}")
+        for labels, metric in self._series():
+            for suffix, extra_labels, value in metric._samples():
+                lines.append(f"{self.name}{suffix}{_format_labels(labels + extra_labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_Metric):
+    """누적 횟수 지표 (감소하지 않음)"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str = "", labelnames: Sequence[str] = ()):
+        """
+        Counter 초기화
+
+        Args:
+            name (str): 지표 이름 (관례상 _total로 끝남)
+            documentation (str): 설명
+            labelnames (Sequence[str]): 레이블 이름 목록
+        """
+        super().__init__(name, documentation, labelnames)
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        값을 증가시킵니다.
+
+        Args:
+            amount (float): 증가량 (0 이상)
+        """
+        with self._lock:
+            self.value += amount
+
+    def _samples(self) -> Iterable[Tuple[str, List[Tuple[str, str]], float]]:
+        return [("", [], self.value)]
+
+
+class Gauge(_Metric):
+    """현재 값 지표 (증가/감소 가능)"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str = "", labelnames: Sequence[str] = ()):
+        """
+        Gauge 초기화
+
+        Args:
+            name (str): 지표 이름
+            documentation (str): 설명
+            labelnames (Sequence[str]): 레이블 이름 목록
+        """
+        super().__init__(name, documentation, labelnames)
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """값을 증가시킵니다."""
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """값을 감소시킵니다."""
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        """값을 설정합니다."""
+        with self._lock:
+            self.value = value
+
+    def _samples(self) -> Iterable[Tuple[str, List[Tuple[str, str]], float]]:
+        return [("", [], self.value)]
+
+
+class Histogram(_Metric):
+    """
+    고정 버킷 히스토그램
+
+    observe()로 값을 기록하고 quantile()/stats()로 분포를 조회합니다.
+    여러 스레드에서 함께 사용할 수 있습니다.
+    """
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+                 documentation: str = "", labelnames: Sequence[str] = ()):
+        """
+        Histogram 초기화
+
+        Args:
+            name (str): 지표 이름
+            buckets (Sequence[float]): 버킷 상한 목록 (오름차순, 마지막 +Inf 버킷은 자동 추가)
+            documentation (str): 설명
+            labelnames (Sequence[str]): 레이블 이름 목록
+        """
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(buckets)) + (math.inf,)
+        self._counts = [0] * len(self.bounds)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, self.bounds[:-1])
+
+    def observe(self, value: float) -> None:
+        """
+        값 하나를 기록합니다.
+
+        Args:
+            value (float): 관측 값 (지연 시간은 초 단위)
+        """
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        분위수를 추정합니다 (해당 버킷 안에서 선형 보간, +Inf 버킷이면 관측 최댓값).
+
+        Args:
+            q (float): 분위 (0~1)
+
+        Returns:
+            Optional[float]: 추정 값 (관측이 없으면 None)
+        """
+        with self._lock:
+            if not self.count:
+                return None
+            rank = q * self.count
+            cumulative = 0
+            for index, count in enumerate(self._counts):
+                if count and cumulative + count >= rank:
+                    upper = self.bounds[index]
+                    if math.isinf(upper):
+                        return self.max
+                    lower = self.bounds[index - 1] if index else 0.0
+                    return lower + (upper - lower) * (rank - cumulative) / count
+                cumulative += count
+            return self.max
+
+    def _cumulative_buckets(self) -> Dict[str, int]:
+        """버킷별 누적 관측 수 (락을 잡은 상태에서 호출)"""
+        result, cumulative = {}, 0
+        for bound, count in zip(self.bounds, self._counts):
+            cumulative += count
+            result["+Inf" if math.isinf(bound) else f"{bound:g}"] = cumulative
+        return result
+
+    def buckets(self) -> Dict[str, int]:
+        """
+        버킷별 누적 관측 수를 반환합니다 (Prometheus의 le 버킷과 같은 형식).
+
+        Returns:
+            Dict[str, int]: {"0.005": n, ..., "+Inf": 전체 수}
+        """
+        with self._lock:
+            return self._cumulative_buckets()
+
+    def _samples(self) -> Iterable[Tuple[str, List[Tuple[str, str]], float]]:
+        # 버킷/합계/개수를 한 번에 읽어야 동시에 observe()가 호출되어도 +Inf 버킷과 _count가 일치함
+        with self._lock:
+            buckets, total, count = self._cumulative_buckets(), self.sum, self.count
+        samples = [("_bucket", [("le", le)], value) for le, value in buckets.items()]
+        samples.append(("_sum", [], total))
+        samples.append(("_count", [], count))
+        return samples
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        요약 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 관측 수, 평균/p50/p90/p99/최대 (ms)
+        """
+        def ms(value: Optional[float]) -> Optional[float]:
+            return value * 1000 if value is not None else None
+
+        with self._lock:
+            count, total, maximum = self.count, self.sum, self.max
+        return {
+            "count": count,
+            "avg_ms": total / count * 1000 if count else None,
+            "p50_ms": ms(self.quantile(0.5)),
+            "p90_ms": ms(self.quantile(0.9)),
+            "p99_ms": ms(self.quantile(0.99)),
+            "max_ms": maximum * 1000 if count else None,
+        }
+
+
+class MetricsRegistry:
+    """
+    출력할 지표를 모아 두는 레지스트리
+
+    counter()/gauge()/histogram()은 같은 이름의 지표가 이미 있으면 그 지표를 반환하므로
+    여러 모듈에서 같은 지표를 선언해도 하나로 합쳐집니다.
+    """
+
+    def __init__(self):
+        """MetricsRegistry 초기화"""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, factory: Callable[[], _Metric]) -> Any:
+        """같은 이름의 지표가 있으면 반환하고, 없으면 생성하여 등록합니다."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"지표 {name}이(가) 이미 다른 종류({metric.type_name})로 등록되어 있습니다.")
+            return metric
+
+    def counter(self, name: str, documentation: str = "", labelnames: Sequence[str] = ()) -> Counter:
+        """Counter를 생성(또는 조회)하여 등록합니다."""
+        return self._get_or_create(Counter, name, lambda: Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str = "", labelnames: Sequence[str] = ()) -> Gauge:
+        """Gauge를 생성(또는 조회)하여 등록합니다."""
+        return self._get_or_create(Gauge, name, lambda: Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str = "", labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        """Histogram을 생성(또는 조회)하여 등록합니다."""
+        return self._get_or_create(
+            Histogram, name, lambda: Histogram(name, buckets, documentation, labelnames)
+        )
+
+    def render(self) -> str:
+        """
+        등록된 모든 지표를 Prometheus 텍스트 형식으로 출력합니다.
+
+        Returns:
+            str: text/plain; version=0.0.4 본문
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class _CallTimer:
+    """호출 하나의 시작 시각을 보관하는 컨텍스트 매니저 (호출마다 생성)"""
+
+    __slots__ = ("_call", "_start")
+
+    def __init__(self, call: "BoundCallMetrics"):
+        self._call = call
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._call.in_progress.inc()
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self._call.duration.observe(time.perf_counter() - self._start)
+        self._call.in_progress.dec()
+        # 취소(CancelledError) 등 Exception이 아닌 예외는 오류로 집계하지 않음
+        if exc_type is not None and issubclass(exc_type, Exception):
+            self._call.errors.inc()
+        return False
+
+
+class BoundCallMetrics:
+    """레이블 값 하나에 묶인 CallMetrics (지연 시간/오류/진행 중 수 하위 지표)"""
+
+    def __init__(self, duration: Histogram, errors: Counter, in_progress: Gauge):
+        """
+        BoundCallMetrics 초기화
+
+        Args:
+            duration (Histogram): 지연 시간 히스토그램
+            errors (Counter): 오류 수
+            in_progress (Gauge): 진행 중인 호출 수
+        """
+        self.duration = duration
+        self.errors = errors
+        self.in_progress = in_progress
+
+    def track(self) -> _CallTimer:
+        """
+        컨텍스트 안의 코드를 호출 하나로 기록합니다 (await를 포함해도 됨).
+
+        Returns:
+            _CallTimer: with 문에 사용할 컨텍스트 매니저
+        """
+        return _CallTimer(self)
+
+
+class CallMetrics:
+    """
+    호출 지연 시간 히스토그램(<prefix>_duration_seconds), 오류 수(<prefix>_errors_total),
+    진행 중인 호출 수(<prefix>_in_progress)를 함께 기록하는 묶음
+    """
+
+    def __init__(self, registry: MetricsRegistry, prefix: str, label: str, subject: str):
+        """
+        CallMetrics 초기화
+
+        Args:
+            registry (MetricsRegistry): 지표를 등록할 레지스트리
+            prefix (str): 지표 이름 접두사
+            label (str): 호출 대상을 구분하는 레이블 이름 (node, service 등)
+            subject (str): 설명에 사용할 호출 대상 이름
+        """
+        self.duration = registry.histogram(f"{prefix}_duration_seconds", f"{subject} 소요 시간 (초)", [label])
+        self.errors = registry.counter(f"{prefix}_errors_total", f"{subject} 오류 수", [label])
+        self.in_progress = registry.gauge(f"{prefix}_in_progress", f"진행 중인 {subject} 수", [label])
+
+    def bind(self, value: str) -> BoundCallMetrics:
+        """
+        레이블 값 하나에 묶인 지표를 반환합니다 (핫 패스에서는 미리 만들어 보관).
+
+        Args:
+            value (str): 레이블 값
+
+        Returns:
+            BoundCallMetrics: 묶인 지표
+        """
+        return BoundCallMetrics(self.duration.labels(value), self.errors.labels(value), self.in_progress.labels(value))
+
+    def instrument(self, value: str) -> Callable[[Callable], Callable]:
+        """
+        함수(동기 또는 코루틴 함수) 호출을 기록하는 데코레이터를 반환합니다.
+
+        Args:
+            value (str): 레이블 값
+
+        Returns:
+            Callable: 데코레이터
+        """
+        bound = self.bind(value)
+
+        def decorator(func: Callable) -> Callable:
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    with bound.track():
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with bound.track():
+                    return func(*args, **kwargs)
+            return wrapper
+
+        return decorator
+
+
+# 프로세스 전역 지표 레지스트리 (GET /metrics로 출력)
+metrics_registry = MetricsRegistry()
+
+# 외부 API 호출(네이버 검색, Gemini) 지표 (service 레이블)
+external_call_metrics = CallMetrics(metrics_registry, "food_reco_external_call", "service", "외부 API 호출")
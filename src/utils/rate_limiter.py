@@ -0,0 +1,278 @@
+"""
+토큰 버킷 요청 속도 제한과 일일 쿼터
+
+네이버 검색 API처럼 초당 호출 수와 일일 호출 수가 정해진 API에 요청을 고르게 나눠 보냅니다.
+
+- 토큰 버킷(GCRA 방식): 초당 rate개, 최대 burst개까지 연속 호출 허용.
+  호출마다 "보낼 수 있는 시각"을 예약하므로 대기 시간을 미리 알 수 있고,
+  대기 시간이 호출의 기한(timeout)을 넘으면 기다리지 않고 바로 거절합니다.
+- 대기열: 동시에 기다리는 호출 수가 max_queue를 넘으면 바로 거절합니다.
+- 일일 쿼터: 하루 사용량이 daily_quota * degraded_ratio 이상이면 degraded 상태가 되어
+  호출 측이 요청 수를 줄일 수 있고, daily_quota에 도달하면 거절합니다 (timezone 기준 자정에 초기화).
+- 429 응답 시 penalize()로 일정 시간 모든 호출을 뒤로 미뤄 연속된 429를 막습니다.
+- 대기 중인 호출 수와 대기 시간은 지표 레지스트리(GET /metrics)에 limiter 레이블로 기록합니다.
+
+한 프로세스 안에서 스레드와 코루틴이 함께 사용할 수 있습니다 (프로세스 간에는 공유되지 않음).
+"""
+
+import asyncio
+import datetime
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from zoneinfo import ZoneInfo
+
+from .metrics import metrics_registry
+
+
+class RateLimitError(Exception):
+    """대기열이 가득 찼거나 기한 안에 호출할 수 없어 거절되었을 때 발생하는 오류"""
+    pass
+
+
+class QuotaExceededError(RateLimitError):
+    """일일 쿼터를 모두 사용하여 거절되었을 때 발생하는 오류"""
+    pass
+
+
+class TokenBucketLimiter:
+    """
+    예약 방식 토큰 버킷 + 일일 쿼터 제한기
+
+    - acquire(): 스레드용 (호출 가능 시각까지 sleep)
+    - aacquire(): 코루틴용 (asyncio.sleep, 취소되면 예약을 되돌림)
+    """
+
+    def __init__(self, name: str, rate: float, burst: int = 1, max_queue: int = 100,
+                 default_timeout: Optional[float] = None, daily_quota: int = 0,
+                 degraded_ratio: float = 0.9, timezone: str = "Asia/Seoul", penalty_seconds: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        """
+        TokenBucketLimiter 초기화
+
+        Args:
+            name (str): 통계 표시용 이름
+            rate (float): 초당 허용 호출 수 (0 이하이면 속도 제한 없음)
+            burst (int): 쉬고 있다가 연속으로 보낼 수 있는 최대 호출 수
+            max_queue (int): 동시에 기다릴 수 있는 최대 호출 수
+            default_timeout (float, optional): 호출별 기한을 주지 않았을 때의 최대 대기 시간 (초, None이면 무제한)
+            daily_quota (int): 하루 최대 호출 수 (0 이하이면 제한 없음)
+            degraded_ratio (float): 하루 사용량이 쿼터의 이 비율 이상이면 degraded 상태
+            timezone (str): 일일 쿼터 초기화 기준 시간대
+            penalty_seconds (float): 429 응답 시 모든 호출을 미룰 시간 (초)
+            clock (Callable[[], float]): 단조 증가 시계 (초, 테스트에서 교체 가능)
+            sleep (Callable[[float], None]): acquire()가 기다릴 때 사용할 함수 (테스트에서 교체 가능)
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.max_queue = max_queue
+        self.default_timeout = default_timeout
+        self.daily_quota = daily_quota
+        self.degraded_ratio = degraded_ratio
+        self.timezone = ZoneInfo(timezone)
+        self.penalty_seconds = penalty_seconds
+        self._clock = clock
+        self._sleep = sleep
+
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        # 다음 호출의 이론적 도착 시각 (GCRA의 TAT)
+        self._tat = 0.0
+        self._quota_day: Optional[datetime.date] = None
+        self.used_today = 0
+
+        self.waiting = 0
+        self.acquired = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.rejected_quota = 0
+        self.penalties = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+        self._waiting_gauge = metrics_registry.gauge(
+            "food_reco_rate_limiter_waiting", "속도 제한으로 대기 중인 호출 수", ["limiter"]
+        ).labels(name)
+        self._wait_seconds = metrics_registry.histogram(
+            "food_reco_rate_limiter_wait_seconds", "속도 제한으로 기다린 시간 (초)", ["limiter"]
+        ).labels(name)
+
+    def _today(self) -> datetime.date:
+        """쿼터 기준 시간대의 오늘 날짜"""
+        return datetime.datetime.now(self.timezone).date()
+
+    def _refresh_quota_day(self) -> None:
+        """날짜가 바뀌었으면 하루 사용량을 초기화합니다 (락을 잡은 상태에서 호출)."""
+        today = self._today()
+        if self._quota_day != today:
+            self._quota_day = today
+            self.used_today = 0
+
+    @property
+    def degraded(self) -> bool:
+        """일일 쿼터가 얼마 남지 않아 호출 수를 줄여야 하는 상태인지 여부"""
+        if self.daily_quota <= 0:
+            return False
+        with self._lock:
+            self._refresh_quota_day()
+            return self.used_today >= self.daily_quota * self.degraded_ratio
+
+    def _reserve(self, timeout: Optional[float]) -> float:
+        """
+        호출 하나를 예약하고 호출 가능 시각까지의 대기 시간(초)을 반환합니다.
+
+        Raises:
+            QuotaExceededError: 일일 쿼터를 모두 사용한 경우
+            RateLimitError: 대기열이 가득 찼거나 대기 시간이 기한을 넘는 경우
+        """
+        if timeout is None:
+            timeout = self.default_timeout
+        with self._lock:
+            self._refresh_quota_day()
+            if 0 < self.daily_quota <= self.used_today:
+                self.rejected_quota += 1
+                raise QuotaExceededError(f"[{self.name}] 일일 쿼터({self.daily_quota}회)를 모두 사용했습니다.")
+
+            now = self._clock()
+            # 버스트 허용량만큼 TAT보다 앞서 보낼 수 있음
+            send_at = max(now, self._tat - (self.burst - 1) * self._interval)
+            delay = send_at - now
+            if delay > 0:
+                if self.waiting >= self.max_queue:
+                    self.rejected_queue_full += 1
+                    raise RateLimitError(f"[{self.name}] 대기열이 가득 찼습니다 ({self.max_queue}개).")
+                if timeout is not None and delay > timeout:
+                    self.rejected_timeout += 1
+                    raise RateLimitError(
+                        f"[{self.name}] 대기 시간 {delay:.2f}초가 기한 {max(timeout, 0.0):.2f}초를 넘습니다."
+                    )
+                self.waiting += 1
+                self._waiting_gauge.set(self.waiting)
+
+            self._tat = max(self._tat, send_at) + self._interval
+            self.used_today += 1
+            self.acquired += 1
+            self.total_wait += delay
+            self.max_wait = max(self.max_wait, delay)
+            return delay
+
+    def _finish_wait(self) -> None:
+        """대기를 마친 호출을 대기열에서 뺍니다."""
+        with self._lock:
+            self.waiting -= 1
+            self._waiting_gauge.set(self.waiting)
+
+    def _cancel(self) -> None:
+        """대기 중 취소된 호출의 예약을 되돌립니다 (토큰과 하루 사용량 반환)."""
+        with self._lock:
+            self.waiting -= 1
+            self._waiting_gauge.set(self.waiting)
+            self._tat -= self._interval
+            self.used_today = max(self.used_today - 1, 0)
+            self.acquired -= 1
+
+    def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        호출 가능 시각까지 스레드를 재웁니다.
+
+        Args:
+            timeout (float, optional): 이 호출의 최대 대기 시간 (초, None이면 default_timeout)
+
+        Returns:
+            float: 기다린 시간 (초)
+
+        Raises:
+            QuotaExceededError: 일일 쿼터를 모두 사용한 경우
+            RateLimitError: 대기열이 가득 찼거나 대기 시간이 기한을 넘는 경우
+        """
+        delay = self._reserve(timeout)
+        if delay > 0:
+            try:
+                self._sleep(delay)
+            finally:
+                self._finish_wait()
+        self._wait_seconds.observe(delay)
+        return delay
+
+    async def aacquire(self, timeout: Optional[float] = None) -> float:
+        """
+        acquire의 비동기 버전 (기다리는 동안 이벤트 루프를 막지 않음)
+
+        Args:
+            timeout (float, optional): 이 호출의 최대 대기 시간 (초, None이면 default_timeout)
+
+        Returns:
+            float: 기다린 시간 (초)
+
+        Raises:
+            QuotaExceededError: 일일 쿼터를 모두 사용한 경우
+            RateLimitError: 대기열이 가득 찼거나 대기 시간이 기한을 넘는 경우
+        """
+        delay = self._reserve(timeout)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._cancel()
+                raise
+            self._finish_wait()
+        self._wait_seconds.observe(delay)
+        return delay
+
+    def try_acquire(self) -> bool:
+        """
+        기다리지 않고 바로 호출할 수 있을 때만 토큰을 사용합니다 (헤지 요청처럼 생략해도 되는 호출용).
+
+        Returns:
+            bool: 토큰을 사용했으면 True, 기다려야 하거나 쿼터가 없으면 False
+        """
+        try:
+            self._reserve(0.0)
+        except RateLimitError:
+            return False
+        return True
+
+    def penalize(self, seconds: Optional[float] = None) -> None:
+        """
+        API가 속도 제한(HTTP 429)을 알렸을 때 이후 호출을 일정 시간 미룹니다.
+
+        Args:
+            seconds (float, optional): 미룰 시간 (초, None이면 penalty_seconds)
+        """
+        seconds = self.penalty_seconds if seconds is None else seconds
+        with self._lock:
+            # 버스트 허용량을 고려해 다음 호출이 정확히 seconds 뒤에 나가도록 설정
+            self._tat = max(self._tat, self._clock() + seconds + (self.burst - 1) * self._interval)
+            self.penalties += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        속도 제한 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 설정, 대기열 길이, 누적 허용/거절 수, 평균/최대 대기 시간(ms), 일일 쿼터 사용량
+        """
+        degraded = self.degraded
+        with self._lock:
+            self._refresh_quota_day()
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "queue_depth": self.waiting,
+                "max_queue": self.max_queue,
+                "acquired": self.acquired,
+                "rejected_queue_full": self.rejected_queue_full,
+                "rejected_timeout": self.rejected_timeout,
+                "rejected_quota": self.rejected_quota,
+                "penalties": self.penalties,
+                "avg_wait_ms": self.total_wait / self.acquired * 1000 if self.acquired else 0.0,
+                "max_wait_ms": self.max_wait * 1000,
+                "quota": {
+                    "day": self._quota_day.isoformat() if self._quota_day else None,
+                    "used": self.used_today,
+                    "limit": self.daily_quota,
+                    "remaining": max(self.daily_quota - self.used_today, 0) if self.daily_quota > 0 else None,
+                    "degraded": degraded,
+                },
+            }
@@ -0,0 +1,153 @@
+"""
+Single-flight 요청 병합
+
+같은 키로 동시에 들어온 호출 중 첫 번째 호출만 실제 작업을 수행하고,
+나머지 호출은 그 결과(또는 예외)를 함께 받도록 합니다.
+결과를 저장하지 않으므로 캐시와 달리 오래된 값이 반환될 걱정이 없습니다.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """동기 호출 하나의 진행 상태"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _AsyncCall:
+    """비동기 호출 하나의 진행 상태"""
+
+    def __init__(self, task: "asyncio.Task"):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    동일 키의 동시 호출을 하나로 합치는 클래스
+
+    - do(): 스레드 간 병합 (동기 함수)
+    - ado(): 같은 이벤트 루프의 태스크 간 병합 (코루틴 함수)
+
+    비동기 호출에서 대기자 한 명이 취소되어도 공유 작업은 계속되며,
+    모든 대기자가 취소된 경우에만 공유 작업도 취소됩니다.
+    """
+
+    def __init__(self, name: str = ""):
+        """
+        SingleFlight 초기화
+
+        Args:
+            name (str): 통계 표시용 이름
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._async_calls: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _AsyncCall] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        같은 키로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 func를 실행합니다.
+
+        Args:
+            key (Hashable): 호출을 식별하는 키
+            func (Callable): 실행할 동기 함수
+            *args: 함수 위치 인자
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            Any: 함수 실행 결과 (동시 호출자 모두 같은 객체를 받음)
+
+        Raises:
+            Exception: 함수에서 발생한 예외 (동시 호출자 모두에게 전파)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.leaders += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    async def ado(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """
+        do의 비동기 버전
+
+        Args:
+            key (Hashable): 호출을 식별하는 키
+            func (Callable): 실행할 코루틴 함수
+            *args: 함수 위치 인자
+            **kwargs: 함수 키워드 인자
+
+        Returns:
+            Any: 코루틴 실행 결과 (동시 호출자 모두 같은 객체를 받음)
+
+        Raises:
+            Exception: 코루틴에서 발생한 예외 (동시 호출자 모두에게 전파)
+        """
+        flight_key = (asyncio.get_running_loop(), key)
+        call = self._async_calls.get(flight_key)
+        if call is None:
+            call = _AsyncCall(asyncio.ensure_future(func(*args, **kwargs)))
+            self._async_calls[flight_key] = call
+            call.task.add_done_callback(lambda _task: self._forget(flight_key, call))
+            self.leaders += 1
+        else:
+            self.shared += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # 기다리는 호출자가 모두 취소되었으므로 공유 작업도 취소
+                call.task.cancel()
+
+    def _forget(self, flight_key: Tuple[asyncio.AbstractEventLoop, Hashable], call: _AsyncCall) -> None:
+        """완료된 비동기 호출을 진행 목록에서 제거합니다."""
+        if self._async_calls.get(flight_key) is call:
+            del self._async_calls[flight_key]
+        if not call.task.cancelled():
+            # 대기자가 없어도 "exception was never retrieved" 경고가 나지 않도록 예외를 소비
+            call.task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        병합 통계를 반환합니다.
+
+        Returns:
+            Dict[str, Any]: 실제 실행 횟수(leaders), 병합된 호출 수(shared), 진행 중인 호출 수
+        """
+        return {
+            "leaders": self.leaders,
+            "shared": self.shared,
+            "in_flight": len(self._calls) + len(self._async_calls),
+        }
@@ -4,6 +4,7 @@ Streamlit 웹 인터페이스
 사용자 친화적인 웹 UI를 제공하는 Streamlit 애플리케이션입니다.
 """
 
+import os
 import streamlit as st
 import requests
 import json
@@ -22,6 +23,10 @@ st.set_page_config(
 # API 서버 URL (로컬 개발용)
 API_BASE_URL = "http://localhost:8000"
 
+# 서버의 실행 마감 시각(REQUEST_DEADLINE_SECONDS)보다 조금 더 기다림 (서버는 마감 시각까지 부분 결과라도 응답)
+_REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "25"))
+RECOMMEND_TIMEOUT = _REQUEST_DEADLINE_SECONDS + 5 if _REQUEST_DEADLINE_SECONDS > 0 else None
+
 def check_api_health() -> bool:
     """API 서버 상태 확인"""
     try:
@@ -36,7 +41,7 @@ def get_recommendations(user_input: Dict[str, Any]) -> Dict[str, Any]:
         response = requests.post(
             f"{API_BASE_URL}/recommend",
             json=user_input,
-            timeout=30
+            timeout=RECOMMEND_TIMEOUT
         )
         response.raise_for_status()
         return response.json()
@@ -0,0 +1,38 @@
+"""
+테스트 공통 설정
+
+src 패키지를 import하면 데이터베이스 설정을 읽으므로, 실제 DB에 연결하지 않는 단위 테스트에서도
+import가 실패하지 않도록 기본 접속 정보를 채워 둡니다 (이미 설정된 값은 그대로 사용).
+시간에 따라 동작이 바뀌는 클래스는 clock 픽스처(FakeClock)를 주입해 결정적으로 테스트합니다.
+"""
+
+import os
+
+import pytest
+
+for _key, _value in {
+    "DB_USER": "test",
+    "DB_PASSWORD": "test",
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_DATABASE": "test",
+}.items():
+    os.environ.setdefault(_key, _value)
+
+
+class FakeClock:
+    """직접 시간을 움직이는 단조 시계 (time.monotonic 대역)"""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
@@ -0,0 +1,196 @@
+"""
+CircuitBreaker 상태 전환 테스트 (가짜 시계 사용)
+"""
+
+from contextlib import ExitStack
+
+import pytest
+
+from src.utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+
+
+class UpstreamError(Exception):
+    """실패로 집계되는 오류"""
+
+
+def make_breaker(clock, **overrides):
+    options = dict(
+        failure_rate_threshold=0.5, slow_call_seconds=2.0, slow_call_rate_threshold=0.8,
+        window_size=4, minimum_calls=4, open_seconds=30.0, half_open_probes=2,
+        failure_exceptions=(UpstreamError,), clock=clock,
+    )
+    options.update(overrides)
+    return CircuitBreaker("test", **options)
+
+
+def succeed(breaker, clock=None, elapsed=0.0):
+    with breaker.call():
+        if clock is not None:
+            clock.advance(elapsed)
+
+
+def fail(breaker):
+    with pytest.raises(UpstreamError):
+        with breaker.call():
+            raise UpstreamError("boom")
+
+
+def trip(breaker):
+    """실패율 임계값을 넘겨 open으로 만듭니다."""
+    for _ in range(breaker.minimum_calls):
+        fail(breaker)
+    assert breaker.state == OPEN
+
+
+class TestClosed:
+    def test_stays_closed_below_minimum_calls(self, clock):
+        breaker = make_breaker(clock)
+        for _ in range(3):
+            fail(breaker)
+        assert breaker.state == CLOSED
+
+    def test_opens_when_failure_rate_reaches_threshold(self, clock):
+        breaker = make_breaker(clock)
+        succeed(breaker)
+        succeed(breaker)
+        fail(breaker)
+        assert breaker.state == CLOSED
+        fail(breaker)
+        assert breaker.state == OPEN
+        assert breaker.stats()["times_opened"] == 1
+
+    def test_window_slides_over_old_failures(self, clock):
+        breaker = make_breaker(clock, failure_rate_threshold=0.75)
+        fail(breaker)
+        fail(breaker)
+        succeed(breaker)
+        succeed(breaker)
+        # 가장 오래된 실패가 창에서 빠지므로 실패율은 계속 1/4 이하
+        for _ in range(4):
+            succeed(breaker)
+        assert breaker.stats()["failure_rate"] == 0.0
+        assert breaker.state == CLOSED
+
+    def test_opens_on_slow_call_rate(self, clock):
+        breaker = make_breaker(clock, slow_call_rate_threshold=0.75)
+        for _ in range(3):
+            succeed(breaker, clock, elapsed=2.5)
+        succeed(breaker, clock, elapsed=0.1)
+        assert breaker.state == OPEN
+
+    def test_unlisted_exceptions_are_not_counted(self, clock):
+        breaker = make_breaker(clock)
+        for _ in range(5):
+            with pytest.raises(ValueError):
+                with breaker.call():
+                    raise ValueError("호출 측 오류")
+        assert breaker.state == CLOSED
+        assert breaker.stats()["window_calls"] == 0
+
+
+class TestOpen:
+    def test_rejects_without_running_body(self, clock):
+        breaker = make_breaker(clock)
+        trip(breaker)
+        ran = []
+        with pytest.raises(CircuitOpenError):
+            with breaker.call():
+                ran.append(1)
+        assert ran == []
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_opens_after_open_seconds(self, clock):
+        breaker = make_breaker(clock)
+        trip(breaker)
+        clock.advance(29.9)
+        assert breaker.state == OPEN
+        assert breaker.stats()["open_remaining_seconds"] == pytest.approx(0.1)
+        clock.advance(0.1)
+        assert breaker.state == HALF_OPEN
+
+    def test_results_of_calls_started_before_open_are_ignored(self, clock):
+        breaker = make_breaker(clock)
+        with ExitStack() as stack:
+            # 차단 전에 시작된 호출
+            stack.enter_context(breaker.call())
+            trip(breaker)
+        assert breaker.stats()["window_calls"] == 0
+        assert breaker.state == OPEN
+
+
+class TestHalfOpen:
+    def test_closes_after_all_probes_succeed(self, clock):
+        breaker = make_breaker(clock)
+        trip(breaker)
+        clock.advance(30)
+        succeed(breaker)
+        assert breaker.state == HALF_OPEN
+        succeed(breaker)
+        assert breaker.state == CLOSED
+        # closed로 돌아오면 새 창에서 다시 집계
+        assert breaker.stats()["window_calls"] == 0
+
+    def test_limits_concurrent_probes(self, clock):
+        breaker = make_breaker(clock)
+        trip(breaker)
+        clock.advance(30)
+        with ExitStack() as stack:
+            stack.enter_context(breaker.call())
+            stack.enter_context(breaker.call())
+            with pytest.raises(CircuitOpenError):
+                with breaker.call():
+                    pass
+        assert breaker.state == CLOSED
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = make_breaker(clock)
+        trip(breaker)
+        clock.advance(30)
+        succeed(breaker)
+        fail(breaker)
+        assert breaker.state == OPEN
+        assert breaker.stats()["times_opened"] == 2
+        # open 유지 시간은 다시 처음부터
+        clock.advance(29)
+        assert breaker.state == OPEN
+        clock.advance(1)
+        assert breaker.state == HALF_OPEN
+
+    def test_slow_probe_reopens(self, clock):
+        breaker = make_breaker(clock)
+        trip(breaker)
+        clock.advance(30)
+        succeed(breaker, clock, elapsed=2.0)
+        assert breaker.state == OPEN
+
+    def test_uncounted_exception_returns_probe_slot(self, clock):
+        breaker = make_breaker(clock, half_open_probes=1)
+        trip(breaker)
+        clock.advance(30)
+        with pytest.raises(ValueError):
+            with breaker.call():
+                raise ValueError("호출 측 오류")
+        # 시험 호출 자리가 반환되어 다음 호출이 시험할 수 있음
+        assert breaker.state == HALF_OPEN
+        succeed(breaker)
+        assert breaker.state == CLOSED
+
+    def test_late_probe_result_after_reopen_is_ignored(self, clock):
+        breaker = make_breaker(clock)
+        trip(breaker)
+        clock.advance(30)
+        with ExitStack() as stack:
+            stack.enter_context(breaker.call())
+            fail(breaker)
+            assert breaker.state == OPEN
+        # 먼저 시작된 시험 호출이 성공해도 다시 열린 서킷은 닫히지 않음
+        assert breaker.state == OPEN
+
+
+def test_reset_closes_and_clears_window(clock):
+    breaker = make_breaker(clock)
+    trip(breaker)
+    breaker.reset()
+    assert breaker.state == CLOSED
+    succeed(breaker)
+    assert breaker.stats()["window_calls"] == 1
@@ -0,0 +1,46 @@
+"""
+요청 마감 시각 시작 시점 테스트 (CLI에서 입력을 받는 시간은 제한 시간에 포함하지 않음)
+"""
+
+import time
+
+from src.core import nodes
+from src.core.runner import _with_deadline
+from src.utils.deadline import REQUEST_DEADLINE_SECONDS
+
+USER_INPUT = {
+    "age": 30,
+    "cuisine_preference": "한식",
+    "weather": "맑음",
+    "location": "강남역",
+    "companion_type": "친구",
+    "ambiance": "조용한",
+    "special_requirements": "",
+}
+
+
+def test_runner_sets_deadline_when_input_is_given():
+    state = _with_deadline(dict(USER_INPUT))
+
+    assert state["deadline_at"] > time.monotonic()
+    assert state["degraded"] == []
+
+
+def test_runner_leaves_deadline_to_analysis_without_input():
+    assert "deadline_at" not in _with_deadline({})
+
+
+def test_analysis_starts_deadline_after_input():
+    before = time.monotonic()
+
+    state = nodes.analyze_user_preferences(dict(USER_INPUT))
+
+    assert state["deadline_at"] >= before + REQUEST_DEADLINE_SECONDS
+    assert state["degraded"] == []
+
+
+def test_analysis_keeps_existing_deadline():
+    state = nodes.analyze_user_preferences({**USER_INPUT, "deadline_at": 123.0, "degraded": ["x"]})
+
+    assert state["deadline_at"] == 123.0
+    assert state["degraded"] == ["x"]
@@ -0,0 +1,186 @@
+"""
+HedgePolicy 요청 헤징 테스트
+
+요청은 asyncio.Event로 끝나는 시점을 직접 정하므로, 실제로 기다리는 시간은 헤지 지연 시간(수십 ms)뿐입니다.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.hedging import HedgePolicy
+
+DELAY = 0.02
+
+
+def make_policy(**overrides):
+    options = dict(initial_delay=DELAY, min_delay=0.001, max_delay=1.0, max_hedge_ratio=1.0, max_burst=1.0)
+    options.update(overrides)
+    return HedgePolicy("test", **options)
+
+
+class Attempts:
+    """
+    attempt() 호출을 기록하는 대역
+
+    behaviors[i]가 요청 i의 동작: "hang"(취소될 때까지 대기), "ok", "fail"
+    """
+
+    def __init__(self, *behaviors):
+        self.behaviors = list(behaviors)
+        self.started_at = []
+        self.cancelled = []
+
+    async def __call__(self):
+        index = len(self.started_at)
+        self.started_at.append(asyncio.get_running_loop().time())
+        behavior = self.behaviors[index]
+        if behavior == "hang":
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(index)
+                raise
+        if behavior == "fail":
+            raise RuntimeError(f"attempt {index} failed")
+        return f"result {index}"
+
+
+class TestHedgeTiming:
+    async def test_fast_attempt_is_not_hedged(self):
+        policy = make_policy()
+        attempts = Attempts("ok")
+
+        assert await policy.run(attempts) == "result 0"
+
+        assert len(attempts.started_at) == 1
+        assert policy.stats()["hedges"] == 0
+
+    async def test_hedge_fires_only_after_delay(self):
+        policy = make_policy()
+        attempts = Attempts("hang", "ok")
+        start = asyncio.get_running_loop().time()
+
+        assert await policy.run(attempts) == "result 1"
+
+        assert len(attempts.started_at) == 2
+        assert attempts.started_at[0] - start < DELAY
+        assert attempts.started_at[1] - start >= DELAY
+        stats = policy.stats()
+        assert stats["hedges"] == 1
+        assert stats["hedge_wins"] == 1
+
+    def test_delay_adapts_to_recent_quantile(self):
+        policy = make_policy(quantile=0.9, min_samples=20, min_delay=0.05, max_delay=1.0)
+        assert policy.delay == DELAY
+
+        # 0.01 ~ 0.2초, p90 = 0.19초
+        for value in range(1, 21):
+            policy.record_attempt(value / 100)
+        assert policy.delay == pytest.approx(0.19)
+
+    def test_delay_is_clamped(self):
+        policy = make_policy(min_samples=10, min_delay=0.05, max_delay=0.1)
+        for _ in range(10):
+            policy.record_attempt(0.001)
+        assert policy.delay == 0.05
+        for _ in range(200):
+            policy.record_attempt(5.0)
+        assert policy.delay == 0.1
+
+
+class TestHedgeBudget:
+    async def test_budget_caps_hedges(self):
+        # 요청마다 0.25씩 쌓이므로 느린 요청 8개 중 헤지는 2번
+        policy = make_policy(max_hedge_ratio=0.25, initial_delay=0.001)
+        hedged = 0
+        for _ in range(8):
+            attempts = Attempts("hang", "ok", "ok")
+            task = asyncio.ensure_future(policy.run(attempts))
+            await asyncio.sleep(0.01)
+            if len(attempts.started_at) == 1:
+                # 헤지하지 못한 요청은 첫 요청이 끝날 때까지 기다림
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+            else:
+                hedged += 1
+                await task
+
+        assert hedged == 2
+        stats = policy.stats()
+        assert stats["hedges"] == 2
+        assert stats["requests"] == 8
+        assert stats["hedge_ratio"] == 0.25
+        assert stats["skipped_budget"] == 6
+
+    async def test_budget_is_refunded_when_hedge_not_allowed(self):
+        policy = make_policy()
+        attempts = Attempts("hang")
+        task = asyncio.ensure_future(policy.run(attempts, can_hedge=lambda: False))
+        await asyncio.sleep(DELAY * 2)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert len(attempts.started_at) == 1
+        assert policy.stats()["hedges"] == 0
+        # 반환된 예산으로 다음 요청은 헤지 가능
+        assert await policy.run(Attempts("hang", "ok")) == "result 1"
+        assert policy.stats()["hedges"] == 1
+
+    async def test_zero_ratio_never_hedges(self):
+        policy = make_policy(max_hedge_ratio=0)
+        attempts = Attempts("hang")
+        task = asyncio.ensure_future(policy.run(attempts))
+        await asyncio.sleep(DELAY * 2)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert len(attempts.started_at) == 1
+        assert policy.stats()["hedges"] == 0
+
+
+class TestHedgeCancellation:
+    async def test_losing_attempt_is_cancelled(self):
+        policy = make_policy()
+        attempts = Attempts("hang", "ok")
+
+        await policy.run(attempts)
+        await asyncio.sleep(0)
+
+        assert attempts.cancelled == [0]
+
+    async def test_cancelling_call_cancels_all_attempts(self):
+        policy = make_policy()
+        attempts = Attempts("hang", "hang")
+        task = asyncio.ensure_future(policy.run(attempts))
+        await asyncio.sleep(DELAY * 2)
+        assert len(attempts.started_at) == 2
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert sorted(attempts.cancelled) == [0, 1]
+
+    async def test_failed_hedge_falls_back_to_first_attempt(self):
+        policy = make_policy()
+        release = asyncio.Event()
+
+        calls = []
+
+        async def attempt():
+            calls.append(1)
+            if len(calls) == 1:
+                await release.wait()
+                return "slow"
+            release.set()
+            raise RuntimeError("hedge failed")
+
+        assert await policy.run(attempt) == "slow"
+        assert policy.stats()["hedge_wins"] == 0
+
+    async def test_all_attempts_failing_raises(self):
+        policy = make_policy()
+        with pytest.raises(RuntimeError):
+            await policy.run(Attempts("fail"))
+        assert policy.stats()["call_latency"]["count"] == 1
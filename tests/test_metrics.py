@@ -0,0 +1,88 @@
+"""
+지표(Counter/Gauge/Histogram)와 Prometheus 텍스트 출력 테스트
+"""
+
+import re
+import threading
+
+import pytest
+
+from src.utils.metrics import CallMetrics, Histogram, MetricsRegistry
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency_seconds", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.buckets() == {"0.1": 2, "1": 3, "+Inf": 4}
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+
+
+def test_render_uses_prometheus_text_format():
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "요청 수", ["route"]).labels('/a"b').inc(2)
+    registry.gauge("in_progress", "진행 중").set(3)
+    registry.histogram("latency_seconds", "지연 시간", buckets=(0.5,)).observe(0.25)
+
+    assert registry.render().splitlines() == [
+        "# HELP in_progress 진행 중",
+        "# TYPE in_progress gauge",
+        "in_progress 3",
+        "# HELP latency_seconds 지연 시간",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.5"} 1',
+        'latency_seconds_bucket{le="+Inf"} 1',
+        "latency_seconds_sum 0.25",
+        "latency_seconds_count 1",
+        "# HELP requests_total 요청 수",
+        "# TYPE requests_total counter",
+        'requests_total{route="/a\\"b"} 2',
+    ]
+
+
+class InterleavingLock:
+    """처음 락을 놓는 순간 hook을 실행하여 다른 스레드의 observe()가 끼어든 상황을 재현하는 락"""
+
+    def __init__(self, hook):
+        self._lock = threading.Lock()
+        self._hook = hook
+
+    def __enter__(self):
+        self._lock.acquire()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._lock.release()
+        hook, self._hook = self._hook, None
+        if hook is not None:
+            hook()
+
+
+def test_inf_bucket_matches_count_when_observe_interleaves_render():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", buckets=(0.1,))
+    histogram.observe(0.05)
+    histogram._lock = InterleavingLock(lambda: histogram.observe(0.05))
+
+    text = registry.render()
+
+    inf = int(re.search(r'latency_seconds_bucket\{le="\+Inf"\} (\d+)', text).group(1))
+    count = int(re.search(r"latency_seconds_count (\d+)", text).group(1))
+    assert inf == count
+
+
+def test_call_metrics_track_errors_and_in_progress():
+    registry = MetricsRegistry()
+    calls = CallMetrics(registry, "test_call", "service", "테스트 호출")
+    bound = calls.bind("naver")
+
+    with bound.track():
+        assert bound.in_progress.value == 1
+    with pytest.raises(ValueError):
+        with bound.track():
+            raise ValueError("boom")
+
+    assert bound.in_progress.value == 0
+    assert bound.duration.count == 2
+    assert bound.errors.value == 1
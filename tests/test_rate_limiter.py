@@ -0,0 +1,270 @@
+"""
+TokenBucketLimiter 속도 제한/대기열/일일 쿼터 테스트
+
+가짜 시계로 예약 시각을 결정적으로 계산하고, 스레드 경로는 가짜 sleep으로 실제로 기다리지 않습니다.
+"""
+
+import asyncio
+import datetime
+import threading
+
+import pytest
+
+from src.utils.metrics import metrics_registry
+from src.utils.rate_limiter import QuotaExceededError, RateLimitError, TokenBucketLimiter
+
+
+class FakeSleep:
+    """기다린 시간을 기록하고 시계를 그만큼 움직이는 sleep 대역"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = []
+
+    def __call__(self, seconds):
+        self.calls.append(seconds)
+        self.clock.advance(seconds)
+
+
+def make_limiter(clock, sleep=None, **overrides):
+    options = dict(rate=10, burst=1, max_queue=100, clock=clock, sleep=sleep or FakeSleep(clock))
+    options.update(overrides)
+    return TokenBucketLimiter("test", **options)
+
+
+def reservation(limiter):
+    """예약 상태 (TAT, 하루 사용량, 허용 수, 대기 수)"""
+    return limiter._tat, limiter.used_today, limiter.acquired, limiter.waiting
+
+
+class TestThreadAcquire:
+    def test_burst_then_steady_rate(self, clock):
+        sleep = FakeSleep(clock)
+        limiter = make_limiter(clock, sleep, rate=10, burst=3)
+
+        delays = [limiter.acquire() for _ in range(6)]
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert delays[3:] == pytest.approx([0.1, 0.1, 0.1])
+        assert sleep.calls == pytest.approx([0.1, 0.1, 0.1])
+        assert limiter.waiting == 0
+
+    def test_idle_time_refills_burst(self, clock):
+        limiter = make_limiter(clock, rate=10, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        clock.advance(0.2)
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() == pytest.approx(0.1)
+
+    def test_rate_zero_never_waits(self, clock):
+        limiter = make_limiter(clock, rate=0)
+        assert [limiter.acquire() for _ in range(100)] == [0.0] * 100
+
+    def test_wait_longer_than_timeout_is_rejected_without_reserving(self, clock):
+        limiter = make_limiter(clock, rate=1)
+        limiter.acquire()
+        before = reservation(limiter)
+
+        with pytest.raises(RateLimitError):
+            limiter.acquire(timeout=0.5)
+
+        assert reservation(limiter) == before
+        assert limiter.rejected_timeout == 1
+        # 기한이 충분하면 기다린 뒤 허용
+        assert limiter.acquire(timeout=1.0) == pytest.approx(1.0)
+
+    def test_default_timeout_applies_when_no_deadline_given(self, clock):
+        limiter = make_limiter(clock, rate=1, default_timeout=0.5)
+        limiter.acquire()
+        with pytest.raises(RateLimitError):
+            limiter.acquire()
+        # 호출별 기한이 기본값보다 우선
+        assert limiter.acquire(timeout=2.0) == pytest.approx(1.0)
+
+    def test_queue_bound_rejects_extra_waiters(self, clock):
+        entered, release = threading.Event(), threading.Event()
+
+        def blocking_sleep(seconds):
+            entered.set()
+            release.wait(2)
+
+        limiter = make_limiter(clock, blocking_sleep, rate=1, max_queue=1)
+        limiter.acquire()
+        waiter = threading.Thread(target=limiter.acquire)
+        waiter.start()
+        assert entered.wait(2)
+
+        assert limiter.stats()["queue_depth"] == 1
+        with pytest.raises(RateLimitError):
+            limiter.acquire()
+        assert limiter.rejected_queue_full == 1
+        # 기다려야 하는 시점이므로 헤지용 try_acquire도 거절
+        assert limiter.try_acquire() is False
+
+        release.set()
+        waiter.join(2)
+        assert limiter.waiting == 0
+
+    def test_try_acquire_does_not_reserve_when_it_would_wait(self, clock):
+        limiter = make_limiter(clock, rate=1)
+        assert limiter.try_acquire() is True
+        before = reservation(limiter)
+        assert limiter.try_acquire() is False
+        assert reservation(limiter) == before
+        clock.advance(1)
+        assert limiter.try_acquire() is True
+
+    def test_penalize_delays_next_call(self, clock):
+        limiter = make_limiter(clock, rate=10, burst=3)
+        limiter.penalize(2.0)
+        assert limiter.acquire() == pytest.approx(2.0)
+        assert limiter.penalties == 1
+
+    def test_stats_report_wait_times(self, clock):
+        limiter = make_limiter(clock, rate=2)
+        limiter.acquire()
+        limiter.acquire()
+        stats = limiter.stats()
+        assert stats["acquired"] == 2
+        assert stats["avg_wait_ms"] == pytest.approx(250.0)
+        assert stats["max_wait_ms"] == pytest.approx(500.0)
+
+
+class TestDailyQuota:
+    def test_rejects_when_quota_used(self, clock):
+        limiter = make_limiter(clock, rate=0, daily_quota=3)
+        for _ in range(3):
+            limiter.acquire()
+        with pytest.raises(QuotaExceededError):
+            limiter.acquire()
+        assert limiter.try_acquire() is False
+        assert limiter.rejected_quota == 2
+        assert limiter.stats()["quota"]["remaining"] == 0
+
+    def test_degraded_near_quota(self, clock):
+        limiter = make_limiter(clock, rate=0, daily_quota=10, degraded_ratio=0.8)
+        for _ in range(7):
+            limiter.acquire()
+        assert limiter.degraded is False
+        limiter.acquire()
+        assert limiter.degraded is True
+        assert limiter.stats()["quota"]["degraded"] is True
+
+    def test_no_quota_is_never_degraded(self, clock):
+        limiter = make_limiter(clock, rate=0, daily_quota=0)
+        for _ in range(50):
+            limiter.acquire()
+        assert limiter.degraded is False
+        assert limiter.stats()["quota"]["remaining"] is None
+
+    def test_usage_resets_on_new_day(self, clock, monkeypatch):
+        limiter = make_limiter(clock, rate=0, daily_quota=2, degraded_ratio=0.5)
+        today = datetime.date(2025, 1, 1)
+        monkeypatch.setattr(limiter, "_today", lambda: today)
+        limiter.acquire()
+        limiter.acquire()
+        assert limiter.degraded is True
+
+        today = datetime.date(2025, 1, 2)
+        assert limiter.degraded is False
+        assert limiter.acquire() == 0.0
+        assert limiter.stats()["quota"] == {
+            "day": "2025-01-02", "used": 1, "limit": 2, "remaining": 1, "degraded": True,
+        }
+
+
+class TestAsyncAcquire:
+    async def test_waits_for_reserved_time(self, clock):
+        limiter = make_limiter(clock, rate=100)
+        assert await limiter.aacquire() == 0.0
+        assert await limiter.aacquire() == pytest.approx(0.01)
+        assert limiter.waiting == 0
+
+    async def test_rejects_past_deadline(self, clock):
+        limiter = make_limiter(clock, rate=1)
+        await limiter.aacquire()
+        with pytest.raises(RateLimitError):
+            await limiter.aacquire(timeout=0.1)
+        assert limiter.rejected_timeout == 1
+
+    async def test_cancel_rolls_back_reservation(self, clock):
+        limiter = make_limiter(clock, rate=1, daily_quota=100)
+        await limiter.aacquire()
+        before = reservation(limiter)
+
+        task = asyncio.create_task(limiter.aacquire())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # TAT, 하루 사용량, 허용 수, 대기 수 모두 예약 전으로 복구
+        assert reservation(limiter) == before
+        # 취소된 예약 자리를 다음 호출이 그대로 사용
+        assert limiter.try_acquire() is False
+        clock.advance(1)
+        assert limiter.try_acquire() is True
+
+    async def test_cancelled_waiter_frees_queue_slot(self, clock):
+        limiter = make_limiter(clock, rate=1, max_queue=1)
+        await limiter.aacquire()
+        task = asyncio.create_task(limiter.aacquire())
+        await asyncio.sleep(0)
+
+        with pytest.raises(RateLimitError):
+            await limiter.aacquire()
+        assert limiter.rejected_queue_full == 1
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert limiter.waiting == 0
+        other = asyncio.create_task(limiter.aacquire())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+        other.cancel()
+        await asyncio.gather(other, return_exceptions=True)
+
+    async def test_cancel_near_quota_returns_quota(self, clock):
+        limiter = make_limiter(clock, rate=1, daily_quota=2, degraded_ratio=1.0)
+        await limiter.aacquire()
+        task = asyncio.create_task(limiter.aacquire())
+        await asyncio.sleep(0)
+        assert limiter.degraded is True
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert limiter.degraded is False
+        assert limiter.used_today == 1
+        clock.advance(1)
+        assert await limiter.aacquire() == 0.0
+        with pytest.raises(QuotaExceededError):
+            await limiter.aacquire()
+
+
+class TestMetrics:
+    async def test_queue_depth_and_wait_time_are_exported(self, clock):
+        limiter = TokenBucketLimiter("metrics_test", rate=1, clock=clock, sleep=FakeSleep(clock))
+        waiting = metrics_registry.gauge("food_reco_rate_limiter_waiting").labels("metrics_test")
+        wait_seconds = metrics_registry.histogram("food_reco_rate_limiter_wait_seconds").labels("metrics_test")
+
+        await limiter.aacquire()
+        task = asyncio.create_task(limiter.aacquire())
+        await asyncio.sleep(0)
+        assert waiting.value == 1
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert waiting.value == 0
+
+        clock.advance(0.5)
+        assert limiter.acquire() == pytest.approx(0.5)
+
+        # 취소된 대기는 기록하지 않고, 허용된 호출의 대기 시간만 기록
+        assert wait_seconds.count == 2
+        assert wait_seconds.sum == pytest.approx(0.5)
+        rendered = metrics_registry.render()
+        assert 'food_reco_rate_limiter_waiting{limiter="metrics_test"} 0' in rendered
+        assert 'food_reco_rate_limiter_wait_seconds_count{limiter="metrics_test"} 2' in rendered
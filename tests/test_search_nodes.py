@@ -0,0 +1,73 @@
+"""
+검색 노드 테스트 (네이버 서킷 브레이커가 열려 있을 때 네이버 호출 없이 로컬 색인으로 검색)
+"""
+
+import pytest
+
+from src.core import nodes
+from src.utils.circuit_breaker import CircuitBreaker
+
+LOCAL_RESULTS = [{"title": "로컬 식당", "description": "", "link": ""}]
+
+
+@pytest.fixture
+def breaker(clock, monkeypatch):
+    breaker = CircuitBreaker("naver", minimum_calls=1, window_size=1, open_seconds=30.0, clock=clock)
+    monkeypatch.setattr(nodes, "naver_breaker", breaker)
+    return breaker
+
+
+@pytest.fixture
+def naver_calls(monkeypatch):
+    calls = []
+
+    def search_naver(**kwargs):
+        calls.append(kwargs)
+        return [{"title": "네이버 식당", "description": "", "link": ""}]
+
+    async def asearch_naver(**kwargs):
+        return search_naver(**kwargs)
+
+    monkeypatch.setattr(nodes, "search_restaurants_naver", search_naver)
+    monkeypatch.setattr(nodes, "asearch_restaurants_naver", asearch_naver)
+    monkeypatch.setattr(nodes, "search_restaurants_local", lambda user_profile: list(LOCAL_RESULTS))
+    monkeypatch.setattr(nodes, "_save_search_results_to_db", lambda state, results, source="naver": None)
+    return calls
+
+
+def trip(breaker):
+    with pytest.raises(RuntimeError):
+        with breaker.call():
+            raise RuntimeError("boom")
+
+
+def make_state():
+    return {"user_profile": {"location": "강남역"}}
+
+
+def test_open_breaker_skips_naver(breaker, naver_calls):
+    trip(breaker)
+
+    state = nodes.search_restaurants(make_state())
+
+    assert naver_calls == []
+    assert state["search_results"] == LOCAL_RESULTS
+
+
+async def test_open_breaker_skips_naver_async(breaker, naver_calls):
+    trip(breaker)
+
+    state = await nodes.asearch_restaurants(make_state())
+
+    assert naver_calls == []
+    assert state["search_results"] == LOCAL_RESULTS
+
+
+def test_half_open_breaker_calls_naver(breaker, naver_calls, clock):
+    trip(breaker)
+    clock.advance(30.0)
+
+    state = nodes.search_restaurants(make_state())
+
+    assert len(naver_calls) == 1
+    assert state["search_results"][0]["title"] == "네이버 식당"
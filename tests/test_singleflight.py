@@ -0,0 +1,205 @@
+"""
+SingleFlight 요청 병합 테스트
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.utils.singleflight import SingleFlight
+
+
+def _wait_until(predicate, timeout=2.0):
+    """조건이 참이 될 때까지 기다립니다 (스레드가 대기 상태에 들어갔는지 확인용)."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("조건이 시간 안에 충족되지 않았습니다.")
+        time.sleep(0.001)
+
+
+def _run_threads(count, target):
+    """target을 count개 스레드로 실행하고 (결과 목록, 예외 목록)을 반환합니다."""
+    results, errors = [], []
+
+    def worker():
+        try:
+            results.append(target())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+class TestSingleFlightThreads:
+    def test_concurrent_calls_run_once(self):
+        flight = SingleFlight("test")
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            release.wait(2)
+            return {"value": 42}
+
+        threads, results, errors = _run_threads(5, lambda: flight.do("key", work))
+        _wait_until(lambda: flight.shared == 4)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        assert calls == [1]
+        assert errors == []
+        assert len(results) == 5
+        # 모든 호출자가 같은 객체를 받음
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == {"leaders": 1, "shared": 4, "in_flight": 0}
+
+    def test_exception_reaches_every_waiter(self):
+        flight = SingleFlight("test")
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            release.wait(2)
+            raise ValueError("boom")
+
+        threads, results, errors = _run_threads(4, lambda: flight.do("key", work))
+        _wait_until(lambda: flight.shared == 3)
+        release.set()
+        for thread in threads:
+            thread.join(2)
+
+        assert calls == [1]
+        assert results == []
+        assert len(errors) == 4
+        assert all(isinstance(error, ValueError) for error in errors)
+        assert flight.stats()["in_flight"] == 0
+
+    def test_different_keys_are_not_merged(self):
+        flight = SingleFlight("test")
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+        assert flight.stats() == {"leaders": 2, "shared": 0, "in_flight": 0}
+
+    def test_next_call_after_completion_runs_again(self):
+        flight = SingleFlight("test")
+        calls = []
+
+        def work():
+            calls.append(1)
+            return len(calls)
+
+        assert flight.do("key", work) == 1
+        assert flight.do("key", work) == 2
+
+
+class TestSingleFlightAsync:
+    async def test_concurrent_calls_run_once(self):
+        flight = SingleFlight("test")
+        release = asyncio.Event()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await release.wait()
+            return {"value": 42}
+
+        tasks = [asyncio.create_task(flight.ado("key", work)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == [1]
+        assert all(result is results[0] for result in results)
+        assert flight.stats() == {"leaders": 1, "shared": 4, "in_flight": 0}
+
+    async def test_exception_reaches_every_waiter(self):
+        flight = SingleFlight("test")
+        release = asyncio.Event()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.create_task(flight.ado("key", work)) for _ in range(4)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert calls == [1]
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.stats()["in_flight"] == 0
+
+    async def test_cancelled_leader_does_not_strand_followers(self):
+        flight = SingleFlight("test")
+        release = asyncio.Event()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await release.wait()
+            return "done"
+
+        leader = asyncio.create_task(flight.ado("key", work))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.ado("key", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        # 남은 대기자가 있으므로 공유 작업은 계속되어 결과를 받음
+        release.set()
+        assert await asyncio.wait_for(asyncio.gather(*followers), 1) == ["done", "done"]
+        assert calls == [1]
+        assert flight.stats()["in_flight"] == 0
+
+    async def test_all_waiters_cancelled_cancels_shared_work(self):
+        flight = SingleFlight("test")
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def work():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        tasks = [asyncio.create_task(flight.ado("key", work)) for _ in range(3)]
+        await started.wait()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        await asyncio.sleep(0)
+        assert flight.stats()["in_flight"] == 0
+
+    async def test_new_call_after_cancelled_flight_starts_fresh(self):
+        flight = SingleFlight("test")
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        async def fast():
+            return "fresh"
+
+        task = asyncio.create_task(flight.ado("key", slow))
+        await asyncio.sleep(0)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert await flight.ado("key", fast) == "fresh"
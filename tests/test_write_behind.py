@@ -0,0 +1,235 @@
+"""
+Write-behind 저장기와 세션 ID 할당기 테스트
+
+실제 DB 대신 트랜잭션 단위로 커밋/롤백을 기록하는 가짜 StorageService와
+시퀀스를 흉내 내는 가짜 세션을 사용합니다.
+"""
+
+import threading
+
+import pytest
+
+from src.database import write_behind
+from src.database.write_behind import SessionIdAllocator, WriteBehindWriter
+
+
+class FakeStorage:
+    """with 블록 하나를 트랜잭션 하나로 보고, 예외 없이 끝난 호출만 committed에 남기는 StorageService 대역"""
+
+    committed = []
+    transactions = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        self.pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        with FakeStorage.lock:
+            FakeStorage.transactions += 1
+            if exc_type is None:
+                FakeStorage.committed.extend(self.pending)
+
+    def _record(self, operation, *args):
+        if "bad" in args:
+            raise RuntimeError("저장 실패")
+        self.pending.append((operation, args))
+
+    def save_user_session(self, user_data):
+        self._record("save_user_session", user_data)
+
+    def save_search_results(self, session_id, results, source, cuisine_preference):
+        self._record("save_search_results", session_id, source)
+
+    def save_recommendation(self, session_id, text, ai_model):
+        self._record("save_recommendation", session_id, text)
+
+
+class FakeSequenceSession:
+    """generate_series + nextval 쿼리에 시퀀스의 다음 값들을 돌려주는 세션 대역"""
+
+    def __init__(self, sequence):
+        self.sequence = sequence
+        self.block = []
+        self.committed = False
+        self.closed = False
+
+    def execute(self, statement, params):
+        self.block = self.sequence.take(params)
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.block
+
+    def commit(self):
+        self.committed = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSequence:
+    """DB 시퀀스 대역"""
+
+    def __init__(self):
+        self.value = 0
+        self.calls = []
+        self.sessions = []
+        self.lock = threading.Lock()
+
+    def take(self, params):
+        """count개의 다음 값을 반환합니다 (실제 시퀀스처럼 순서를 보장하지 않도록 역순)."""
+        with self.lock:
+            self.calls.append(params)
+            block = list(range(self.value + 1, self.value + params["count"] + 1))
+            self.value += params["count"]
+        return block[::-1]
+
+    def session(self):
+        session = FakeSequenceSession(self)
+        self.sessions.append(session)
+        return session
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    FakeStorage.committed = []
+    FakeStorage.transactions = 0
+    monkeypatch.setattr(write_behind, "StorageService", FakeStorage)
+    return FakeStorage
+
+
+@pytest.fixture
+def sequence(monkeypatch):
+    fake = FakeSequence()
+    monkeypatch.setattr(write_behind, "get_session", fake.session)
+    return fake
+
+
+class TestSessionIdAllocator:
+    def test_ids_are_ascending_across_blocks(self, sequence):
+        allocator = SessionIdAllocator(block_size=3, sequence="food_reco.test_seq")
+
+        ids = [allocator.next_id() for _ in range(7)]
+
+        assert ids == [1, 2, 3, 4, 5, 6, 7]
+        # 7개를 쓰려면 블록 3개 (3 + 3 + 1)
+        assert sequence.calls == [{"sequence": "food_reco.test_seq", "count": 3}] * 3
+        assert all(session.committed and session.closed for session in sequence.sessions)
+
+    def test_block_is_fetched_only_when_exhausted(self, sequence):
+        allocator = SessionIdAllocator(block_size=5)
+
+        allocator.next_id()
+        assert len(sequence.calls) == 1
+        for _ in range(4):
+            allocator.next_id()
+        assert len(sequence.calls) == 1
+        allocator.next_id()
+        assert len(sequence.calls) == 2
+
+    def test_concurrent_allocation_has_no_duplicates(self, sequence):
+        allocator = SessionIdAllocator(block_size=7)
+        ids = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                session_id = allocator.next_id()
+                with lock:
+                    ids.append(session_id)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(ids) == 400
+        assert len(set(ids)) == 400
+        assert sorted(ids) == list(range(1, 401))
+
+
+class FixedIdAllocator:
+    """1부터 차례로 ID를 주는 할당기 대역"""
+
+    def __init__(self):
+        self.value = 0
+
+    def next_id(self):
+        self.value += 1
+        return self.value
+
+
+class TestWriteBehindWriter:
+    def test_shutdown_flushes_pending_items(self, storage):
+        # 배치가 차거나 flush_interval이 지나기 전에 종료해도 남은 항목을 모두 저장해야 함
+        writer = WriteBehindWriter(batch_size=100, flush_interval=60, id_allocator=FixedIdAllocator())
+        writer.start()
+
+        session_id = writer.save_user_session({"age": 30})
+        writer.save_search_results(session_id, [{"title": "a"}], "naver", "한식")
+        writer.save_recommendation(session_id, "추천", "gemini")
+        writer.shutdown(timeout=5)
+
+        assert session_id == 1
+        assert storage.committed == [
+            ("save_user_session", ({"age": 30, "id": 1},)),
+            ("save_search_results", (1, "naver")),
+            ("save_recommendation", (1, "추천")),
+        ]
+        assert writer.stats() == {
+            "queue_size": 0, "enqueued": 3, "written": 3, "dropped": 0, "failed": 0, "batches": 1,
+        }
+
+    def test_items_are_written_in_batches(self, storage):
+        writer = WriteBehindWriter(batch_size=2, flush_interval=60, id_allocator=FixedIdAllocator())
+        # 시작 전에 큐를 채워 배치 경계를 결정적으로 만듦
+        for index in range(5):
+            writer.save_recommendation(index, f"추천 {index}", "gemini")
+        writer.start()
+        writer.shutdown(timeout=5)
+
+        assert [args[0] for _, args in storage.committed] == [0, 1, 2, 3, 4]
+        assert writer.stats()["written"] == 5
+        assert writer.stats()["batches"] == 3
+
+    def test_full_queue_drops_after_enqueue_timeout(self, storage):
+        writer = WriteBehindWriter(max_queue_size=2, enqueue_timeout=0.01, id_allocator=FixedIdAllocator())
+
+        assert writer.submit("save_recommendation", 1, "a", "gemini") is True
+        assert writer.submit("save_recommendation", 2, "b", "gemini") is True
+        assert writer.submit("save_recommendation", 3, "c", "gemini") is False
+        assert writer.stats()["dropped"] == 1
+        assert writer.stats()["queue_size"] == 2
+
+        writer.start()
+        writer.shutdown(timeout=5)
+        assert [args[0] for _, args in storage.committed] == [1, 2]
+        assert writer.stats()["written"] == 2
+
+    def test_failed_batch_is_retried_item_by_item(self, storage):
+        writer = WriteBehindWriter(batch_size=10, flush_interval=60, id_allocator=FixedIdAllocator())
+        writer.save_recommendation(1, "ok", "gemini")
+        writer.save_recommendation(2, "bad", "gemini")
+        writer.save_recommendation(3, "ok", "gemini")
+        writer.start()
+        writer.shutdown(timeout=5)
+
+        # 배치 트랜잭션 1번 + 항목별 재시도 3번, 실패한 항목만 버려짐
+        assert storage.transactions == 4
+        assert [args[0] for _, args in storage.committed] == [1, 3]
+        stats = writer.stats()
+        assert stats["written"] == 2
+        assert stats["failed"] == 1
+        assert stats["batches"] == 0
+
+    def test_shutdown_without_start_is_noop(self, storage):
+        writer = WriteBehindWriter(id_allocator=FixedIdAllocator())
+        writer.shutdown()
+        assert storage.committed == []